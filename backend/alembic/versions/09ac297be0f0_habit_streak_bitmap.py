@@ -0,0 +1,93 @@
+"""Habit completion bitmap and streak counters
+
+Revision ID: 09ac297be0f0
+Revises: f3b8c27d5e90
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from services.habit_streaks import record_completion
+
+
+# revision identifiers, used by Alembic.
+revision: str = '09ac297be0f0'
+down_revision: Union[str, None] = 'f3b8c27d5e90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if 'completion_bitmap' in {column['name'] for column in sa.inspect(bind).get_columns('habits')}:
+        # Created with the columns by the previous revision, nothing to replay
+        return
+    with op.batch_alter_table('habits') as batch_op:
+        batch_op.add_column(sa.Column('longest_streak', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('last_completed_on', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('bitmap_start', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('completion_bitmap', sa.LargeBinary(), nullable=True))
+
+    # Replay the tracking history into each habit's bitmap, in id batches
+    tracking = sa.table(
+        'habit_tracking', sa.column('id', sa.Integer), sa.column('habit_id', sa.Integer), sa.column('completed', sa.DateTime)
+    )
+    completed = defaultdict(set)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(tracking.c.id, tracking.c.habit_id, tracking.c.completed)
+            .where(tracking.c.id > last_id, tracking.c.completed.isnot(None))
+            .order_by(tracking.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for _, habit_id, completed_at in rows:
+            completed[habit_id].add(completed_at.date())
+        last_id = rows[-1][0]
+
+    habits = sa.table(
+        'habits',
+        sa.column('id', sa.Integer),
+        sa.column('frequency', sa.String),
+        sa.column('target_days', sa.JSON),
+        sa.column('streak', sa.Integer),
+        sa.column('longest_streak', sa.Integer),
+        sa.column('last_completed_on', sa.Date),
+        sa.column('bitmap_start', sa.Date),
+        sa.column('completion_bitmap', sa.LargeBinary),
+    )
+    for habit_id, frequency, target_days in bind.execute(
+        sa.select(habits.c.id, habits.c.frequency, habits.c.target_days)
+    ).all():
+        habit = SimpleNamespace(
+            frequency=frequency, target_days=target_days, streak=0, longest_streak=0,
+            last_completed_on=None, bitmap_start=None, completion_bitmap=b""
+        )
+        for day in sorted(completed.get(habit_id, ())):
+            record_completion(habit, day)
+        bind.execute(
+            habits.update().where(habits.c.id == habit_id).values(
+                streak=habit.streak,
+                longest_streak=habit.longest_streak,
+                last_completed_on=habit.last_completed_on,
+                bitmap_start=habit.bitmap_start,
+                completion_bitmap=habit.completion_bitmap,
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('habits') as batch_op:
+        batch_op.drop_column('completion_bitmap')
+        batch_op.drop_column('bitmap_start')
+        batch_op.drop_column('last_completed_on')
+        batch_op.drop_column('longest_streak')
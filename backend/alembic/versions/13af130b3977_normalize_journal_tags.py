@@ -0,0 +1,82 @@
+"""Normalize journal entry tags and keep per-user tag counts
+
+Revision ID: 13af130b3977
+Revises: 9a4bd559dae7
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '13af130b3977'
+down_revision: Union[str, None] = '9a4bd559dae7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+MAX_TAG_LENGTH = 50
+
+
+def _normalize(tags):
+    seen = []
+    for tag in tags or []:
+        tag = str(tag).strip()[:MAX_TAG_LENGTH]
+        if tag and tag not in seen:
+            seen.append(tag)
+    return seen
+
+
+def upgrade() -> None:
+    entry_tags = op.create_table('journal_entry_tags',
+    sa.Column('entry_id', sa.Integer(), nullable=False),
+    sa.Column('tag', sa.String(length=50), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['entry_id'], ['journal_entries.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('entry_id', 'tag')
+    )
+    op.create_index('ix_journal_entry_tags_user_tag', 'journal_entry_tags', ['user_id', 'tag', 'entry_id'], unique=False)
+    op.create_table('journal_tag_counts',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('tag', sa.String(length=50), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'tag')
+    )
+    op.create_index('ix_journal_tag_counts_user_count', 'journal_tag_counts', ['user_id', 'count'], unique=False)
+
+    # Backfill from the JSON column in id order, one batch at a time
+    bind = op.get_bind()
+    entries = sa.table('journal_entries', sa.column('id', sa.Integer), sa.column('user_id', sa.Integer), sa.column('tags', sa.JSON))
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(entries.c.id, entries.c.user_id, entries.c.tags)
+            .where(entries.c.id > last_id, entries.c.user_id.isnot(None))
+            .order_by(entries.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        links = [
+            {'entry_id': entry_id, 'tag': tag, 'user_id': user_id}
+            for entry_id, user_id, tags in rows for tag in _normalize(tags)
+        ]
+        if links:
+            bind.execute(entry_tags.insert(), links)
+        last_id = rows[-1][0]
+    op.execute(
+        "INSERT INTO journal_tag_counts (user_id, tag, count) "
+        "SELECT user_id, tag, COUNT(*) FROM journal_entry_tags GROUP BY user_id, tag"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_journal_tag_counts_user_count', table_name='journal_tag_counts')
+    op.drop_table('journal_tag_counts')
+    op.drop_index('ix_journal_entry_tags_user_tag', table_name='journal_entry_tags')
+    op.drop_table('journal_entry_tags')
@@ -0,0 +1,65 @@
+"""Denormalized journal entry stats and entry pagination index
+
+Revision ID: 286c16fc49a5
+Revises: 13af130b3977
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '286c16fc49a5'
+down_revision: Union[str, None] = '13af130b3977'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('journals') as batch_op:
+        batch_op.add_column(sa.Column('entry_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('word_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('last_entry_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_journal_entries_journal_created', 'journal_entries', ['journal_id', 'created_at', 'id'], unique=False)
+
+    # Word counts need Python's split, so walk the entries in id batches
+    bind = op.get_bind()
+    entries = sa.table('journal_entries', sa.column('id', sa.Integer), sa.column('journal_id', sa.Integer), sa.column('content', sa.Text))
+    counts, words = defaultdict(int), defaultdict(int)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(entries.c.id, entries.c.journal_id, entries.c.content)
+            .where(entries.c.id > last_id, entries.c.journal_id.isnot(None))
+            .order_by(entries.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for _, journal_id, content in rows:
+            counts[journal_id] += 1
+            words[journal_id] += len(content.split()) if content else 0
+        last_id = rows[-1][0]
+    journals = sa.table('journals', sa.column('id', sa.Integer), sa.column('entry_count', sa.Integer), sa.column('word_count', sa.Integer))
+    for journal_id, count in counts.items():
+        bind.execute(
+            journals.update().where(journals.c.id == journal_id).values(entry_count=count, word_count=words[journal_id])
+        )
+    op.execute(
+        "UPDATE journals SET last_entry_at = "
+        "(SELECT MAX(created_at) FROM journal_entries WHERE journal_entries.journal_id = journals.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_journal_entries_journal_created', table_name='journal_entries')
+    with op.batch_alter_table('journals') as batch_op:
+        batch_op.drop_column('last_entry_at')
+        batch_op.drop_column('word_count')
+        batch_op.drop_column('entry_count')
@@ -0,0 +1,79 @@
+"""Store SHA-256 hashes of refresh and password reset tokens
+
+Revision ID: 5c1e8a2f7d41
+Revises: b6296614d457
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e8a2f7d41'
+down_revision: Union[str, None] = 'b6296614d457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.add_column(sa.Column('token_hash', sa.String(length=64), nullable=True))
+    rows = conn.execute(sa.text("SELECT id, token FROM refresh_tokens")).fetchall()
+    for row_id, token in rows:
+        conn.execute(
+            sa.text("UPDATE refresh_tokens SET token_hash = :token_hash WHERE id = :id"),
+            {"token_hash": _sha256(token), "id": row_id}
+        )
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.drop_index('ix_refresh_tokens_token')
+        batch_op.drop_column('token')
+        batch_op.alter_column('token_hash', existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_unique_constraint('uq_refresh_tokens_token_hash', ['token_hash'])
+        batch_op.create_index('ix_refresh_tokens_lookup', ['token_hash', 'revoked', 'expires_at'], unique=False)
+        batch_op.create_index('ix_refresh_tokens_expires_at', ['expires_at'], unique=False)
+
+    with op.batch_alter_table('password_resets') as batch_op:
+        batch_op.add_column(sa.Column('reset_token_hash', sa.String(length=64), nullable=True))
+    rows = conn.execute(sa.text("SELECT id, reset_token FROM password_resets")).fetchall()
+    for row_id, token in rows:
+        conn.execute(
+            sa.text("UPDATE password_resets SET reset_token_hash = :token_hash WHERE id = :id"),
+            {"token_hash": _sha256(token), "id": row_id}
+        )
+    with op.batch_alter_table('password_resets') as batch_op:
+        batch_op.drop_index('ix_password_resets_reset_token')
+        batch_op.drop_column('reset_token')
+        batch_op.create_index('ix_password_resets_reset_token_hash', ['reset_token_hash'], unique=True)
+        batch_op.create_index('ix_password_resets_expires_at', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    # Raw tokens cannot be recovered from their hashes; outstanding tokens are
+    # invalidated and users have to log in again.
+    op.execute("DELETE FROM refresh_tokens")
+    op.execute("DELETE FROM password_resets")
+
+    with op.batch_alter_table('password_resets') as batch_op:
+        batch_op.drop_index('ix_password_resets_expires_at')
+        batch_op.drop_index('ix_password_resets_reset_token_hash')
+        batch_op.drop_column('reset_token_hash')
+        batch_op.add_column(sa.Column('reset_token', sa.String(), nullable=True))
+        batch_op.create_index('ix_password_resets_reset_token', ['reset_token'], unique=True)
+
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.drop_index('ix_refresh_tokens_expires_at')
+        batch_op.drop_index('ix_refresh_tokens_lookup')
+        batch_op.drop_constraint('uq_refresh_tokens_token_hash', type_='unique')
+        batch_op.drop_column('token_hash')
+        batch_op.add_column(sa.Column('token', sa.String(), nullable=False))
+        batch_op.create_index('ix_refresh_tokens_token', ['token'], unique=True)
@@ -0,0 +1,32 @@
+"""Per-user timestamp indexes for the timeline
+
+Revision ID: 5e0b7d2c8f13
+Revises: 286c16fc49a5
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0b7d2c8f13'
+down_revision: Union[str, None] = '286c16fc49a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_user_created', 'tasks', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_activities_user_timestamp', 'activities', ['user_id', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_logs_user_created', 'logs', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_journal_entries_user_created', 'journal_entries', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_journal_entries_user_created', table_name='journal_entries')
+    op.drop_index('ix_logs_user_created', table_name='logs')
+    op.drop_index('ix_activities_user_timestamp', table_name='activities')
+    op.drop_index('ix_tasks_user_created', table_name='tasks')
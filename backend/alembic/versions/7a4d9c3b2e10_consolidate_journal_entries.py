@@ -0,0 +1,46 @@
+"""Restore journals table and file journal entries in journals
+
+Revision ID: 7a4d9c3b2e10
+Revises: 5c1e8a2f7d41
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4d9c3b2e10'
+down_revision: Union[str, None] = '5c1e8a2f7d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('journals',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_journals_id', 'journals', ['id'], unique=False)
+    with op.batch_alter_table('journal_entries') as batch_op:
+        batch_op.add_column(sa.Column('journal_id', sa.Integer(), nullable=True))
+        batch_op.create_index('ix_journal_entries_journal_id', ['journal_id'], unique=False)
+        batch_op.create_foreign_key(
+            'fk_journal_entries_journal_id', 'journals', ['journal_id'], ['id'], ondelete='CASCADE'
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('journal_entries') as batch_op:
+        batch_op.drop_constraint('fk_journal_entries_journal_id', type_='foreignkey')
+        batch_op.drop_index('ix_journal_entries_journal_id')
+        batch_op.drop_column('journal_id')
+    op.drop_index('ix_journals_id', table_name='journals')
+    op.drop_table('journals')
@@ -0,0 +1,35 @@
+"""Task dependencies
+
+Revision ID: 7d3a9e51c2f8
+Revises: c4f1e9a07b62
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3a9e51c2f8'
+down_revision: Union[str, None] = 'c4f1e9a07b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('task_dependencies',
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('depends_on_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['depends_on_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('task_id', 'depends_on_id')
+    )
+    op.create_index('ix_task_dependencies_depends_on', 'task_dependencies', ['depends_on_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_dependencies_depends_on', table_name='task_dependencies')
+    op.drop_table('task_dependencies')
@@ -0,0 +1,70 @@
+"""Cascade deletes in the database and tombstone deleted projects
+
+Revision ID: 9a4bd559dae7
+Revises: 7a4d9c3b2e10
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4bd559dae7'
+down_revision: Union[str, None] = '7a4d9c3b2e10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Lets batch mode on SQLite address the unnamed foreign keys it reflects
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+# Foreign keys that get ON DELETE CASCADE, grouped so each table is
+# rebuilt only once on SQLite
+CASCADE_FOREIGN_KEYS = {
+    'concept_notes': [('project_id', 'projects'), ('user_id', 'users')],
+    'mindmaps': [('project_id', 'projects')],
+    'logs': [('user_id', 'users'), ('project_id', 'projects')],
+    'log_entries': [('user_id', 'users')],
+    'ideas': [('user_id', 'users')],
+    'project_ideas': [('project_id', 'projects'), ('idea_id', 'ideas')],
+    'goals': [('user_id', 'users')],
+    'goal_progress': [('goal_id', 'goals')],
+    'habits': [('user_id', 'users')],
+    'habit_tracking': [('habit_id', 'habits')],
+    'password_resets': [('user_id', 'users')],
+    'profiles': [('user_id', 'users')],
+}
+
+
+def _set_ondelete(ondelete) -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for table, foreign_keys in CASCADE_FOREIGN_KEYS.items():
+        if table not in tables:
+            continue
+        existing = {
+            tuple(fk['constrained_columns']): fk['name']
+            for fk in inspector.get_foreign_keys(table)
+        }
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            for column, referred in foreign_keys:
+                name = existing.get((column,)) or f'fk_{table}_{column}_{referred}'
+                if (column,) in existing:
+                    batch_op.drop_constraint(name, type_='foreignkey')
+                batch_op.create_foreign_key(name, referred, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.add_column(sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index('ix_projects_deleted_at', ['deleted_at'], unique=False)
+    _set_ondelete('CASCADE')
+
+
+def downgrade() -> None:
+    _set_ondelete(None)
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.drop_index('ix_projects_deleted_at')
+        batch_op.drop_column('deleted_at')
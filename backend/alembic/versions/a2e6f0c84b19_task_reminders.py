@@ -0,0 +1,30 @@
+"""Task due-date reminders
+
+Revision ID: a2e6f0c84b19
+Revises: 7d3a9e51c2f8
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2e6f0c84b19'
+down_revision: Union[str, None] = '7d3a9e51c2f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('reminder_sent_for', sa.DateTime(), nullable=True))
+        batch_op.create_index('ix_tasks_due_date', ['due_date'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_due_date')
+        batch_op.drop_column('reminder_sent_for')
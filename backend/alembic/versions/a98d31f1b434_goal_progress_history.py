@@ -0,0 +1,44 @@
+"""Goal progress history columns and (goal_id, timestamp) index
+
+Revision ID: a98d31f1b434
+Revises: 09ac297be0f0
+Create Date: 2026-10-20 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a98d31f1b434'
+down_revision: Union[str, None] = '09ac297be0f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if 'value' in {column['name'] for column in sa.inspect(op.get_bind()).get_columns('goal_progress')}:
+        # Fresh installs get the table with these columns from f3b8c27d5e90
+        return
+    with op.batch_alter_table('goal_progress') as batch_op:
+        batch_op.alter_column('progress', new_column_name='value', existing_type=sa.Float())
+        batch_op.alter_column('created_at', new_column_name='timestamp', existing_type=sa.DateTime(timezone=True))
+        batch_op.add_column(sa.Column('data', sa.JSON(), nullable=True))
+    op.create_index('ix_goal_progress_goal_timestamp', 'goal_progress', ['goal_id', 'timestamp'], unique=False)
+
+    op.execute("UPDATE goal_progress SET data = '{}' WHERE data IS NULL")
+    # Undated updates take their goal's creation time
+    op.execute(
+        "UPDATE goal_progress SET timestamp = "
+        "(SELECT created_at FROM goals WHERE goals.id = goal_progress.goal_id) WHERE timestamp IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_goal_progress_goal_timestamp', table_name='goal_progress')
+    with op.batch_alter_table('goal_progress') as batch_op:
+        batch_op.drop_column('data')
+        batch_op.alter_column('timestamp', new_column_name='created_at', existing_type=sa.DateTime(timezone=True))
+        batch_op.alter_column('value', new_column_name='progress', existing_type=sa.Float())
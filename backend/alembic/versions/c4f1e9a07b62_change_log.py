@@ -0,0 +1,58 @@
+"""Change log for delta sync
+
+Revision ID: c4f1e9a07b62
+Revises: 5e0b7d2c8f13
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1e9a07b62'
+down_revision: Union[str, None] = '5e0b7d2c8f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Existing records are logged once so a first sync from 0 returns them all
+BACKFILL = [
+    ("project", "owner_id", "id", "projects WHERE owner_id IS NOT NULL AND deleted_at IS NULL"),
+    ("task", "user_id", "id", "tasks WHERE user_id IS NOT NULL"),
+    ("idea", "user_id", "id", "ideas WHERE user_id IS NOT NULL"),
+    ("concept", "user_id", "id", "concept_notes WHERE user_id IS NOT NULL"),
+    ("mindmap", "projects.owner_id", "mindmaps.id",
+     "mindmaps JOIN projects ON projects.id = mindmaps.project_id WHERE projects.owner_id IS NOT NULL"),
+    ("log", "user_id", "id", "logs WHERE user_id IS NOT NULL"),
+    ("log_entry", "user_id", "id", "log_entries WHERE user_id IS NOT NULL"),
+    ("journal_entry", "user_id", "id", "journal_entries WHERE user_id IS NOT NULL"),
+]
+
+
+def upgrade() -> None:
+    op.create_table('change_log',
+    sa.Column('seq', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=50), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=10), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('seq'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('ix_change_log_user_seq', 'change_log', ['user_id', 'seq'], unique=False)
+    op.create_index('ix_change_log_entity', 'change_log', ['entity', 'entity_id'], unique=True)
+    for entity, owner_column, id_column, source in BACKFILL:
+        op.execute(
+            f"INSERT INTO change_log (user_id, entity, entity_id, action) "
+            f"SELECT {owner_column}, '{entity}', {id_column}, 'upsert' FROM {source} ORDER BY {id_column}"
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_change_log_entity', table_name='change_log')
+    op.drop_index('ix_change_log_user_seq', table_name='change_log')
+    op.drop_table('change_log')
@@ -0,0 +1,38 @@
+"""Recurring tasks
+
+Revision ID: e58b1d7a3c46
+Revises: a2e6f0c84b19
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e58b1d7a3c46'
+down_revision: Union[str, None] = 'a2e6f0c84b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('recurrence_rule', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('recurrence_parent_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('occurrence_date', sa.DateTime(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_tasks_recurrence_parent_id_tasks', 'tasks', ['recurrence_parent_id'], ['id'], ondelete='CASCADE'
+        )
+        batch_op.create_index('ix_tasks_recurrence', ['recurrence_parent_id', 'occurrence_date'], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_recurrence')
+        batch_op.drop_constraint('fk_tasks_recurrence_parent_id_tasks', type_='foreignkey')
+        batch_op.drop_column('occurrence_date')
+        batch_op.drop_column('recurrence_parent_id')
+        batch_op.drop_column('recurrence_rule')
@@ -0,0 +1,92 @@
+"""Goal and habit tables
+
+Revision ID: f3b8c27d5e90
+Revises: e58b1d7a3c46
+Create Date: 2026-10-20 08:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8c27d5e90'
+down_revision: Union[str, None] = 'e58b1d7a3c46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases created with create_all may already have these tables,
+    # migrated databases don't
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('goals'):
+        op.create_table('goals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('category', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('target_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('progress', sa.Float(), nullable=True),
+        sa.Column('metrics', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_goals_id', 'goals', ['id'], unique=False)
+    if not sa.inspect(bind).has_table('goal_progress'):
+        # Already with the history columns and index of the goal progress
+        # revision, which then leaves it alone
+        op.create_table('goal_progress',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('goal_id', sa.Integer(), nullable=True),
+        sa.Column('value', sa.Float(), nullable=True),
+        sa.Column('notes', sa.String(), nullable=True),
+        sa.Column('data', sa.JSON(), nullable=True),
+        sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['goal_id'], ['goals.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_goal_progress_id', 'goal_progress', ['id'], unique=False)
+        op.create_index('ix_goal_progress_goal_timestamp', 'goal_progress', ['goal_id', 'timestamp'], unique=False)
+    if not sa.inspect(bind).has_table('habits'):
+        # Created with the streak columns of the next revision, which then
+        # has nothing to add or backfill
+        op.create_table('habits',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('frequency', sa.String(), nullable=True),
+        sa.Column('target_days', sa.JSON(), nullable=True),
+        sa.Column('streak', sa.Integer(), nullable=True),
+        sa.Column('longest_streak', sa.Integer(), nullable=True),
+        sa.Column('last_completed_on', sa.Date(), nullable=True),
+        sa.Column('bitmap_start', sa.Date(), nullable=True),
+        sa.Column('completion_bitmap', sa.LargeBinary(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_habits_id', 'habits', ['id'], unique=False)
+    if not sa.inspect(bind).has_table('habit_tracking'):
+        op.create_table('habit_tracking',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('habit_id', sa.Integer(), nullable=True),
+        sa.Column('completed', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('notes', sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(['habit_id'], ['habits.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_habit_tracking_id', 'habit_tracking', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    # The tables predate this revision on databases that already had them,
+    # so they are kept rather than dropped with their data
+    pass
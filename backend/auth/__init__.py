@@ -1,5 +1,6 @@
 from .utils import (
     get_password_hash,
+    hash_token,
     verify_password,
     authenticate_user,
     create_access_token,
@@ -8,11 +9,13 @@ from .utils import (
     create_tokens,
     verify_refresh_token,
     revoke_refresh_token,
+    get_token_subject,
     get_current_user
 )
 
 __all__ = [
     'get_password_hash',
+    'hash_token',
     'verify_password',
     'authenticate_user',
     'create_access_token',
@@ -21,5 +24,6 @@ __all__ = [
     'create_tokens',
     'verify_refresh_token',
     'revoke_refresh_token',
+    'get_token_subject',
     'get_current_user'
 ]
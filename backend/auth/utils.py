@@ -6,6 +6,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 import secrets
+import hashlib
 import logging
 
 from config import get_settings
@@ -39,6 +40,10 @@ def create_access_token(data: dict) -> str:
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+def hash_token(token: str) -> str:
+    """Return the SHA-256 hex digest used to store and look up opaque tokens."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
 def create_refresh_token(user_id: int) -> str:
     """Create a new refresh token."""
     return secrets.token_urlsafe(32)
@@ -47,7 +52,7 @@ def store_refresh_token(db: Session, user_id: int, refresh_token: str) -> None:
     """Store a refresh token in the database."""
     refresh_token_expires = datetime.utcnow() + timedelta(days=30)  # 30 days
     db_refresh_token = RefreshToken(
-        token=refresh_token,
+        token_hash=hash_token(refresh_token),
         expires_at=refresh_token_expires,
         user_id=user_id
     )
@@ -86,7 +91,7 @@ def create_tokens(user: User, db: Session) -> Tuple[str, str, datetime]:
 def verify_refresh_token(refresh_token: str, db: Session) -> Optional[User]:
     """Verify refresh token and return associated user."""
     db_refresh_token = db.query(RefreshToken).filter(
-        RefreshToken.token == refresh_token,
+        RefreshToken.token_hash == hash_token(refresh_token),
         RefreshToken.revoked == False,
         RefreshToken.expires_at > datetime.utcnow()
     ).first()
@@ -99,7 +104,7 @@ def verify_refresh_token(refresh_token: str, db: Session) -> Optional[User]:
 def revoke_refresh_token(refresh_token: str, db: Session) -> bool:
     """Revoke a refresh token."""
     db_refresh_token = db.query(RefreshToken).filter(
-        RefreshToken.token == refresh_token
+        RefreshToken.token_hash == hash_token(refresh_token)
     ).first()
     
     if db_refresh_token:
@@ -108,6 +113,14 @@ def revoke_refresh_token(refresh_token: str, db: Session) -> bool:
         return True
     return False
 
+def get_token_subject(token: str) -> Optional[str]:
+    """Return the subject of a valid access token, or None if it does not verify."""
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("sub")
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -0,0 +1,4 @@
+"""HTTP-level load benchmarks run against the app in-process.
+
+See ``benchmarks.run`` for the command line interface.
+"""
@@ -0,0 +1,253 @@
+"""Drive key API endpoints concurrently and report latency percentiles.
+
+The app runs in-process behind ``httpx.AsyncClient``, against a throwaway
+SQLite database seeded with a parameterized dataset, so the numbers measure
+our code and the database rather than the network.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.run --requests 500 --concurrency 20
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --fail-on-regression 15
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# The app reads its configuration at import time, so point it at a scratch
+# database and switch off admission control before importing anything
+_workdir = tempfile.mkdtemp(prefix="ipms-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'bench.db')}"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+
+from auth.utils import create_access_token  # noqa: E402
+from benchmarks.seed import BENCHMARK_PASSWORD, Dataset, DatasetSize, seed_dataset  # noqa: E402
+from database import SessionLocal, init_db  # noqa: E402
+from main import app  # noqa: E402
+
+Scenario = Callable[[httpx.AsyncClient, Dataset, Dict[str, Dict[str, str]], random.Random], Awaitable[httpx.Response]]
+
+
+async def login(client, dataset, headers, rng):
+    username = rng.choice(dataset.usernames)
+    return await client.post("/api/auth/login", json={"username": username, "password": BENCHMARK_PASSWORD})
+
+
+async def search_tasks(client, dataset, headers, rng):
+    username = rng.choice(dataset.usernames)
+    term = rng.choice(["review", "deploy", "fix", "plan"])
+    return await client.get(f"/api/tasks/?search={term}&sort_by=due_date", headers=headers[username])
+
+
+async def project_activities(client, dataset, headers, rng):
+    username = rng.choice(dataset.usernames)
+    project_id = rng.choice(dataset.project_ids[username])
+    return await client.get(f"/api/projects/{project_id}/activities", headers=headers[username])
+
+
+async def list_logs(client, dataset, headers, rng):
+    username = rng.choice(dataset.usernames)
+    project_id = rng.choice(dataset.project_ids[username])
+    return await client.get(f"/api/logs/?project_id={project_id}&limit=50", headers=headers[username])
+
+
+async def update_mindmap(client, dataset, headers, rng):
+    username = rng.choice(dataset.usernames)
+    mindmap_id = rng.choice(dataset.mindmap_ids[username])
+    nodes = [{"id": str(i), "label": f"Node {i}"} for i in range(rng.randint(5, 50))]
+    return await client.put(
+        f"/api/mindmaps/{mindmap_id}",
+        json={"title": f"Mindmap {mindmap_id}", "data": {"nodes": nodes, "edges": []}},
+        headers=headers[username]
+    )
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login": login,
+    "search_tasks": search_tasks,
+    "project_activities": project_activities,
+    "list_logs": list_logs,
+    "update_mindmap": update_mindmap,
+}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Linearly interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    dataset: Dataset,
+    headers: Dict[str, Dict[str, str]],
+    requests: int,
+    concurrency: int,
+    seed: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker(worker_id: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed * 1000 + worker_id)
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await scenario(client, dataset, headers, rng)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Percent change per scenario; positive means slower (or fewer req/s)."""
+    changes = {}
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        changes[name] = {}
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            if previous.get(key):
+                changes[name][key] = round((current[key] - previous[key]) / previous[key] * 100, 1)
+        if previous.get("rps"):
+            changes[name]["rps"] = round((previous["rps"] - current["rps"]) / previous["rps"] * 100, 1)
+    return changes
+
+
+def print_report(results, changes) -> None:
+    header = f"{'scenario':<20}{'reqs':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        print(
+            f"{name:<20}{r['requests']:>7}{r['errors']:>8}{r['p50_ms']:>10.2f}"
+            f"{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['rps']:>10.1f}"
+        )
+        if name in changes:
+            deltas = "  ".join(f"{key} {value:+.1f}%" for key, value in changes[name].items())
+            print(f"{'':<20}vs baseline: {deltas}")
+
+
+def dataset_size(args) -> DatasetSize:
+    return DatasetSize(
+        users=args.users,
+        projects_per_user=args.projects,
+        tasks_per_project=args.tasks,
+        activities_per_project=args.activities,
+        logs_per_project=args.logs,
+        entries_per_log=args.log_entries
+    )
+
+
+async def run(args) -> Dict[str, Dict[str, float]]:
+    size = dataset_size(args)
+    init_db()
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        dataset = seed_dataset(db, size, seed=args.seed)
+        print(f"Seeded {size.total_rows()} rows in {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+    headers = {
+        username: {"Authorization": f"Bearer {create_access_token(data={'sub': username})}"}
+        for username in dataset.usernames
+    }
+    names = args.scenarios or list(SCENARIOS)
+    results = {}
+    async with httpx.AsyncClient(app=app, base_url="http://benchmark") as client:
+        for name in names:
+            # A few untimed requests so lazy imports and caches settle first
+            await run_scenario(client, SCENARIOS[name], dataset, headers, args.warmup, 1, args.seed)
+            results[name] = await run_scenario(
+                client, SCENARIOS[name], dataset, headers, args.requests, args.concurrency, args.seed
+            )
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    defaults = DatasetSize()
+    parser = argparse.ArgumentParser(description="Run the IPMS HTTP benchmarks")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--projects", type=int, default=defaults.projects_per_user, help="projects per user")
+    parser.add_argument("--tasks", type=int, default=defaults.tasks_per_project, help="tasks per project")
+    parser.add_argument("--activities", type=int, default=defaults.activities_per_project, help="activities per project")
+    parser.add_argument("--logs", type=int, default=defaults.logs_per_project, help="logs per project")
+    parser.add_argument("--log-entries", type=int, default=defaults.entries_per_log, help="entries per log")
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=5, help="untimed requests per scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), help="subset of scenarios to run")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", help="write the results to this JSON file")
+    parser.add_argument(
+        "--fail-on-regression",
+        type=float,
+        metavar="PERCENT",
+        help="exit non-zero if any p95 or req/s regresses by more than PERCENT against the baseline"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(run(args))
+
+    changes = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            changes = compare(results, json.load(f)["results"])
+    print_report(results, changes)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"dataset": asdict(dataset_size(args)), "results": results}, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.fail_on_regression is not None:
+        regressions = [
+            f"{name} {key} {value:+.1f}%"
+            for name, deltas in changes.items()
+            for key, value in deltas.items()
+            if key in ("p95_ms", "rps") and value > args.fail_on_regression
+        ]
+        if regressions:
+            print("Regressions: " + ", ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
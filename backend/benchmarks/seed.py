@@ -0,0 +1,119 @@
+"""Deterministic seed data for the load benchmarks."""
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy.orm import Session
+
+from auth.utils import get_password_hash
+from models.activity import Activity
+from models.log import Log, LogType
+from models.log_entry import LogEntry
+from models.mindmap import Mindmap
+from models.project import Project
+from models.task import Task, TaskPriority, TaskStatus
+from models.user import User
+
+BENCHMARK_PASSWORD = "benchmark-password"
+ACTIVITY_TYPES = ["web", "app", "music", "location"]
+TASK_WORDS = ["review", "design", "deploy", "refactor", "write", "plan", "fix", "test", "release", "document"]
+
+
+@dataclass
+class DatasetSize:
+    users: int = 5
+    projects_per_user: int = 4
+    tasks_per_project: int = 50
+    activities_per_project: int = 100
+    logs_per_project: int = 2
+    entries_per_log: int = 20
+
+    def total_rows(self) -> int:
+        projects = self.users * self.projects_per_user
+        logs = projects * self.logs_per_project
+        return (
+            self.users + projects * 2  # projects and their mindmaps
+            + projects * (self.tasks_per_project + self.activities_per_project)
+            + logs * (1 + self.entries_per_log)
+        )
+
+
+@dataclass
+class Dataset:
+    usernames: List[str] = field(default_factory=list)
+    project_ids: Dict[str, List[int]] = field(default_factory=dict)
+    mindmap_ids: Dict[str, List[int]] = field(default_factory=dict)
+
+
+def seed_dataset(db: Session, size: DatasetSize, seed: int = 42) -> Dataset:
+    """Populate an empty database and return the identifiers the scenarios need."""
+    rng = random.Random(seed)
+    # bcrypt is deliberately slow, so every benchmark user shares one hash
+    hashed_password = get_password_hash(BENCHMARK_PASSWORD)
+    now = datetime.utcnow()
+    dataset = Dataset()
+
+    for u in range(size.users):
+        username = f"bench{u}"
+        user = User(
+            username=username,
+            email=f"{username}@example.com",
+            full_name=f"Benchmark User {u}",
+            hashed_password=hashed_password
+        )
+        db.add(user)
+        db.flush()
+        dataset.usernames.append(username)
+        dataset.project_ids[username] = []
+        dataset.mindmap_ids[username] = []
+
+        for p in range(size.projects_per_user):
+            project = Project(title=f"Project {u}-{p}", description="Benchmark project", owner_id=user.id)
+            db.add(project)
+            db.flush()
+            mindmap = Mindmap(title=f"Mindmap {u}-{p}", data={"nodes": [], "edges": []}, project_id=project.id)
+            db.add(mindmap)
+            db.flush()
+            dataset.project_ids[username].append(project.id)
+            dataset.mindmap_ids[username].append(mindmap.id)
+
+            db.add_all(
+                Task(
+                    title=f"{rng.choice(TASK_WORDS)} {rng.choice(TASK_WORDS)} {t}",
+                    description=" ".join(rng.choices(TASK_WORDS, k=12)),
+                    status=rng.choice(list(TaskStatus)),
+                    priority=rng.choice(list(TaskPriority)),
+                    due_date=now + timedelta(days=rng.randint(-30, 60)),
+                    user_id=user.id,
+                    project_id=project.id
+                )
+                for t in range(size.tasks_per_project)
+            )
+            db.add_all(
+                Activity(
+                    user_id=user.id,
+                    project_id=project.id,
+                    type=rng.choice(ACTIVITY_TYPES),
+                    data={"detail": "x" * rng.randint(16, 256)},
+                    timestamp=now - timedelta(minutes=rng.randint(0, 60 * 24 * 90))
+                )
+                for _ in range(size.activities_per_project)
+            )
+            for l in range(size.logs_per_project):
+                log = Log(
+                    title=f"Log {u}-{p}-{l}",
+                    content="Benchmark log",
+                    log_type=rng.choice(list(LogType)),
+                    user_id=user.id,
+                    project_id=project.id
+                )
+                db.add(log)
+                db.flush()
+                db.add_all(
+                    LogEntry(content=" ".join(rng.choices(TASK_WORDS, k=30)), log_id=log.id, user_id=user.id)
+                    for _ in range(size.entries_per_log)
+                )
+        db.commit()
+
+    return dataset
@@ -13,8 +13,74 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
     
+    # Expired/revoked refresh tokens and used password resets are purged
+    # periodically in batches to keep the auth tables small
+    TOKEN_PURGE_INTERVAL_MINUTES: int = int(os.getenv("TOKEN_PURGE_INTERVAL_MINUTES", "60"))
+    TOKEN_PURGE_BATCH_SIZE: int = int(os.getenv("TOKEN_PURGE_BATCH_SIZE", "1000"))
+    
+    # Deleted projects are tombstoned and their rows purged in the background
+    PROJECT_PURGE_INTERVAL_SECONDS: int = int(os.getenv("PROJECT_PURGE_INTERVAL_SECONDS", "60"))
+    PROJECT_PURGE_BATCH_SIZE: int = int(os.getenv("PROJECT_PURGE_BATCH_SIZE", "1000"))
+    
+    # Rate limiting: token buckets per client IP and per authenticated user.
+    # Capacity is the burst size, refill is the sustained requests per second.
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_IP_CAPACITY: float = float(os.getenv("RATE_LIMIT_IP_CAPACITY", "120"))
+    RATE_LIMIT_IP_REFILL_PER_SECOND: float = float(os.getenv("RATE_LIMIT_IP_REFILL_PER_SECOND", "2"))
+    RATE_LIMIT_USER_CAPACITY: float = float(os.getenv("RATE_LIMIT_USER_CAPACITY", "240"))
+    RATE_LIMIT_USER_REFILL_PER_SECOND: float = float(os.getenv("RATE_LIMIT_USER_REFILL_PER_SECOND", "4"))
+    # Reject new requests with 503 once this many are in flight (0 disables)
+    RATE_LIMIT_MAX_CONCURRENT: int = int(os.getenv("RATE_LIMIT_MAX_CONCURRENT", "0"))
+    # Optional "module:ClassName" of a shared RateLimitBackend for multi-worker setups
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "")
+    
+    # Expose Prometheus metrics on /metrics and record request/SQL timings
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    
+    # Bug reports are coalesced in memory and appended to a JSONL log every
+    # flush interval; the markdown summary is re-rendered from the log
+    BUG_REPORT_FLUSH_SECONDS: float = float(os.getenv("BUG_REPORT_FLUSH_SECONDS", "2"))
+    BUG_REPORT_RENDER_INTERVAL_SECONDS: int = int(os.getenv("BUG_REPORT_RENDER_INTERVAL_SECONDS", "60"))
+    BUG_REPORT_MAX_PENDING: int = int(os.getenv("BUG_REPORT_MAX_PENDING", "1000"))
+    
+    # Imports insert and commit this many rows of one type at a time
+    IMPORT_BATCH_SIZE: int = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+    
+    # Live update streams: undelivered events buffered per connection before
+    # it is told to resync, how long a burst may settle before it is sent,
+    # and the keep-alive comment interval for idle streams
+    EVENT_QUEUE_SIZE: int = int(os.getenv("EVENT_QUEUE_SIZE", "100"))
+    EVENT_COALESCE_SECONDS: float = float(os.getenv("EVENT_COALESCE_SECONDS", "0.25"))
+    EVENT_KEEPALIVE_SECONDS: float = float(os.getenv("EVENT_KEEPALIVE_SECONDS", "15"))
+    # Optional "module:ClassName" of an EventBackend that fans out across workers
+    EVENT_BACKEND: str = os.getenv("EVENT_BACKEND", "")
+    
+    # Task dependency graphs: tasks carry no estimates, so every open task
+    # counts as one step of this many hours when computing slack; built
+    # graphs are kept in memory for this many projects
+    TASK_GRAPH_STEP_HOURS: float = float(os.getenv("TASK_GRAPH_STEP_HOURS", "24"))
+    TASK_GRAPH_CACHE_SIZE: int = int(os.getenv("TASK_GRAPH_CACHE_SIZE", "64"))
+    
+    # Due-date reminders go out this long before a task is due. Only the
+    # reminders of the next window are held in memory; task writes are
+    # picked up from the change log at least every poll interval
+    REMINDERS_ENABLED: bool = os.getenv("REMINDERS_ENABLED", "true").lower() == "true"
+    REMINDER_LEAD_MINUTES: int = int(os.getenv("REMINDER_LEAD_MINUTES", "60"))
+    REMINDER_WINDOW_MINUTES: int = int(os.getenv("REMINDER_WINDOW_MINUTES", "60"))
+    REMINDER_POLL_SECONDS: float = float(os.getenv("REMINDER_POLL_SECONDS", "15"))
+    
+    # AI provider settings; providers are imported only when first used
+    AI_PROVIDER: str = os.getenv("AI_PROVIDER", "ollama")
+    AI_MODEL_NAME: str = os.getenv("AI_MODEL_NAME", "llama2")
+    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OLLAMA_HOST: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+    HUGGINGFACE_API_KEY: str = os.getenv("HUGGINGFACE_API_KEY", "")
+    
     # Database settings
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./sql_app.db")
+    # After a write, that user's GET requests skip the read replicas
+    # (DATABASE_REPLICA_URLS) for this long so they see their own changes
+    REPLICA_STICKY_SECONDS: float = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
     
     # CORS settings
     CORS_ORIGINS: list = ["http://localhost:3000"]
@@ -1,18 +1,116 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import Select
+from fastapi import Request
+from typing import List, Optional
+import itertools
+import logging
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./sql_app.db")
+# Comma-separated read replicas of DATABASE_URL; GET traffic is spread over them
+REPLICA_DATABASE_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# A replica that failed its check is left out for this long
+REPLICA_RETRY_SECONDS = float(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+# A healthy replica is checked again once its last check is this old
+REPLICA_CHECK_SECONDS = float(os.getenv("REPLICA_CHECK_SECONDS", "10"))
+
+
+def _create_engine(url: str) -> Engine:
+    new_engine = create_engine(url, connect_args={"check_same_thread": False} if url.startswith("sqlite") else {})
+    if new_engine.dialect.name == "sqlite":
+        @event.listens_for(new_engine, "connect")
+        def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+            # SQLite only honours ON DELETE CASCADE when foreign keys are
+            # switched on, and the setting is per connection
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+    return new_engine
+
+
+engine = _create_engine(SQLALCHEMY_DATABASE_URL)
+
+
+class ReplicaPool:
+    """
+    Round-robin over replica engines, skipping any whose last health check
+    (a ``SELECT 1``) failed until ``retry_seconds`` have passed.
+    """
+
+    def __init__(self, engines: List[Engine], retry_seconds: float = None, check_seconds: float = None, clock=time.monotonic):
+        self.engines = engines
+        self.retry_seconds = REPLICA_RETRY_SECONDS if retry_seconds is None else retry_seconds
+        self.check_seconds = REPLICA_CHECK_SECONDS if check_seconds is None else check_seconds
+        self.clock = clock
+        # Per engine: when it was last checked and whether it passed
+        self._checked_at = [None] * len(engines)
+        self._healthy = [False] * len(engines)
+        self._next = itertools.cycle(range(len(engines)))
+        self._lock = threading.Lock()
+
+    def _check(self, index: int) -> bool:
+        try:
+            with self.engines[index].connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.warning(f"Read replica {self.engines[index].url!r} failed its health check: {str(e)}")
+            return False
+
+    def choose(self) -> Optional[Engine]:
+        """The next healthy replica, or None to read from the primary."""
+        for _ in range(len(self.engines)):
+            with self._lock:
+                index = next(self._next)
+                checked_at, healthy = self._checked_at[index], self._healthy[index]
+            now = self.clock()
+            due = checked_at is None or now - checked_at >= (self.check_seconds if healthy else self.retry_seconds)
+            if due:
+                healthy = self._check(index)
+                with self._lock:
+                    self._checked_at[index], self._healthy[index] = now, healthy
+            if healthy:
+                return self.engines[index]
+        return None
+
+
+replicas = ReplicaPool([_create_engine(url) for url in REPLICA_DATABASE_URLS])
+
+
+class RoutingSession(Session):
+    """
+    Reads from ``replica`` when one is given; writes, flushes and anything
+    that isn't a plain SELECT go to the primary, and once a session has
+    written it reads from the primary too, so it sees its own changes.
+    """
+
+    def __init__(self, *args, replica: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+
+    def use_primary(self) -> None:
+        """Read from the primary for the rest of the session."""
+        self.replica = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is not None:
+            if not self._flushing and isinstance(clause, Select):
+                return self.replica
+            self.replica = None
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=RoutingSession)
 
 Base = declarative_base()
 
@@ -31,8 +129,10 @@ async def async_init_db():
     init_db()
 
 # Dependency
-def get_db():
-    db = SessionLocal()
+def get_db(request: Request):
+    # ReplicaRoutingMiddleware decides which requests may read from a replica
+    replica = replicas.choose() if getattr(request.state, "read_replica", False) else None
+    db = SessionLocal(replica=replica)
     try:
         yield db
     finally:
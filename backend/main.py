@@ -1,5 +1,6 @@
 import os
 import sys
+import asyncio
 
 # Add the backend directory to Python path
 backend_dir = os.path.dirname(os.path.abspath(__file__))
@@ -8,10 +9,11 @@ if backend_dir not in sys.path:
 
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
 from contextlib import contextmanager
 import logging
 from typing import List
@@ -20,9 +22,16 @@ from dotenv import load_dotenv
 from routers import (
     auth_router, users_router, tasks_router, projects_router, activities_router,
     ideas_router, concepts_router, mindmaps_router, logs_router, log_entries_router,
-    bugs_router
+    bugs_router, development_router, journals_router, export_router,
+    imports_router, timeline_router, events_router, sync_router
 )
-from database import async_init_db
+from database import async_init_db, engine, replicas
+from services.maintenance import start_maintenance_tasks, stop_maintenance_tasks
+from middleware import RateLimitMiddleware, MetricsMiddleware, ReplicaRoutingMiddleware
+from services.metrics import REGISTRY, instrument_engine
+from services.bug_reports import bug_report_store, render_bug_reports
+from services.events import event_hub
+from config import get_settings
 
 # Load environment variables
 load_dotenv()
@@ -37,6 +46,7 @@ logging.basicConfig(
 )
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # Create FastAPI app instance
 app = FastAPI(
@@ -45,6 +55,20 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Sends GET requests to the read replicas, if any are configured
+app.add_middleware(ReplicaRoutingMiddleware)
+
+# Admission control; added before CORS so 429 responses still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
+
+# Request metrics; wraps the rate limiter so rejected requests are counted too.
+# Event streams are left out, their duration is the tab's lifetime.
+if settings.METRICS_ENABLED:
+    instrument_engine(engine)
+    for replica in replicas.engines:
+        instrument_engine(replica, pool_gauges=False)
+    app.add_middleware(MetricsMiddleware, exclude_paths=("/metrics", "/api/events"))
+
 # Configure CORS with proper error handling
 app.add_middleware(
     CORSMiddleware,
@@ -84,15 +108,35 @@ app.include_router(mindmaps_router, prefix="/api/mindmaps", tags=["mindmaps"])
 app.include_router(logs_router, prefix="/api/logs", tags=["logs"])
 app.include_router(log_entries_router, prefix="/api/logs", tags=["log_entries"])
 app.include_router(bugs_router, prefix="/api/bugs", tags=["bugs"])
+app.include_router(development_router, prefix="/api/development", tags=["development"])
+app.include_router(journals_router, prefix="/api/journals", tags=["journals"])
+app.include_router(export_router, prefix="/api/export", tags=["export"])
+app.include_router(imports_router, prefix="/api/import", tags=["import"])
+app.include_router(timeline_router, prefix="/api/timeline", tags=["timeline"])
+app.include_router(events_router, prefix="/api/events", tags=["events"])
+app.include_router(sync_router, prefix="/api/sync", tags=["sync"])
 
 @app.on_event("startup")
 async def startup_event():
     try:
+        # Resolve all relationships up front so mapping errors fail startup
+        # instead of the first request
+        configure_mappers()
         await async_init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
         raise
+    # Reminders publish through the hub, so it starts first
+    await event_hub.start()
+    app.state.maintenance_tasks = start_maintenance_tasks()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await stop_maintenance_tasks(getattr(app.state, "maintenance_tasks", []))
+    await event_hub.stop()
+    await bug_report_store.stop()
+    await asyncio.to_thread(render_bug_reports)
 
 # Root endpoint
 @app.get("/")
@@ -111,6 +155,13 @@ async def health_check():
         "timestamp": str(datetime.datetime.now())
     }
 
+# Prometheus scrape endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,11 @@
+from .rate_limit import RateLimitMiddleware, RateLimitBackend, InMemoryRateLimitBackend
+from .metrics import MetricsMiddleware
+from .replica_routing import ReplicaRoutingMiddleware
+
+__all__ = [
+    'RateLimitMiddleware',
+    'RateLimitBackend',
+    'InMemoryRateLimitBackend',
+    'MetricsMiddleware',
+    'ReplicaRoutingMiddleware',
+]
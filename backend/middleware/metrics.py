@@ -0,0 +1,54 @@
+"""Request instrumentation feeding the metrics registry in ``services.metrics``."""
+import time
+
+from services.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    DB_STATEMENTS_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    RequestStats,
+    request_stats
+)
+
+# Label used for requests that did not match any route, so scanners probing
+# random paths cannot blow up the number of time series
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app, exclude_paths=("/metrics",)):
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = RequestStats()
+        token = request_stats.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            request_stats.reset(token)
+            # The router stores the matched route in the shared scope
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or getattr(route, "path", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.observe(elapsed, method=method, route=template)
+            HTTP_REQUESTS.inc(method=method, route=template, status=status_code)
+            DB_STATEMENTS_PER_REQUEST.observe(stats.statements, route=template)
+            DB_TIME_PER_REQUEST.observe(stats.db_seconds, route=template)
@@ -0,0 +1,191 @@
+"""Token-bucket admission control for the API.
+
+Every request draws tokens from a bucket keyed by client IP and, when it
+carries a valid access token, from a second bucket keyed by username. A
+request the user bucket rejects gets its IP tokens back, so one throttled
+user doesn't drain the budget of everyone sharing the address.
+Expensive routes cost more tokens. Requests that would overdraw a bucket
+get an immediate 429 with ``Retry-After`` instead of queueing behind the
+work that is already running.
+"""
+import importlib
+import json
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from auth.utils import get_token_subject
+from config import get_settings
+
+settings = get_settings()
+
+# Token cost per request by path prefix; the longest matching prefix wins.
+# Login and registration pay for bcrypt.
+DEFAULT_ROUTE_COSTS: Dict[str, float] = {
+    "/api/auth/login": 5.0,
+    "/api/auth/token": 5.0,
+    "/api/auth/register": 5.0,
+    "/api/auth/password-reset": 5.0,
+    "/api/auth/refresh": 2.0,
+}
+
+# Server-sent event streams stay open for the life of a tab; they pay for
+# admission like any request but do not hold a concurrency slot
+LONG_LIVED_PATHS = ("/api/events",)
+
+
+class RateLimitBackend(ABC):
+    @abstractmethod
+    async def consume(self, key: str, cost: float, capacity: float, refill_per_second: float) -> float:
+        """
+        Take ``cost`` tokens from the bucket identified by ``key``.
+
+        Returns 0 if the tokens were taken, otherwise the number of seconds
+        until the bucket holds enough tokens. Nothing is taken on rejection.
+        """
+        pass
+
+    @abstractmethod
+    async def refund(self, key: str, cost: float, capacity: float) -> None:
+        """Return ``cost`` tokens taken by ``consume``, up to ``capacity``."""
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Per-process token buckets kept in an LRU-bounded dictionary."""
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def consume(self, key: str, cost: float, capacity: float, refill_per_second: float) -> float:
+        now = self.clock()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+            if tokens >= cost:
+                tokens -= cost
+                wait = 0.0
+            else:
+                wait = (cost - tokens) / refill_per_second if refill_per_second > 0 else math.inf
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            # Dropping the least recently used bucket only ever forgets debt of
+            # an idle client, which would have refilled by now anyway
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+    async def refund(self, key: str, cost: float, capacity: float) -> None:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            # An evicted bucket starts full again anyway
+            if bucket is not None:
+                tokens, updated = bucket
+                self._buckets[key] = (min(capacity, tokens + cost), updated)
+
+
+def load_backend(path: str) -> RateLimitBackend:
+    """Instantiate a backend from a ``module:ClassName`` string."""
+    module_name, _, class_name = path.partition(":")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    return backend_class()
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app,
+        backend: Optional[RateLimitBackend] = None,
+        route_costs: Optional[Dict[str, float]] = None,
+        enabled: bool = settings.RATE_LIMIT_ENABLED,
+        ip_capacity: float = settings.RATE_LIMIT_IP_CAPACITY,
+        ip_refill_per_second: float = settings.RATE_LIMIT_IP_REFILL_PER_SECOND,
+        user_capacity: float = settings.RATE_LIMIT_USER_CAPACITY,
+        user_refill_per_second: float = settings.RATE_LIMIT_USER_REFILL_PER_SECOND,
+        max_concurrent: int = settings.RATE_LIMIT_MAX_CONCURRENT,
+    ):
+        self.app = app
+        if backend is None:
+            backend = load_backend(settings.RATE_LIMIT_BACKEND) if settings.RATE_LIMIT_BACKEND else InMemoryRateLimitBackend()
+        self.backend = backend
+        # Sorted longest first so the first match is the most specific
+        self.route_costs = sorted((route_costs or DEFAULT_ROUTE_COSTS).items(), key=lambda item: -len(item[0]))
+        self.enabled = enabled
+        self.ip_capacity = ip_capacity
+        self.ip_refill_per_second = ip_refill_per_second
+        self.user_capacity = user_capacity
+        self.user_refill_per_second = user_refill_per_second
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+
+    def cost_for(self, path: str) -> float:
+        for prefix, cost in self.route_costs:
+            if path.startswith(prefix):
+                return cost
+        return 1.0
+
+    @staticmethod
+    def _bearer_token(scope) -> Optional[str]:
+        for name, value in scope.get("headers", []):
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() == "bearer" and token:
+                    return token
+        return None
+
+    async def _reject(self, send, status_code: int, detail: str, retry_after: float) -> None:
+        body = json.dumps({"detail": detail}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        if self.max_concurrent and self.in_flight >= self.max_concurrent:
+            await self._reject(send, 503, "Server is busy, please retry shortly", 1)
+            return
+
+        cost = self.cost_for(scope["path"])
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        wait = await self.backend.consume(f"ip:{ip}", cost, self.ip_capacity, self.ip_refill_per_second)
+
+        if not wait:
+            token = self._bearer_token(scope)
+            username = get_token_subject(token) if token else None
+            if username:
+                wait = await self.backend.consume(
+                    f"user:{username}", cost, self.user_capacity, self.user_refill_per_second
+                )
+                if wait:
+                    await self.backend.refund(f"ip:{ip}", cost, self.ip_capacity)
+
+        if wait:
+            await self._reject(send, 429, "Too many requests", wait)
+            return
+
+        if scope["path"].startswith(LONG_LIVED_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
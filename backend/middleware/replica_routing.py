@@ -0,0 +1,83 @@
+"""Read-replica routing for GET traffic.
+
+GET and HEAD requests are marked (``request.state.read_replica``) so that
+``get_db`` reads them from a replica, unless their user sent a write within
+the last ``REPLICA_STICKY_SECONDS``: those read from the primary until the
+replicas have had time to catch up, so a client sees its own changes right
+away. A write sticks both its user, identified by the access token's
+subject, and its client IP, and a read goes to the primary if either is
+stuck: registering or logging in carries no token yet, but the requests
+that follow do.
+
+The sticky window is kept per process, like the in-memory rate limiter;
+multi-worker deployments should route each user to one worker or use a
+window that covers their replication lag across workers.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from auth.utils import get_token_subject
+from config import get_settings
+from database import replicas
+
+settings = get_settings()
+
+READ_METHODS = ("GET", "HEAD")
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(
+        self,
+        app,
+        sticky_seconds: Optional[float] = None,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.app = app
+        self.sticky_seconds = settings.REPLICA_STICKY_SECONDS if sticky_seconds is None else sticky_seconds
+        self.max_keys = max_keys
+        self.clock = clock
+        # Primary-only deadline per client, oldest first
+        self._sticky: "OrderedDict[str, float]" = OrderedDict()
+
+    @staticmethod
+    def _client_keys(scope) -> List[str]:
+        client = scope.get("client")
+        keys = [f"ip:{client[0] if client else 'unknown'}"]
+        for name, value in scope.get("headers", []):
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                username = get_token_subject(token) if scheme.lower() == "bearer" and token else None
+                if username:
+                    keys.append(f"user:{username}")
+        return keys
+
+    def _stick(self, keys: List[str]) -> None:
+        now = self.clock()
+        for key in keys:
+            self._sticky[key] = now + self.sticky_seconds
+            self._sticky.move_to_end(key)
+        # Deadlines share one length, so expired entries are at the front
+        while self._sticky and (len(self._sticky) > self.max_keys or next(iter(self._sticky.values())) <= now):
+            self._sticky.popitem(last=False)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not replicas.engines:
+            await self.app(scope, receive, send)
+            return
+
+        keys = self._client_keys(scope)
+        if scope["method"] in READ_METHODS:
+            now = self.clock()
+            scope.setdefault("state", {})["read_replica"] = all(self._sticky.get(key, 0) <= now for key in keys)
+            await self.app(scope, receive, send)
+            return
+
+        # The window restarts when the write finishes, so it covers the
+        # replication lag of what was just committed
+        self._stick(keys)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._stick(keys)
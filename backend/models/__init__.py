@@ -5,8 +5,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database import Base
 from .user import User
-from .activity import Activity, JournalEntry
+from .activity import Activity
+from .journal import Journal, JournalEntry, JournalTagCount
 from .task import Task, TaskStatus, TaskPriority
+from .task_dependency import task_dependencies
 from .project import Project
 from .refresh_token import RefreshToken
 from .password_reset import PasswordReset
@@ -15,10 +17,11 @@ from .log_entry import LogEntry  # Import LogEntry before Log
 from .log import Log
 from .concept import ConceptNote
 from .mindmap import Mindmap
+from .development import Goal, GoalProgress, Habit, HabitTracking
+from .change_log import ChangeLogEntry
 
-# Configure all mappers
-from sqlalchemy.orm import configure_mappers
-configure_mappers()
+# Mappers are configured at application startup (see main.py) rather than
+# on import, which keeps scripts and test collection fast
 
 __all__ = [
     "Base",
@@ -26,8 +29,11 @@ __all__ = [
     "Task",
     "TaskStatus",
     "TaskPriority",
+    "task_dependencies",
     "Activity",
     "JournalEntry",
+    "Journal",
+    "JournalTagCount",
     "Project",
     "RefreshToken",
     "PasswordReset",
@@ -35,5 +41,10 @@ __all__ = [
     "ConceptNote",
     "Log",
     "LogEntry",
-    "Mindmap"
+    "Mindmap",
+    "Goal",
+    "GoalProgress",
+    "Habit",
+    "HabitTracking",
+    "ChangeLogEntry"
 ]
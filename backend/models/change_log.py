@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from database import Base
+
+class ChangeLogEntry(Base):
+    """Latest change to a synced record; a user's entries in ``seq`` order drive delta sync."""
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_user_seq", "user_id", "seq"),
+        # One entry per record: older ones are replaced on every write
+        Index("ix_change_log_entity", "entity", "entity_id", unique=True),
+        # Never reuse a sequence number, even after the newest row is replaced
+        {'extend_existing': True, 'sqlite_autoincrement': True},
+    )
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    entity = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    action = Column(String(10), nullable=False)  # upsert, delete
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ChangeLogEntry {self.seq} {self.action} {self.entity}:{self.entity_id}>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, JSON, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Date, ForeignKey, Float, JSON, Boolean, LargeBinary, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -8,7 +8,7 @@ class Goal(Base):
     __table_args__ = {'extend_existing': True}
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     title = Column(String)
     description = Column(String)
     category = Column(String)
@@ -20,18 +20,22 @@ class Goal(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     user = relationship("User", back_populates="goals")
-    progress_updates = relationship("GoalProgress", back_populates="goal", cascade="all, delete-orphan")
+    progress_updates = relationship("GoalProgress", back_populates="goal", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class GoalProgress(Base):
     __tablename__ = "goal_progress"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_goal_progress_goal_timestamp", "goal_id", "timestamp"),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    goal_id = Column(Integer, ForeignKey("goals.id"))
-    progress = Column(Float)
+    goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"))
+    value = Column(Float)
     notes = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    data = Column(JSON, default={})
+    timestamp = Column(DateTime(timezone=True), server_default=func.now())
 
     goal = relationship("Goal", back_populates="progress_updates")
 
@@ -41,16 +45,21 @@ class Habit(Base):
     __table_args__ = {'extend_existing': True}
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     name = Column(String)
     description = Column(String, nullable=True)
     frequency = Column(String)  # daily, weekly, monthly
     target_days = Column(JSON, default=[])  # For weekly habits: ["monday", "wednesday", "friday"]
     streak = Column(Integer, default=0)
+    longest_streak = Column(Integer, default=0)
+    last_completed_on = Column(Date, nullable=True)
+    # One bit per day starting at bitmap_start, see services/habit_streaks.py
+    bitmap_start = Column(Date, nullable=True)
+    completion_bitmap = Column(LargeBinary, default=b"")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     user = relationship("User", back_populates="habits")
-    tracking = relationship("HabitTracking", back_populates="habit", cascade="all, delete-orphan")
+    tracking = relationship("HabitTracking", back_populates="habit", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class HabitTracking(Base):
@@ -58,7 +67,7 @@ class HabitTracking(Base):
     __table_args__ = {'extend_existing': True}
 
     id = Column(Integer, primary_key=True, index=True)
-    habit_id = Column(Integer, ForeignKey("habits.id"))
+    habit_id = Column(Integer, ForeignKey("habits.id", ondelete="CASCADE"))
     completed = Column(DateTime(timezone=True), server_default=func.now())
     notes = Column(String, nullable=True)
 
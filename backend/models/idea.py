@@ -30,12 +30,12 @@ class Idea(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Foreign Keys
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="ideas")
-    tags = relationship("Tag", secondary=idea_tags, back_populates="ideas")
-    projects = relationship("Project", secondary=project_ideas, back_populates="ideas")
+    tags = relationship("Tag", secondary=idea_tags, back_populates="ideas", passive_deletes=True)
+    projects = relationship("Project", secondary=project_ideas, back_populates="ideas", passive_deletes=True)
 
 class Tag(Base):
     __tablename__ = "tags"
@@ -44,4 +44,4 @@ class Tag(Base):
     name = Column(String(50), unique=True, nullable=False)
     
     # Relationships
-    ideas = relationship("Idea", secondary=idea_tags, back_populates="tags")
+    ideas = relationship("Idea", secondary=idea_tags, back_populates="tags", passive_deletes=True)
@@ -1,22 +1,40 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Table, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
 
+# Normalized copy of JournalEntry.tags so tag filters can use an index; the
+# JSON column stays the source the API serializes
+journal_entry_tags = Table(
+    "journal_entry_tags",
+    Base.metadata,
+    Column("entry_id", Integer, ForeignKey("journal_entries.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag", String(50), primary_key=True),
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Index("ix_journal_entry_tags_user_tag", "user_id", "tag", "entry_id"),
+)
+
 class JournalEntry(Base):
     __tablename__ = "journal_entries"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Serves the newest-first keyset pages and the per-journal last_entry_at lookup
+        Index("ix_journal_entries_journal_created", "journal_id", "created_at", "id"),
+        # The user's entries in timeline order
+        Index("ix_journal_entries_user_created", "user_id", "created_at", "id"),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
-    journal_id = Column(Integer, ForeignKey("journals.id"))
-    content = Column(String)
-    mood = Column(String, nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    # Entries created through /api/activities/journal are not filed in a journal
+    journal_id = Column(Integer, ForeignKey("journals.id", ondelete="CASCADE"), nullable=True, index=True)
+    content = Column(Text)
+    mood = Column(String(50), nullable=True)
     tags = Column(JSON, default=list)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    user = relationship("User", back_populates="journal_entries")
+    user = relationship("User", back_populates="journal_entries", lazy="joined")
     journal = relationship("Journal", back_populates="entries")
 
 class Journal(Base):
@@ -24,10 +42,27 @@ class Journal(Base):
     __table_args__ = {'extend_existing': True}
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     title = Column(String, nullable=False)
+    # Denormalized from the entries so journal lists need no aggregate
+    # queries; kept current by services.journal_stats
+    entry_count = Column(Integer, nullable=False, default=0, server_default="0")
+    word_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_entry_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     user = relationship("User", back_populates="journals")
-    entries = relationship("JournalEntry", back_populates="journal", cascade="all, delete-orphan")
+    entries = relationship("JournalEntry", back_populates="journal", cascade="all, delete-orphan", passive_deletes=True)
+
+class JournalTagCount(Base):
+    """Number of a user's journal entries carrying each tag, kept in step with journal_entry_tags."""
+    __tablename__ = "journal_tag_counts"
+    __table_args__ = (
+        Index("ix_journal_tag_counts_user_count", "user_id", "count"),
+        {'extend_existing': True},
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
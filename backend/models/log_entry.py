@@ -14,7 +14,7 @@ class LogEntry(Base):
     
     # Foreign Keys
     log_id = Column(Integer, ForeignKey("logs.id", ondelete="CASCADE"))
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     
     # Relationships
     log = relationship("Log", back_populates="entries")
@@ -8,6 +8,6 @@ class Mindmap(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     data = Column(JSON)
-    project_id = Column(Integer, ForeignKey("projects.id"))
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"))
     
     project = relationship("Project", back_populates="mindmaps")
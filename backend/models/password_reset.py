@@ -8,9 +8,10 @@ class PasswordReset(Base):
     __table_args__ = {'extend_existing': True}
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
-    reset_token = Column(String, unique=True, index=True)
-    expires_at = Column(DateTime(timezone=True))
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    # SHA-256 hex digest of the reset token; the raw token is never stored
+    reset_token_hash = Column(String(64), unique=True, index=True)
+    expires_at = Column(DateTime(timezone=True), index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     used_at = Column(DateTime(timezone=True), nullable=True)
 
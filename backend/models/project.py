@@ -42,19 +42,21 @@ class Project(Base):
     status = Column(SQLEnum(ProjectStatus), default=ProjectStatus.PLANNING)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Set when the project is deleted; its rows are purged in the background
+    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
     
     # Foreign Keys
     owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
     owner = relationship("User", back_populates="projects", lazy="joined")
-    members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan", lazy="dynamic")
-    tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan", lazy="dynamic")
-    activities = relationship("Activity", back_populates="project", cascade="all, delete-orphan", lazy="dynamic")
-    concept_notes = relationship("ConceptNote", back_populates="project", cascade="all, delete-orphan", lazy="dynamic")
-    ideas = relationship("Idea", secondary=project_ideas, back_populates="projects", lazy="dynamic")
-    mindmaps = relationship("Mindmap", back_populates="project", cascade="all, delete-orphan", lazy="dynamic")
-    logs = relationship("Log", back_populates="project", cascade="all, delete-orphan", lazy="dynamic")
+    members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="dynamic")
+    tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="dynamic")
+    activities = relationship("Activity", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="dynamic")
+    concept_notes = relationship("ConceptNote", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="dynamic")
+    ideas = relationship("Idea", secondary=project_ideas, back_populates="projects", passive_deletes=True, lazy="dynamic")
+    mindmaps = relationship("Mindmap", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="dynamic")
+    logs = relationship("Log", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="dynamic")
 
     def __repr__(self):
         return f"<Project {self.id}: {self.title}>"
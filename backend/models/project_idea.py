@@ -6,7 +6,7 @@ from datetime import datetime
 project_ideas = Table(
     "project_ideas",
     Base.metadata,
-    Column("project_id", Integer, ForeignKey("projects.id"), primary_key=True),
-    Column("idea_id", Integer, ForeignKey("ideas.id"), primary_key=True),
+    Column("project_id", Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("idea_id", Integer, ForeignKey("ideas.id", ondelete="CASCADE"), primary_key=True),
     Column("created_at", DateTime, nullable=False, default=datetime.utcnow),
 )
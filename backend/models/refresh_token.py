@@ -1,15 +1,20 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Covers verify_refresh_token's lookup without touching the table rows
+        Index("ix_refresh_tokens_lookup", "token_hash", "revoked", "expires_at"),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    token = Column(String, unique=True, index=True, nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    # SHA-256 hex digest of the token; the raw token is never stored
+    token_hash = Column(String(64), unique=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     revoked = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
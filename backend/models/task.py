@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -16,7 +16,13 @@ class TaskPriority(str, enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_tasks_user_created", "user_id", "created_at", "id"),
+        Index("ix_tasks_due_date", "due_date"),
+        # One materialized row per occurrence of a recurring task
+        Index("ix_tasks_recurrence", "recurrence_parent_id", "occurrence_date", unique=True),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(100), nullable=False)
@@ -27,6 +33,14 @@ class Task(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
+    # Due date the last reminder was sent for; a new due date re-arms it
+    reminder_sent_for = Column(DateTime, nullable=True)
+    # Recurring tasks are templates: an RRULE-style rule whose first
+    # occurrence is the due date. Occurrences stay virtual until completed
+    # or edited, which stores them as rows pointing back at the template
+    recurrence_rule = Column(String(255), nullable=True)
+    recurrence_parent_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True)
+    occurrence_date = Column(DateTime, nullable=True)
     
     # Foreign Keys
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
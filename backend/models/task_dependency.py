@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Table, Index
+from database import Base
+from datetime import datetime
+
+# Dependency edges between tasks of one project: task_id can't start until
+# depends_on_id is done
+task_dependencies = Table(
+    "task_dependencies",
+    Base.metadata,
+    Column("task_id", Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
+    Column("depends_on_id", Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
+    Column("created_at", DateTime, nullable=False, default=datetime.utcnow),
+    Index("ix_task_dependencies_depends_on", "depends_on_id"),
+)
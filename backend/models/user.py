@@ -17,17 +17,21 @@ class User(Base):
     last_login = Column(DateTime(timezone=True), nullable=True)
 
     # Essential relationships for auth
-    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
     # Core functionality relationships
-    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan", lazy='dynamic')
-    project_memberships = relationship("ProjectMember", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
-    tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
-    activities = relationship("Activity", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
-    journal_entries = relationship("JournalEntry", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
-    ideas = relationship("Idea", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
-    concept_notes = relationship("ConceptNote", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
-    logs = relationship("Log", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
-    log_entries = relationship("LogEntry", back_populates="user", cascade="all, delete-orphan", lazy='dynamic')
+    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    project_memberships = relationship("ProjectMember", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    activities = relationship("Activity", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    journal_entries = relationship("JournalEntry", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    journals = relationship("Journal", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    ideas = relationship("Idea", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    concept_notes = relationship("ConceptNote", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    logs = relationship("Log", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    log_entries = relationship("LogEntry", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    # Personal development relationships
+    goals = relationship("Goal", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
+    habits = relationship("Habit", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy='dynamic')
 
     def __repr__(self):
         return f"<User {self.username}>"
@@ -9,6 +9,13 @@ from .mindmaps import router as mindmaps_router
 from .logs import router as logs_router
 from .log_entries import router as log_entries_router
 from .bugs import router as bugs_router
+from .development import router as development_router
+from .journals import router as journals_router
+from .export import router as export_router
+from .imports import router as imports_router
+from .timeline import router as timeline_router
+from .events import router as events_router
+from .sync import router as sync_router
 
 __all__ = [
     'auth_router',
@@ -22,4 +29,11 @@ __all__ = [
     'logs_router',
     'log_entries_router',
     'bugs_router',
+    'development_router',
+    'journals_router',
+    'export_router',
+    'imports_router',
+    'timeline_router',
+    'events_router',
+    'sync_router',
 ]
@@ -15,6 +15,10 @@ from schemas.activity import (
     JournalEntryUpdate
 )
 from auth.utils import get_current_user
+from utils import schema_columns, SparseFields, sparse_response
+from services.journal_stats import adjust_journal_stats, count_words
+from services.journal_tags import entries_with_any_tag, remove_entry_tags, sync_entry_tags
+from services.events import publish_change
 
 router = APIRouter(tags=["activities"])
 
@@ -29,6 +33,7 @@ async def create_activity(
     db.add(db_activity)
     db.commit()
     db.refresh(db_activity)
+    publish_change("activity", "created", db_activity.id, current_user.id, db_activity.project_id, ActivitySchema.model_validate(db_activity))
     return db_activity
 
 @router.get("/activities", response_model=List[ActivitySchema])
@@ -37,10 +42,11 @@ async def get_activities(
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
     limit: int = Query(50, le=100),
+    fields: Optional[List[str]] = Depends(SparseFields(ActivitySchema)),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    query = db.query(Activity).filter(Activity.user_id == current_user.id)
+    query = db.query(*schema_columns(Activity, ActivitySchema, fields)).filter(Activity.user_id == current_user.id)
     
     if type:
         query = query.filter(Activity.type == type)
@@ -49,7 +55,8 @@ async def get_activities(
     if to_date:
         query = query.filter(Activity.timestamp <= to_date)
     
-    return query.order_by(desc(Activity.timestamp)).limit(limit).all()
+    activities = query.order_by(desc(Activity.timestamp)).limit(limit).all()
+    return sparse_response(activities, ActivitySchema, fields)
 
 # Journal endpoints
 @router.post("/journal", response_model=JournalEntrySchema)
@@ -60,6 +67,8 @@ async def create_journal_entry(
 ):
     db_entry = JournalEntry(**entry.dict(), user_id=current_user.id)
     db.add(db_entry)
+    db.flush()
+    sync_entry_tags(db, db_entry)
     db.commit()
     db.refresh(db_entry)
     return db_entry
@@ -84,7 +93,7 @@ async def get_journal_entries(
         query = query.filter(JournalEntry.mood == mood)
     if tags:
         # Filter entries that contain any of the specified tags
-        query = query.filter(JournalEntry.tags.contains(tags))
+        query = query.filter(JournalEntry.id.in_(entries_with_any_tag(current_user.id, tags)))
     
     return query.order_by(desc(JournalEntry.created_at)).limit(limit).all()
 
@@ -118,9 +127,14 @@ async def update_journal_entry(
     if not db_entry:
         raise HTTPException(status_code=404, detail="Journal entry not found")
     
+    old_tags = list(db_entry.tags or [])
+    old_words = count_words(db_entry.content)
     update_data = entry_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_entry, field, value)
+    sync_entry_tags(db, db_entry, old_tags)
+    if db_entry.journal_id is not None:
+        adjust_journal_stats(db, db_entry.journal_id, words=count_words(db_entry.content) - old_words)
     
     db.commit()
     db.refresh(db_entry)
@@ -140,6 +154,12 @@ async def delete_journal_entry(
     if not entry:
         raise HTTPException(status_code=404, detail="Journal entry not found")
     
+    remove_entry_tags(db, entry)
+    journal_id = entry.journal_id
+    words = count_words(entry.content)
     db.delete(entry)
+    db.flush()
+    if journal_id is not None:
+        adjust_journal_stats(db, journal_id, entries=-1, words=-words)
     db.commit()
     return {"message": "Journal entry deleted successfully"}
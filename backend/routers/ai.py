@@ -2,27 +2,24 @@ from fastapi import APIRouter, Depends, HTTPException, Body
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from pathlib import Path
+from functools import lru_cache
 
 from database import get_db
 from models.user import User
 from auth.utils import get_current_user
-from ai import (
-    config,
-    ModelManager,
-    DataProcessor,
-    IPMSAssistant
-)
 
 router = APIRouter(tags=["ai"])
 
-# Initialize AI components
-model_manager = ModelManager()
-data_processor = DataProcessor()
-assistant = IPMSAssistant(model_manager, data_processor)
+@lru_cache()
+def get_assistant():
+    """Build the AI assistant on first use instead of at import time"""
+    from ai import ModelManager, DataProcessor, IPMSAssistant
+    return IPMSAssistant(ModelManager(), DataProcessor())
 
 @router.post("/ai/initialize")
 async def initialize_ai(
     model_path: Optional[str] = None,
+    assistant = Depends(get_assistant),
     current_user: User = Depends(get_current_user)
 ):
     """Initialize or switch AI model"""
@@ -37,6 +34,7 @@ async def generate_response(
     prompt: str = Body(...),
     context_types: Optional[List[str]] = Body(None),
     max_length: Optional[int] = Body(None),
+    assistant = Depends(get_assistant),
     current_user: User = Depends(get_current_user)
 ):
     """Generate AI response with optional context"""
@@ -53,6 +51,7 @@ async def generate_response(
 @router.post("/ai/analyze/journal")
 async def analyze_journal_sentiment(
     entry: str = Body(...),
+    assistant = Depends(get_assistant),
     current_user: User = Depends(get_current_user)
 ):
     """Analyze sentiment of journal entry"""
@@ -65,6 +64,7 @@ async def analyze_journal_sentiment(
 @router.post("/ai/suggest/goals")
 async def get_goal_suggestions(
     user_data: Dict[str, Any] = Body(...),
+    assistant = Depends(get_assistant),
     current_user: User = Depends(get_current_user)
 ):
     """Get AI-generated goal suggestions"""
@@ -77,6 +77,7 @@ async def get_goal_suggestions(
 @router.post("/ai/categorize/activity")
 async def categorize_activity(
     activity_data: Dict[str, Any] = Body(...),
+    assistant = Depends(get_assistant),
     current_user: User = Depends(get_current_user)
 ):
     """Categorize activity using AI"""
@@ -90,6 +91,7 @@ async def categorize_activity(
 async def process_user_data(
     data_types: List[str] = Body(...),
     db: Session = Depends(get_db),
+    assistant = Depends(get_assistant),
     current_user: User = Depends(get_current_user)
 ):
     """Process user data for AI training"""
@@ -100,21 +102,21 @@ async def process_user_data(
             entries = db.query(JournalEntry).filter(
                 JournalEntry.user_id == current_user.id
             ).all()
-            documents.extend(data_processor.process_journal_entries(entries))
+            documents.extend(assistant.data_processor.process_journal_entries(entries))
         
         if "activity" in data_types:
             activities = db.query(Activity).filter(
                 Activity.user_id == current_user.id
             ).all()
-            documents.extend(data_processor.process_activities(activities))
+            documents.extend(assistant.data_processor.process_activities(activities))
         
         if "goal" in data_types:
             goals = db.query(Goal).filter(
                 Goal.user_id == current_user.id
             ).all()
-            documents.extend(data_processor.process_goals(goals))
+            documents.extend(assistant.data_processor.process_goals(goals))
         
-        data_processor.add_to_vectorstore(documents)
+        assistant.data_processor.add_to_vectorstore(documents)
         
         return {
             "message": f"Processed {len(documents)} documents",
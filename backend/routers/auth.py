@@ -11,6 +11,7 @@ load_dotenv()
 from database import get_db
 from models.user import User
 from models.refresh_token import RefreshToken
+from models.password_reset import PasswordReset
 from schemas.auth import (
     Token,
     UserCreate,
@@ -28,7 +29,8 @@ from auth.utils import (
     revoke_refresh_token,
     create_access_token,
     create_refresh_token,
-    store_refresh_token
+    store_refresh_token,
+    hash_token
 )
 from config import get_settings
 
@@ -289,7 +291,7 @@ def request_password_reset(
     # Save reset token
     reset = PasswordReset(
         user_id=user.id,
-        reset_token=token,
+        reset_token_hash=hash_token(token),
         expires_at=expires_at
     )
     db.add(reset)
@@ -309,7 +311,7 @@ def verify_password_reset(
     db: Session = Depends(get_db)
 ):
     reset = db.query(PasswordReset).filter(
-        PasswordReset.reset_token == verify_data.token,
+        PasswordReset.reset_token_hash == hash_token(verify_data.token),
         PasswordReset.used_at.is_(None),
         PasswordReset.expires_at > datetime.utcnow()
     ).first()
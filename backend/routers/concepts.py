@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 from database import get_db
@@ -8,6 +8,7 @@ from auth import get_current_user
 from models.user import User
 from models.concept import ConceptNote
 from schemas.concept import ConceptNoteCreate, ConceptNoteUpdate, ConceptNote as ConceptNoteSchema
+from utils import SparseFields, select_fields, sparse_response
 
 router = APIRouter(
     tags=["concepts"]
@@ -33,13 +34,16 @@ def create_concept_note(
 @router.get("/project/{project_id}", response_model=List[ConceptNoteSchema])
 def get_project_concepts(
     project_id: int,
+    fields: Optional[List[str]] = Depends(SparseFields(ConceptNoteSchema)),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    concepts = db.query(ConceptNote).filter(
-        ConceptNote.project_id == project_id
-    ).order_by(ConceptNote.created_at.desc()).all()
-    return concepts
+    query = select_fields(
+        db.query(ConceptNote).filter(ConceptNote.project_id == project_id),
+        ConceptNote, ConceptNoteSchema, fields
+    )
+    concepts = query.order_by(ConceptNote.created_at.desc()).all()
+    return sparse_response(concepts, ConceptNoteSchema, fields)
 
 @router.get("/{concept_id}", response_model=ConceptNoteSchema)
 def get_concept_note(
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, cast, literal, Integer
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date, timezone
+import calendar
 
 from database import get_db
 from models.development import Goal, GoalProgress, Habit, HabitTracking
@@ -13,16 +14,51 @@ from schemas.development import (
     GoalUpdate,
     GoalProgress as GoalProgressSchema,
     GoalProgressCreate,
+    GoalProgressSeries,
     Habit as HabitSchema,
     HabitCreate,
     HabitUpdate,
     HabitTracking as HabitTrackingSchema,
-    HabitTrackingCreate
+    HabitTrackingCreate,
+    HabitHeatmap
 )
 from auth.utils import get_current_user
+from services.habit_streaks import current_streak, record_completion, recompute_streaks, heatmap
 
 router = APIRouter(tags=["development"])
 
+# Progress value at which a goal counts as complete
+GOAL_COMPLETE_PROGRESS = 100.0
+SECONDS_PER_DAY = 86400.0
+
+def _epoch_seconds(db: Session, column):
+    """Build a dialect-specific SQL expression for a timestamp as Unix seconds."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return (func.julianday(column) - 2440587.5) * SECONDS_PER_DAY
+    if dialect == "postgresql":
+        return func.extract("epoch", column)
+    return func.unix_timestamp(column)
+
+def _to_epoch(value: datetime) -> float:
+    """Convert a datetime to Unix seconds, treating naive values as UTC."""
+    return calendar.timegm(value.utctimetuple()) + value.microsecond / 1e6
+
+def _from_epoch(seconds: float) -> datetime:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+def _timestamp_bound(db: Session, value: datetime) -> datetime:
+    """SQLite compares timestamps as text, so bounds there must be naive UTC like the stored values."""
+    if value.tzinfo is not None and db.get_bind().dialect.name == "sqlite":
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _habit_response(habit: Habit) -> HabitSchema:
+    """The habit with its streak as of today, which lapses once a scheduled period is missed."""
+    return HabitSchema.model_validate(habit).model_copy(
+        update={"current_streak": current_streak(habit, datetime.utcnow().date())}
+    )
+
 # Goal endpoints
 @router.post("/goals", response_model=GoalSchema)
 async def create_goal(
@@ -135,6 +171,110 @@ async def create_goal_progress(
     db.refresh(db_progress)
     return db_progress
 
+@router.get("/goals/{goal_id}/progress", response_model=GoalProgressSeries)
+async def get_goal_progress(
+    goal_id: int,
+    from_date: Optional[datetime] = Query(None, alias="from"),
+    to_date: Optional[datetime] = Query(None, alias="to"),
+    points: int = Query(100, ge=2, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Return a goal's progress history downsampled to at most ``points`` buckets.
+
+    Buckets are aggregated in SQL, so the payload stays bounded no matter how
+    many updates a goal has. Velocity is the least-squares slope over the
+    window, computed from SQL aggregates.
+    """
+    goal = db.query(Goal).filter(
+        Goal.id == goal_id,
+        Goal.user_id == current_user.id
+    ).first()
+    
+    if not goal:
+        raise HTTPException(status_code=404, detail="Goal not found")
+    
+    epoch = _epoch_seconds(db, GoalProgress.timestamp)
+    # Plain column comparisons, so the (goal_id, timestamp) index serves the range
+    filters = [GoalProgress.goal_id == goal_id]
+    if from_date:
+        filters.append(GoalProgress.timestamp >= _timestamp_bound(db, from_date))
+    if to_date:
+        filters.append(GoalProgress.timestamp <= _timestamp_bound(db, to_date))
+    
+    count, first_ts, last_ts = db.query(
+        func.count(GoalProgress.id),
+        func.min(epoch),
+        func.max(epoch)
+    ).filter(*filters).one()
+    
+    series = {
+        "goal_id": goal.id,
+        "start": from_date,
+        "end": to_date,
+        "total_updates": count,
+        "points": [],
+        "velocity_per_day": None,
+        "projected_completion": None
+    }
+    if not count:
+        return series
+    
+    start_ts = _to_epoch(from_date) if from_date else float(first_ts)
+    end_ts = _to_epoch(to_date) if to_date else float(last_ts)
+    series["start"] = _from_epoch(start_ts)
+    series["end"] = _from_epoch(end_ts)
+    
+    # Regression sums with x in days from the window start; raw epoch days
+    # (~2e4) would cancel most of the precision out of the denominator
+    x = (epoch - start_ts) / SECONDS_PER_DAY
+    y = GoalProgress.value
+    sum_x, sum_y, sum_xx, sum_xy = db.query(
+        func.sum(x),
+        func.sum(y),
+        func.sum(x * x),
+        func.sum(x * y)
+    ).filter(*filters).one()
+    
+    if count <= points:
+        rows = db.query(epoch, y, y, y, literal(1)).filter(
+            *filters
+        ).order_by(GoalProgress.timestamp).all()
+    else:
+        span = max(end_ts - start_ts, 1.0)
+        bucket = cast((epoch - start_ts) * points / span, Integer)
+        bucket = func.min(bucket, points - 1) if db.get_bind().dialect.name == "sqlite" else func.least(bucket, points - 1)
+        rows = db.query(
+            func.avg(epoch),
+            func.avg(y),
+            func.min(y),
+            func.max(y),
+            func.count(GoalProgress.id)
+        ).filter(*filters).group_by(bucket).order_by(bucket).all()
+    
+    series["points"] = [
+        {
+            "timestamp": _from_epoch(float(ts)),
+            "value": float(value),
+            "min": float(low),
+            "max": float(high),
+            "count": n
+        }
+        for ts, value, low, high, n in rows
+    ]
+    
+    denominator = count * sum_xx - sum_x * sum_x
+    if count > 1 and denominator > 0:
+        slope = (count * sum_xy - sum_x * sum_y) / denominator
+        intercept = (sum_y - slope * sum_x) / count
+        series["velocity_per_day"] = slope
+        if slope > 0 and (goal.progress or 0.0) < GOAL_COMPLETE_PROGRESS:
+            completion_day = (GOAL_COMPLETE_PROGRESS - intercept) / slope
+            series["projected_completion"] = _from_epoch(start_ts + completion_day * SECONDS_PER_DAY)
+    
+    return series
+
 # Habit endpoints
 @router.post("/habits", response_model=HabitSchema)
 async def create_habit(
@@ -146,7 +286,7 @@ async def create_habit(
     db.add(db_habit)
     db.commit()
     db.refresh(db_habit)
-    return db_habit
+    return _habit_response(db_habit)
 
 @router.get("/habits", response_model=List[HabitSchema])
 async def get_habits(
@@ -159,7 +299,7 @@ async def get_habits(
     if frequency:
         query = query.filter(Habit.frequency == frequency)
     
-    return query.order_by(Habit.created_at).all()
+    return [_habit_response(habit) for habit in query.order_by(Habit.created_at)]
 
 @router.put("/habits/{habit_id}", response_model=HabitSchema)
 async def update_habit(
@@ -180,9 +320,13 @@ async def update_habit(
     for field, value in update_data.items():
         setattr(db_habit, field, value)
     
+    # A schedule change redefines what counts as consecutive
+    if "frequency" in update_data or "target_days" in update_data:
+        recompute_streaks(db_habit)
+    
     db.commit()
     db.refresh(db_habit)
-    return db_habit
+    return _habit_response(db_habit)
 
 @router.post("/habits/{habit_id}/track", response_model=HabitTrackingSchema)
 async def track_habit(
@@ -201,17 +345,48 @@ async def track_habit(
         raise HTTPException(status_code=404, detail="Habit not found")
     
     # Create tracking entry
-    db_tracking = HabitTracking(**tracking.dict())
+    db_tracking = HabitTracking(**tracking.dict(exclude_none=True))
     db.add(db_tracking)
     
-    # Update habit streak
-    # TODO: Implement streak calculation based on frequency and target_days
-    habit.streak += 1
+    # Update the completion bitmap and streaks without scanning tracking rows
+    completed_on = (tracking.completed or datetime.utcnow()).date()
+    record_completion(habit, completed_on)
     
     db.commit()
     db.refresh(db_tracking)
     return db_tracking
 
+@router.get("/habits/{habit_id}/heatmap", response_model=HabitHeatmap)
+async def get_habit_heatmap(
+    habit_id: int,
+    year: Optional[int] = Query(None, ge=1970, le=9999),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Return daily completions for a calendar year, or the last 365 days."""
+    habit = db.query(Habit).filter(
+        Habit.id == habit_id,
+        Habit.user_id == current_user.id
+    ).first()
+    
+    if not habit:
+        raise HTTPException(status_code=404, detail="Habit not found")
+    
+    if year:
+        start, end = date(year, 1, 1), date(year, 12, 31)
+    else:
+        end = datetime.utcnow().date()
+        start = end - timedelta(days=364)
+    
+    days = heatmap(habit, start, end)
+    return {
+        "habit_id": habit.id,
+        "start": start,
+        "end": end,
+        "days": days,
+        "completed_days": sum(days)
+    }
+
 @router.delete("/habits/{habit_id}")
 async def delete_habit(
     habit_id: int,
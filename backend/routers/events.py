@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from typing import Optional
+import json
+
+from database import get_db
+from models.project import Project, ProjectMember
+from models.user import User
+from auth.utils import get_current_user
+from services.events import event_hub
+from config import get_settings
+
+settings = get_settings()
+
+router = APIRouter(tags=["events"])
+
+def _format_event(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    projects: Optional[str] = Query(None, description="Comma-separated project ids to follow besides your own records"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Server-sent events for changes to the current user's records and the given projects"""
+    try:
+        project_ids = {int(value) for value in projects.split(",") if value.strip()} if projects else set()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="projects must be comma-separated ids")
+
+    if project_ids:
+        accessible = {
+            project_id for (project_id,) in db.query(Project.id).filter(
+                Project.id.in_(project_ids),
+                Project.deleted_at.is_(None),
+                or_(
+                    Project.owner_id == current_user.id,
+                    Project.id.in_(db.query(ProjectMember.project_id).filter(ProjectMember.user_id == current_user.id))
+                )
+            )
+        }
+        if accessible != project_ids:
+            raise HTTPException(status_code=403, detail="Not authorized to follow these projects")
+
+    channels = [f"user:{current_user.id}"] + [f"project:{project_id}" for project_id in sorted(project_ids)]
+    # The stream can stay open for hours; don't hold a pooled connection for it
+    db.close()
+
+    async def event_stream():
+        subscription = event_hub.subscribe(channels)
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                batch = await subscription.next_batch(settings.EVENT_KEEPALIVE_SECONDS, settings.EVENT_COALESCE_SECONDS)
+                if not batch:
+                    # Comment line keeps proxies from timing the stream out
+                    yield ": keep-alive\n\n"
+                    continue
+                yield "".join(_format_event(event) for event in batch)
+        finally:
+            event_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
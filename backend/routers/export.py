@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from datetime import datetime
+
+from database import get_db
+from models.user import User
+from auth.utils import get_current_user
+from services.export import iter_ndjson, iter_zip
+
+router = APIRouter(tags=["export"])
+
+@router.get("")
+def export_data(
+    format: str = Query("ndjson", pattern="^(ndjson|zip)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream every record owned by the current user"""
+    stamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    if format == "zip":
+        body, media_type, filename = iter_zip(db, current_user.id), "application/zip", f"ipms-export-{stamp}.zip"
+    else:
+        body, media_type, filename = iter_ndjson(db, current_user.id), "application/x-ndjson", f"ipms-export-{stamp}.ndjson"
+    # The generators run in a worker thread as the client reads, so the
+    # first rows go out before the later queries have even started
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
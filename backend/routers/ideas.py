@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from database import get_db
 from models.idea import Idea, Tag
 from schemas.idea import IdeaCreate, IdeaUpdate, IdeaResponse, TagCreate, TagResponse
 from auth.utils import get_current_user
+from utils import SparseFields, select_fields, sparse_response
 
 router = APIRouter(tags=["ideas"])
 
@@ -42,7 +43,8 @@ def get_ideas(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user),
     status: str = None,
-    tag: str = None
+    tag: str = None,
+    fields: Optional[List[str]] = Depends(SparseFields(IdeaResponse))
 ):
     query = db.query(Idea).filter(Idea.user_id == current_user.id)
     
@@ -51,8 +53,8 @@ def get_ideas(
     if tag:
         query = query.join(Idea.tags).filter(Tag.name == tag)
     
-    ideas = query.all()
-    return ideas
+    query = select_fields(query, Idea, IdeaResponse, fields)
+    return sparse_response(query.all(), IdeaResponse, fields)
 
 @router.put("/{idea_id}", response_model=IdeaResponse)
 def update_idea(
@@ -120,7 +122,8 @@ def get_available_ideas(
 ):
     project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not project:
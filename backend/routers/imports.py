@@ -0,0 +1,39 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
+import shutil
+import tempfile
+
+from database import SessionLocal
+from models.user import User
+from auth.utils import get_current_user
+from schemas.imports import ImportJobResponse
+from services.imports import import_jobs, run_import
+
+router = APIRouter(tags=["import"])
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+@router.post("", response_model=ImportJobResponse, status_code=202)
+def start_import(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user)
+):
+    """Import an NDJSON or zip export into the current user's account"""
+    # The upload is copied to a file the job owns, since the request's own
+    # spooled file is closed once the response has been sent
+    with tempfile.NamedTemporaryFile(prefix="ipms-import-", delete=False) as spool:
+        shutil.copyfileobj(file.file, spool, COPY_CHUNK_SIZE)
+    job = import_jobs.create(current_user.id)
+    background_tasks.add_task(run_import, job, spool.name, SessionLocal)
+    return job
+
+@router.get("/{job_id}", response_model=ImportJobResponse)
+def get_import_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the progress of an import job"""
+    job = import_jobs.get(job_id)
+    if job is None or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
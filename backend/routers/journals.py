@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from database import get_db
-from models.journal import JournalEntry, Journal
-from schemas.journal import JournalEntryCreate, JournalEntryResponse, JournalCreate, JournalResponse
+from models.journal import JournalEntry, Journal, JournalTagCount
+from schemas.journal import JournalEntryCreate, JournalEntryResponse, JournalCreate, JournalResponse, JournalTagCountResponse
 from fastapi.security import OAuth2PasswordBearer
 from auth.utils import get_current_user
+from services.journal_tags import remove_entry_tags, sync_entry_tags
+from services.journal_stats import adjust_journal_stats, count_words
+from utils import schema_columns, keyset_page, NEXT_CURSOR_HEADER
 
 router = APIRouter(
     tags=["journals"],
@@ -35,7 +38,20 @@ async def list_journals(
     token: str = Depends(oauth2_scheme),
     current_user = Depends(get_current_user)
 ):
-    return db.query(Journal).filter(Journal.user_id == current_user.id).all()
+    # Entry counts and recency are stored on the journal, so this is one narrow query
+    return db.query(*schema_columns(Journal, JournalResponse)).filter(Journal.user_id == current_user.id).all()
+
+@router.get("/tags", response_model=List[JournalTagCountResponse])
+async def list_journal_tags(
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+    current_user = Depends(get_current_user)
+):
+    # Served from the maintained counters, so this never scans the entries
+    return db.query(JournalTagCount.tag, JournalTagCount.count).filter(
+        JournalTagCount.user_id == current_user.id
+    ).order_by(JournalTagCount.count.desc(), JournalTagCount.tag).limit(limit).all()
 
 @router.post("/{journal_id}/entries", response_model=JournalEntryResponse)
 async def create_journal_entry(
@@ -61,6 +77,9 @@ async def create_journal_entry(
         tags=entry.tags if entry.tags else []
     )
     db.add(db_entry)
+    db.flush()
+    sync_entry_tags(db, db_entry)
+    adjust_journal_stats(db, journal_id, entries=1, words=count_words(db_entry.content))
     db.commit()
     db.refresh(db_entry)
     return db_entry
@@ -68,6 +87,9 @@ async def create_journal_entry(
 @router.get("/{journal_id}/entries", response_model=List[JournalEntryResponse])
 async def get_journal_entries(
     journal_id: int,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme),
     current_user = Depends(get_current_user)
@@ -80,10 +102,15 @@ async def get_journal_entries(
     if not journal:
         raise HTTPException(status_code=404, detail="Journal not found")
 
-    return db.query(JournalEntry).filter(
+    # Newest first; the cursor for the following page comes back in a header
+    query = db.query(JournalEntry).filter(
         JournalEntry.journal_id == journal_id,
         JournalEntry.user_id == current_user.id
-    ).all()
+    )
+    entries, next_cursor = keyset_page(query, JournalEntry.created_at, JournalEntry.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return entries
 
 @router.get("/{journal_id}/entries/{entry_id}", response_model=JournalEntryResponse)
 async def get_journal_entry(
@@ -135,9 +162,13 @@ async def update_journal_entry(
     if not db_entry:
         raise HTTPException(status_code=404, detail="Journal entry not found")
     
+    old_tags = list(db_entry.tags or [])
+    old_words = count_words(db_entry.content)
     db_entry.content = entry_update.content
     db_entry.mood = entry_update.mood
     db_entry.tags = entry_update.tags if entry_update.tags else []
+    sync_entry_tags(db, db_entry, old_tags)
+    adjust_journal_stats(db, journal_id, words=count_words(db_entry.content) - old_words)
     
     db.commit()
     db.refresh(db_entry)
@@ -167,6 +198,10 @@ async def delete_journal_entry(
     if not db_entry:
         raise HTTPException(status_code=404, detail="Journal entry not found")
     
+    remove_entry_tags(db, db_entry)
+    words = count_words(db_entry.content)
     db.delete(db_entry)
+    db.flush()
+    adjust_journal_stats(db, journal_id, entries=-1, words=-words)
     db.commit()
     return {"message": "Journal entry deleted successfully"}
@@ -10,6 +10,8 @@ from models.log_entry import LogEntry
 from models.user import User
 from schemas.log_entry import LogEntryCreate, LogEntryUpdate, LogEntryResponse
 from auth.utils import get_current_user
+from utils import SparseFields, select_fields, sparse_response
+from services.events import publish_change
 
 router = APIRouter(tags=["log_entries"])
 
@@ -39,6 +41,7 @@ async def create_log_entry(
     db.add(db_entry)
     db.commit()
     db.refresh(db_entry)
+    publish_change("log_entry", "created", db_entry.id, current_user.id, data=LogEntryResponse.model_validate(db_entry))
     return db_entry
 
 
@@ -47,6 +50,7 @@ async def get_log_entries(
     log_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(SparseFields(LogEntryResponse)),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -60,11 +64,10 @@ async def get_log_entries(
     if not log:
         raise HTTPException(status_code=404, detail="Log not found")
     
-    entries = db.query(LogEntry).filter(
-        LogEntry.log_id == log_id
-    ).order_by(desc(LogEntry.created_at)).offset(skip).limit(limit).all()
+    query = select_fields(db.query(LogEntry).filter(LogEntry.log_id == log_id), LogEntry, LogEntryResponse, fields)
+    entries = query.order_by(desc(LogEntry.created_at)).offset(skip).limit(limit).all()
     
-    return entries
+    return sparse_response(entries, LogEntryResponse, fields)
 
 
 @router.put("/{log_id}/entries/{entry_id}", response_model=LogEntryResponse)
@@ -91,6 +94,7 @@ async def update_log_entry(
     entry.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(entry)
+    publish_change("log_entry", "updated", entry.id, current_user.id, data=LogEntryResponse.model_validate(entry))
     return entry
 
 
@@ -113,4 +117,5 @@ async def delete_log_entry(
     
     db.delete(entry)
     db.commit()
+    publish_change("log_entry", "deleted", entry_id, current_user.id)
     return {"message": "Log entry deleted successfully"}
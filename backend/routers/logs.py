@@ -9,6 +9,8 @@ from models.log import Log, LogType
 from models.user import User
 from schemas.log import LogCreate, LogUpdate, LogResponse
 from auth.utils import get_current_user
+from utils import SparseFields, select_fields, sparse_response
+from services.events import publish_change
 
 router = APIRouter(tags=["logs"])
 
@@ -27,6 +29,7 @@ async def create_log(
     db.add(db_log)
     db.commit()
     db.refresh(db_log)
+    publish_change("log", "created", db_log.id, current_user.id, db_log.project_id, LogResponse.model_validate(db_log))
     return db_log
 
 
@@ -36,6 +39,7 @@ async def get_logs(
     log_type: Optional[LogType] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(SparseFields(LogResponse)),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -47,7 +51,9 @@ async def get_logs(
     if log_type:
         query = query.filter(Log.log_type == log_type)
     
-    return query.order_by(desc(Log.created_at)).offset(skip).limit(limit).all()
+    query = select_fields(query, Log, LogResponse, fields)
+    logs = query.order_by(desc(Log.created_at)).offset(skip).limit(limit).all()
+    return sparse_response(logs, LogResponse, fields)
 
 
 @router.get("/{log_id}", response_model=LogResponse)
@@ -89,6 +95,7 @@ async def update_log(
     log.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(log)
+    publish_change("log", "updated", log.id, current_user.id, log.project_id, LogResponse.model_validate(log))
     return log
 
 
@@ -107,6 +114,8 @@ async def delete_log(
     if not log:
         raise HTTPException(status_code=404, detail="Log not found")
     
+    project_id = log.project_id
     db.delete(log)
     db.commit()
+    publish_change("log", "deleted", log_id, current_user.id, project_id)
     return {"message": "Log deleted successfully"}
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from database import get_db
 from models.mindmap import Mindmap
+from services.events import publish_change
 from pydantic import BaseModel
 import logging
 
@@ -34,6 +35,7 @@ def create_mindmap(mindmap: MindmapCreate, db: Session = Depends(get_db)):
         db.commit()
         db.refresh(db_mindmap)
         logger.info(f"Successfully created mindmap with id: {db_mindmap.id}")
+        publish_change("mindmap", "created", db_mindmap.id, project_id=db_mindmap.project_id, data=MindmapResponse.model_validate(db_mindmap))
         return db_mindmap
     except Exception as e:
         logger.error(f"Error creating mindmap: {str(e)}")
@@ -79,6 +81,7 @@ def update_mindmap(mindmap_id: int, mindmap: MindmapBase, db: Session = Depends(
         db.refresh(db_mindmap)
         logger.info(f"Successfully updated mindmap {mindmap_id}")
         logger.debug(f"New mindmap state: {db_mindmap.__dict__}")
+        publish_change("mindmap", "updated", db_mindmap.id, project_id=db_mindmap.project_id, data=MindmapResponse.model_validate(db_mindmap))
         return db_mindmap
     except Exception as e:
         logger.error(f"Error updating mindmap {mindmap_id}: {str(e)}")
@@ -94,9 +97,11 @@ def delete_mindmap(mindmap_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Mindmap not found")
     
     try:
+        project_id = mindmap.project_id
         db.delete(mindmap)
         db.commit()
         logger.info(f"Successfully deleted mindmap {mindmap_id}")
+        publish_change("mindmap", "deleted", mindmap_id, project_id=project_id)
         return {"message": "Mindmap deleted successfully"}
     except Exception as e:
         logger.error(f"Error deleting mindmap {mindmap_id}: {str(e)}")
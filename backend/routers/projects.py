@@ -11,12 +11,14 @@ from models.idea import Idea
 from models.concept import ConceptNote
 from models.activity import Activity
 from schemas.project import ProjectCreate, ProjectUpdate, Project as ProjectSchema, ProjectMember as ProjectMemberSchema
-from schemas.task import TaskResponse
+from schemas.task import TaskResponse, ProjectSchedule
 from schemas.idea import IdeaResponse
 from schemas.concept import ConceptNote as ConceptNoteSchema
 from schemas.activity import Activity as ActivitySchema
 from auth.utils import get_current_user
 from models.user import User
+from utils import schema_columns, SparseFields, sparse_response
+from services.task_graph import task_graphs
 
 router = APIRouter()
 
@@ -42,11 +44,15 @@ def get_projects(
     limit: int = Query(10, ge=1, le=100),
     sort_by: Optional[Literal["created_at", "updated_at", "title", "status"]] = None,
     sort_order: Optional[Literal["asc", "desc"]] = "desc",
+    fields: Optional[List[str]] = Depends(SparseFields(ProjectSchema)),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     try:
-        query = db.query(Project).filter(Project.owner_id == current_user.id)
+        query = db.query(*schema_columns(Project, ProjectSchema, fields)).filter(
+            Project.owner_id == current_user.id,
+            Project.deleted_at.is_(None)
+        )
         
         if status:
             query = query.filter(Project.status == status)
@@ -68,7 +74,7 @@ def get_projects(
         
         # Execute query with pagination
         projects = query.offset(skip).limit(limit).all()
-        return projects
+        return sparse_response(projects, ProjectSchema, fields)
         
     except HTTPException as he:
         raise he
@@ -86,7 +92,8 @@ def get_project(
 ):
     project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not project:
@@ -102,7 +109,8 @@ def get_project_tasks(
 ):
     project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not project:
@@ -114,6 +122,59 @@ def get_project_tasks(
     
     return tasks
 
+def _owned_project(db: Session, project_id: int, user_id: int) -> Project:
+    project = db.query(Project).filter(
+        Project.id == project_id,
+        Project.owner_id == user_id,
+        Project.deleted_at.is_(None)
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
+
+def _tasks_in_order(db: Session, ids: List[int]) -> List[Task]:
+    tasks = {task.id: task for task in db.query(Task).filter(Task.id.in_(ids))} if ids else {}
+    return [tasks[id] for id in ids if id in tasks]
+
+@router.get("/{project_id}/schedule", response_model=ProjectSchedule)
+def get_project_schedule(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Dependency state, critical path, float and due-date slack of the project's tasks"""
+    _owned_project(db, project_id, current_user.id)
+    with task_graphs.get(db, project_id) as graph:
+        return {
+            "length": graph.length(),
+            "critical_path": graph.critical_path(),
+            "tasks": graph.schedule(),
+        }
+
+@router.get("/{project_id}/tasks/ready", response_model=List[TaskResponse])
+def get_ready_tasks(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Open tasks whose prerequisites are all done, in dependency order"""
+    _owned_project(db, project_id, current_user.id)
+    with task_graphs.get(db, project_id) as graph:
+        ready = graph.ready()
+    return _tasks_in_order(db, ready)
+
+@router.get("/{project_id}/tasks/blocked", response_model=List[TaskResponse])
+def get_blocked_tasks(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Open tasks waiting for at least one open prerequisite, in dependency order"""
+    _owned_project(db, project_id, current_user.id)
+    with task_graphs.get(db, project_id) as graph:
+        blocked = graph.blocked()
+    return _tasks_in_order(db, blocked)
+
 @router.get("/{project_id}/ideas", response_model=List[IdeaResponse])
 def get_project_ideas(
     project_id: int,
@@ -122,7 +183,8 @@ def get_project_ideas(
 ):
     project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not project:
@@ -138,7 +200,8 @@ def get_project_concept_notes(
 ):
     project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not project:
@@ -156,14 +219,16 @@ def get_project_members(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    owner_id = db.query(Project.owner_id).filter(Project.id == project_id, Project.deleted_at.is_(None)).scalar()
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    if project.owner_id != current_user.id:
+    if owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view project members")
     
-    members = db.query(ProjectMember).filter(ProjectMember.project_id == project_id).all()
+    members = db.query(*schema_columns(ProjectMember, ProjectMemberSchema)).filter(
+        ProjectMember.project_id == project_id
+    ).all()
     return members
 
 @router.get("/{project_id}/activities", response_model=List[ActivitySchema])
@@ -176,17 +241,17 @@ async def get_project_activities(
 ):
     try:
         # Check if project exists
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
+        owner_id = db.query(Project.owner_id).filter(Project.id == project_id, Project.deleted_at.is_(None)).scalar()
+        if owner_id is None:
             raise HTTPException(status_code=404, detail="Project not found")
         
         # Check if user has access to project
-        if project.owner_id != current_user.id:
+        if owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not authorized to view project activities")
         
         # Get activities with error handling
         activities = (
-            db.query(Activity)
+            db.query(*schema_columns(Activity, ActivitySchema))
             .filter(Activity.project_id == project_id)
             .order_by(desc(Activity.timestamp))
             .offset(skip)
@@ -219,7 +284,8 @@ def link_idea_to_project(
 ):
     project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not project:
@@ -248,7 +314,8 @@ def unlink_idea_from_project(
 ):
     project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not project:
@@ -277,7 +344,8 @@ def update_project(
 ):
     db_project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not db_project:
@@ -298,12 +366,15 @@ def delete_project(
 ):
     db_project = db.query(Project).filter(
         Project.id == project_id,
-        Project.owner_id == current_user.id
+        Project.owner_id == current_user.id,
+        Project.deleted_at.is_(None)
     ).first()
     
     if not db_project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    db.delete(db_project)
+    # Tombstone only; tasks, activities and the rest are purged in bounded
+    # batches by a maintenance job, so this returns at once for any size
+    db_project.deleted_at = datetime.utcnow()
     db.commit()
     return {"message": "Project deleted successfully"}
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models.user import User
+from auth.utils import get_current_user
+from schemas.sync import SyncResponse
+from services.sync import changes_since
+
+router = APIRouter(tags=["sync"])
+
+@router.get("", response_model=SyncResponse)
+def sync_changes(
+    since: int = Query(0, ge=0, description="next_since from the previous sync; 0 for a full sync"),
+    limit: int = Query(500, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Records created, updated or deleted since the given sequence number"""
+    changes, next_since, has_more = changes_since(db, current_user.id, since, limit)
+    return {"changes": changes, "next_since": next_since, "has_more": has_more}
@@ -1,29 +1,152 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import and_, or_, desc, asc, delete, func, select, update
 from typing import List, Optional
+import enum
 from datetime import datetime, timedelta
 
 from database import get_db
-from models.task import Task
+from models.task import Task, TaskStatus
+from models.task_dependency import task_dependencies
+from models.project import Project
 from models.user import User
-from schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskSelection, TaskBulkUpdate, TaskBulkResult, TaskDependencyCreate
 from auth.utils import get_current_user
+from utils import SparseFields, select_fields, sparse_response
+from services.events import publish_change
+from services.sync import record_changes
+from services.task_graph import DependencyCycleError, task_graphs
+from services.recurrence import expand, parse_rule
 
 router = APIRouter(
     tags=["tasks"]
 )
 
+def _filter_conditions(
+    status=None,
+    priority=None,
+    project_id=None,
+    due_date_from=None,
+    due_date_to=None,
+    search=None
+) -> list:
+    conditions = []
+    if status:
+        conditions.append(Task.status == status)
+    if priority:
+        conditions.append(Task.priority == priority)
+    if project_id:
+        conditions.append(Task.project_id == project_id)
+    if due_date_from:
+        conditions.append(Task.due_date >= due_date_from)
+    if due_date_to:
+        conditions.append(Task.due_date <= due_date_to)
+    if search:
+        conditions.append(or_(
+            Task.title.ilike(f"%{search}%"),
+            Task.description.ilike(f"%{search}%")
+        ))
+    return conditions
+
+def _selection_conditions(selection: TaskSelection, user_id: int) -> list:
+    """WHERE clauses for a bulk request: always the user's own tasks, by ids or by filter."""
+    if (selection.ids is None) == (selection.filter is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or filter")
+    if selection.ids is not None:
+        return [Task.user_id == user_id, Task.id.in_(selection.ids)]
+    conditions = _filter_conditions(**selection.filter.dict())
+    if not conditions:
+        # An empty filter would select every task the user has
+        raise HTTPException(status_code=400, detail="Filter must set at least one criterion")
+    return [Task.user_id == user_id, *conditions]
+
+def _check_recurrence(rule: Optional[str], due_date: Optional[datetime]) -> None:
+    if rule is None:
+        return
+    try:
+        parse_rule(rule)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid recurrence rule: {e}")
+    if due_date is None:
+        raise HTTPException(status_code=400, detail="Recurring tasks need a due date for their first occurrence")
+
+def _virtual_occurrences(
+    db: Session,
+    user_id: int,
+    priority=None,
+    search=None,
+    due_date_from=None,
+    due_date_to=None
+) -> list:
+    """Occurrences of the user's recurring tasks in the window that haven't been stored as rows"""
+    templates = db.query(Task).filter(
+        Task.user_id == user_id,
+        Task.recurrence_rule.is_not(None),
+        # A recurring task that was set to done has no further occurrences
+        Task.status != TaskStatus.DONE,
+        Task.due_date <= due_date_to,
+        *_filter_conditions(None, priority, None, None, None, search)
+    ).all()
+    if not templates:
+        return []
+    # Only the window's stored occurrences, a range scan of ix_tasks_recurrence
+    window = [Task.occurrence_date <= due_date_to]
+    if due_date_from:
+        window.append(Task.occurrence_date >= due_date_from)
+    stored = set(db.query(Task.recurrence_parent_id, Task.occurrence_date).filter(
+        Task.recurrence_parent_id.in_([template.id for template in templates]),
+        *window
+    ))
+    occurrences = []
+    for template in templates:
+        for occurrence in expand(template.recurrence_rule, template.due_date, due_date_from, due_date_to):
+            if (template.id, occurrence) in stored:
+                continue
+            occurrences.append({
+                **{column.name: getattr(template, column.name) for column in Task.__table__.columns},
+                # Not a row of its own until edited, so it mustn't be
+                # mistaken for the recurring task
+                "id": None,
+                "status": TaskStatus.TODO,
+                "due_date": occurrence,
+                "completed_at": None,
+                "recurrence_parent_id": template.id,
+                "occurrence_date": occurrence,
+            })
+    return occurrences
+
+def _delete_occurrences(db: Session, user_id: int, template_ids) -> list:
+    """
+    Log deletes for the stored occurrences of the given recurring tasks, ahead
+    of deleting the tasks, which removes the occurrences in the database
+    without leaving change log entries. Returns the (id, project_id) rows.
+    """
+    rows = db.execute(
+        select(Task.id, Task.project_id).where(Task.recurrence_parent_id.in_(template_ids))
+    ).all()
+    record_changes(db.connection(), user_id, "task", [row.id for row in rows], "delete")
+    return rows
+
+def _sort_value(task, column: str):
+    value = task[column] if isinstance(task, dict) else getattr(task, column)
+    # Enums sort by name, as they are stored
+    if isinstance(value, enum.Enum):
+        value = value.name
+    return (0,) if value is None else (1, value)
+
 @router.post("/", response_model=TaskResponse)
 def create_task(
     task: TaskCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    _check_recurrence(task.recurrence_rule, task.due_date)
     db_task = Task(**task.dict(), user_id=current_user.id)
     db.add(db_task)
     db.commit()
     db.refresh(db_task)
+    publish_change("task", "created", db_task.id, current_user.id, db_task.project_id, TaskResponse.model_validate(db_task))
     return db_task
 
 @router.get("/", response_model=List[TaskResponse])
@@ -35,26 +158,19 @@ async def get_tasks(
     search: Optional[str] = None,
     sort_by: Optional[str] = Query(None, enum=["due_date", "priority", "status", "created_at"]),
     sort_order: Optional[str] = Query("asc", enum=["asc", "desc"]),
+    fields: Optional[List[str]] = Depends(SparseFields(TaskResponse)),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    query = db.query(Task).filter(Task.user_id == current_user.id)
-
-    # Apply filters
-    if status:
-        query = query.filter(Task.status == status)
-    if priority:
-        query = query.filter(Task.priority == priority)
-    if due_date_from:
-        query = query.filter(Task.due_date >= due_date_from)
-    if due_date_to:
-        query = query.filter(Task.due_date <= due_date_to)
-    if search:
-        search_filter = or_(
-            Task.title.ilike(f"%{search}%"),
-            Task.description.ilike(f"%{search}%")
-        )
-        query = query.filter(search_filter)
+    query = db.query(Task).filter(
+        Task.user_id == current_user.id,
+        *_filter_conditions(status, priority, None, due_date_from, due_date_to, search)
+    )
+    # With an upper bound on the due date, recurring tasks are listed as
+    # their occurrences in the window instead of as themselves
+    expanding = due_date_to is not None
+    if expanding:
+        query = query.filter(Task.recurrence_rule.is_(None))
 
     # Apply sorting
     if sort_by:
@@ -67,7 +183,78 @@ async def get_tasks(
         # Default sorting by created_at desc
         query = query.order_by(desc(Task.created_at))
 
-    return query.all()
+    if not expanding:
+        query = select_fields(query, Task, TaskResponse, fields)
+        return sparse_response(query.all(), TaskResponse, fields)
+
+    tasks = query.all()
+    if status in (None, TaskStatus.TODO.value):
+        occurrences = _virtual_occurrences(db, current_user.id, priority, search, due_date_from, due_date_to)
+        if occurrences:
+            tasks = sorted(
+                tasks + occurrences,
+                key=lambda task: _sort_value(task, sort_by or "created_at"),
+                reverse=(sort_order == "desc") if sort_by else True
+            )
+    return sparse_response(tasks, TaskResponse, fields)
+
+@router.patch("/bulk", response_model=TaskBulkResult)
+def bulk_update_tasks(
+    bulk_update: TaskBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Apply the same changes to many tasks in one UPDATE and return the ids that changed"""
+    conditions = _selection_conditions(bulk_update, current_user.id)
+    values = bulk_update.changes.dict(exclude_unset=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="No changes given")
+    if "recurrence_rule" in values:
+        raise HTTPException(status_code=400, detail="Recurrence rules can't be changed in bulk")
+    if values.get("project_id") is not None:
+        owner_id = db.query(Project.owner_id).filter(
+            Project.id == values["project_id"],
+            Project.deleted_at.is_(None)
+        ).scalar()
+        if owner_id != current_user.id:
+            raise HTTPException(status_code=404, detail="Project not found")
+    if values.get("status") == TaskStatus.DONE:
+        # Keep the first completion time, like single updates do
+        values["completed_at"] = func.coalesce(Task.completed_at, datetime.utcnow())
+
+    rows = db.execute(
+        update(Task).where(*conditions).values(**values)
+        .returning(*Task.__table__.columns)
+        .execution_options(synchronize_session=False)
+    ).all()
+    ids = [row.id for row in rows]
+    # Core statements skip the ORM flush hook that feeds the change log
+    record_changes(db.connection(), current_user.id, "task", ids)
+    db.commit()
+    for row in rows:
+        publish_change("task", "updated", row.id, current_user.id, row.project_id, TaskResponse.model_validate(row))
+    return {"ids": sorted(ids)}
+
+@router.delete("/bulk", response_model=TaskBulkResult)
+def bulk_delete_tasks(
+    selection: TaskSelection,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Delete many tasks in one statement and return the ids that were deleted"""
+    conditions = _selection_conditions(selection, current_user.id)
+    occurrences = _delete_occurrences(db, current_user.id, select(Task.id).where(*conditions).correlate(None))
+    rows = db.execute(
+        delete(Task).where(*conditions)
+        .returning(Task.id, Task.project_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    ids = [row.id for row in rows]
+    record_changes(db.connection(), current_user.id, "task", ids, "delete")
+    db.commit()
+    for row in [*rows, *occurrences]:
+        publish_change("task", "deleted", row.id, current_user.id, row.project_id)
+    return {"ids": sorted(ids)}
 
 @router.get("/{task_id}", response_model=TaskResponse)
 def get_task(
@@ -98,6 +285,14 @@ def update_task(
         raise HTTPException(status_code=404, detail="Task not found")
     
     update_data = task_update.dict(exclude_unset=True)
+    recurrence_rule = update_data.get("recurrence_rule", db_task.recurrence_rule)
+    _check_recurrence(recurrence_rule, update_data.get("due_date", db_task.due_date))
+    if "status" in update_data and recurrence_rule is not None:
+        # A recurring task's status would apply to its whole series
+        raise HTTPException(
+            status_code=400,
+            detail="Set the status of one occurrence through its occurrence endpoint, or clear the recurrence rule to end the series"
+        )
     for field, value in update_data.items():
         setattr(db_task, field, value)
     
@@ -106,6 +301,7 @@ def update_task(
     
     db.commit()
     db.refresh(db_task)
+    publish_change("task", "updated", db_task.id, current_user.id, db_task.project_id, TaskResponse.model_validate(db_task))
     return db_task
 
 @router.delete("/{task_id}")
@@ -121,6 +317,152 @@ def delete_task(
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    project_id = db_task.project_id
+    occurrences = _delete_occurrences(db, current_user.id, [task_id])
     db.delete(db_task)
     db.commit()
+    publish_change("task", "deleted", task_id, current_user.id, project_id)
+    for row in occurrences:
+        publish_change("task", "deleted", row.id, current_user.id, row.project_id)
     return {"message": "Task deleted successfully"}
+
+@router.put("/{task_id}/occurrences/{occurrence_date}", response_model=TaskResponse)
+def update_task_occurrence(
+    task_id: int,
+    occurrence_date: datetime,
+    task_update: TaskUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Complete or edit one occurrence of a recurring task, storing it as its own task"""
+    template = db.query(Task).filter(
+        Task.id == task_id,
+        Task.user_id == current_user.id,
+        Task.recurrence_rule.is_not(None)
+    ).first()
+    if template is None:
+        raise HTTPException(status_code=404, detail="Recurring task not found")
+    occurrences = expand(template.recurrence_rule, template.due_date, occurrence_date, occurrence_date)
+    if not occurrences:
+        raise HTTPException(status_code=404, detail="Occurrence not found")
+    update_data = task_update.dict(exclude_unset=True)
+    if update_data.get("recurrence_rule") is not None:
+        raise HTTPException(status_code=400, detail="Occurrences can't recur themselves")
+
+    stored = db.query(Task).filter(
+        Task.recurrence_parent_id == template.id,
+        Task.occurrence_date == occurrences[0]
+    )
+    db_task = stored.first()
+    created = db_task is None
+    if created:
+        db_task = Task(
+            title=template.title,
+            description=template.description,
+            priority=template.priority,
+            due_date=occurrences[0],
+            project_id=template.project_id,
+            user_id=current_user.id,
+            recurrence_parent_id=template.id,
+            occurrence_date=occurrences[0]
+        )
+        db.add(db_task)
+        try:
+            db.flush()
+        except IntegrityError:
+            # A concurrent first edit stored the occurrence after our lookup;
+            # nothing else was written yet, so edit its row instead
+            db.rollback()
+            db_task = stored.one()
+            created = False
+    for field, value in update_data.items():
+        setattr(db_task, field, value)
+    if task_update.status == "done" and db_task.completed_at is None:
+        db_task.completed_at = datetime.utcnow()
+
+    db.commit()
+    db.refresh(db_task)
+    publish_change(
+        "task", "created" if created else "updated", db_task.id, current_user.id, db_task.project_id,
+        TaskResponse.model_validate(db_task)
+    )
+    return db_task
+
+def _prerequisites(db: Session, task_id: int) -> List[Task]:
+    return db.query(Task).join(
+        task_dependencies, task_dependencies.c.depends_on_id == Task.id
+    ).filter(task_dependencies.c.task_id == task_id).order_by(Task.id).all()
+
+@router.get("/{task_id}/dependencies", response_model=List[TaskResponse])
+def get_task_dependencies(
+    task_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Tasks that must be done before this one can start"""
+    db_task = db.query(Task).filter(
+        Task.id == task_id,
+        Task.user_id == current_user.id
+    ).first()
+    if db_task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return _prerequisites(db, task_id)
+
+@router.post("/{task_id}/dependencies", response_model=List[TaskResponse])
+def add_task_dependency(
+    task_id: int,
+    dependency: TaskDependencyCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    db_task = db.query(Task).filter(
+        Task.id == task_id,
+        Task.user_id == current_user.id
+    ).first()
+    prerequisite = db.query(Task).filter(
+        Task.id == dependency.depends_on_id,
+        Task.user_id == current_user.id
+    ).first()
+    if db_task is None or prerequisite is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if prerequisite.project_id != db_task.project_id:
+        raise HTTPException(status_code=400, detail="Dependencies must be between tasks of the same project")
+
+    # The edge reaches the cached graph through the change log entry below
+    with task_graphs.get(db, db_task.project_id) as graph:
+        exists = dependency.depends_on_id in graph.preds[task_id]
+        try:
+            graph.check_dependency(task_id, dependency.depends_on_id)
+        except DependencyCycleError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if not exists:
+        db.execute(task_dependencies.insert().values(task_id=task_id, depends_on_id=dependency.depends_on_id))
+        record_changes(db.connection(), current_user.id, "task", [task_id])
+        db.commit()
+        publish_change("task", "updated", task_id, current_user.id, db_task.project_id, TaskResponse.model_validate(db_task))
+    return _prerequisites(db, task_id)
+
+@router.delete("/{task_id}/dependencies/{depends_on_id}")
+def remove_task_dependency(
+    task_id: int,
+    depends_on_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    db_task = db.query(Task).filter(
+        Task.id == task_id,
+        Task.user_id == current_user.id
+    ).first()
+    if db_task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    result = db.execute(task_dependencies.delete().where(
+        task_dependencies.c.task_id == task_id,
+        task_dependencies.c.depends_on_id == depends_on_id
+    ))
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Dependency not found")
+    record_changes(db.connection(), current_user.id, "task", [task_id])
+    db.commit()
+    publish_change("task", "updated", task_id, current_user.id, db_task.project_id, TaskResponse.model_validate(db_task))
+    return {"message": "Dependency removed successfully"}
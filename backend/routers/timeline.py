@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+
+from database import get_db
+from models.user import User
+from auth.utils import get_current_user
+from schemas.timeline import TimelineItem
+from services.timeline import TIMELINE_SOURCES, timeline_page
+from utils import decode_cursor, encode_cursor, NEXT_CURSOR_HEADER
+
+router = APIRouter(tags=["timeline"])
+
+@router.get("", response_model=List[TimelineItem])
+def get_timeline(
+    response: Response,
+    from_date: Optional[datetime] = Query(None, alias="from"),
+    to_date: Optional[datetime] = Query(None, alias="to"),
+    types: Optional[str] = Query(None, description="Comma-separated item types; all types when omitted"),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Tasks, activities, logs and journal entries in one newest-first feed"""
+    selected = list(TIMELINE_SOURCES)
+    if types:
+        selected = [name.strip() for name in types.split(",") if name.strip()]
+        unknown = set(selected) - set(TIMELINE_SOURCES)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown types: {', '.join(sorted(unknown))}. "
+                       f"Available: {', '.join(TIMELINE_SOURCES)}"
+            )
+
+    position = None
+    if cursor:
+        position = decode_cursor(cursor, (str, int))
+        if position[1] not in TIMELINE_SOURCES:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    items, next_position = timeline_page(db, current_user.id, selected, from_date, to_date, position, limit)
+    if next_position:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*next_position)
+    return items
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, List, Any
-from datetime import datetime
+from datetime import datetime, date
 
 class GoalBase(BaseModel):
     title: str
@@ -25,7 +25,7 @@ class Goal(GoalBase):
     user_id: int
     progress: float
     created_at: datetime
-    updated_at: datetime
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -46,6 +46,22 @@ class GoalProgress(GoalProgressBase):
     class Config:
         from_attributes = True
 
+class GoalProgressPoint(BaseModel):
+    timestamp: datetime
+    value: float
+    min: float
+    max: float
+    count: int
+
+class GoalProgressSeries(BaseModel):
+    goal_id: int
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    total_updates: int
+    points: List[GoalProgressPoint]
+    velocity_per_day: Optional[float] = None
+    projected_completion: Optional[datetime] = None
+
 class HabitBase(BaseModel):
     name: str
     description: Optional[str] = None
@@ -65,6 +81,9 @@ class Habit(HabitBase):
     id: int
     user_id: int
     streak: int
+    current_streak: int = 0
+    longest_streak: int = 0
+    last_completed_on: Optional[date] = None
     created_at: datetime
 
     class Config:
@@ -75,6 +94,7 @@ class HabitTrackingBase(BaseModel):
 
 class HabitTrackingCreate(HabitTrackingBase):
     habit_id: int
+    completed: Optional[datetime] = None
 
 class HabitTracking(HabitTrackingBase):
     id: int
@@ -83,3 +103,10 @@ class HabitTracking(HabitTrackingBase):
 
     class Config:
         from_attributes = True
+
+class HabitHeatmap(BaseModel):
+    habit_id: int
+    start: date
+    end: date
+    days: List[int]
+    completed_days: int
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class ImportJobResponse(BaseModel):
+    id: str
+    status: str  # pending, running, completed, failed
+    progress: float
+    bytes_read: int
+    total_bytes: int
+    imported: Dict[str, int]
+    skipped: int
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -23,6 +23,13 @@ class JournalEntryResponse(JournalEntryBase):
     class Config:
         from_attributes = True
 
+class JournalTagCountResponse(BaseModel):
+    tag: str
+    count: int
+
+    class Config:
+        from_attributes = True
+
 class JournalBase(BaseModel):
     title: str
 
@@ -35,6 +42,9 @@ class JournalUpdate(JournalBase):
 class JournalResponse(JournalBase):
     id: int
     user_id: int
+    entry_count: int = 0
+    word_count: int = 0
+    last_entry_at: Optional[datetime] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
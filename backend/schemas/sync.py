@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class SyncChange(BaseModel):
+    seq: int
+    entity: str  # project, task, idea, concept, mindmap, log, log_entry, journal_entry
+    id: int
+    action: str  # upsert, delete
+    data: Optional[Dict[str, Any]] = None
+
+
+class SyncResponse(BaseModel):
+    changes: List[SyncChange]
+    next_since: int
+    has_more: bool
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 from models.task import TaskStatus, TaskPriority
 
@@ -10,6 +10,8 @@ class TaskBase(BaseModel):
     priority: TaskPriority = TaskPriority.MEDIUM
     due_date: Optional[datetime] = None
     project_id: Optional[int] = None
+    # RRULE-style, e.g. "FREQ=WEEKLY;BYDAY=MO"; the due date is the first occurrence
+    recurrence_rule: Optional[str] = Field(None, max_length=255)
 
 class TaskCreate(TaskBase):
     pass
@@ -21,12 +23,56 @@ class TaskUpdate(BaseModel):
     priority: Optional[TaskPriority] = None
     due_date: Optional[datetime] = None
     project_id: Optional[int] = None
+    recurrence_rule: Optional[str] = Field(None, max_length=255)
 
 class TaskResponse(TaskBase):
-    id: int
+    # None on occurrences of a recurring task that haven't been stored yet
+    id: Optional[int]
     user_id: int
     created_at: datetime
     updated_at: datetime
+    # Set on occurrences of a recurring task, which are edited through
+    # PUT /tasks/{recurrence_parent_id}/occurrences/{occurrence_date}
+    recurrence_parent_id: Optional[int] = None
+    occurrence_date: Optional[datetime] = None
 
     class Config:
         from_attributes = True
+
+class TaskFilter(BaseModel):
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    project_id: Optional[int] = None
+    due_date_from: Optional[datetime] = None
+    due_date_to: Optional[datetime] = None
+    search: Optional[str] = None
+
+class TaskSelection(BaseModel):
+    # Exactly one of the two: explicit ids, or a filter over the user's tasks
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=1000)
+    filter: Optional[TaskFilter] = None
+
+class TaskBulkUpdate(TaskSelection):
+    changes: TaskUpdate
+
+class TaskBulkResult(BaseModel):
+    ids: List[int]
+
+class TaskDependencyCreate(BaseModel):
+    depends_on_id: int
+
+class TaskScheduleItem(BaseModel):
+    task_id: int
+    state: Literal["done", "ready", "blocked"]
+    depends_on: List[int]
+    # In steps of TASK_GRAPH_STEP_HOURS; unset for done tasks
+    earliest_finish: Optional[int] = None
+    total_float: Optional[int] = None
+    # Hours to spare before a due date is missed; unset when no due date applies
+    slack_hours: Optional[float] = None
+    critical: bool
+
+class ProjectSchedule(BaseModel):
+    length: int
+    critical_path: List[int]
+    tasks: List[TaskScheduleItem]
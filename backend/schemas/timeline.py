@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class TimelineItem(BaseModel):
+    type: str  # task, activity, log, journal_entry
+    id: int
+    timestamp: datetime
+    summary: Optional[str] = None
+    project_id: Optional[int] = None
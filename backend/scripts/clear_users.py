@@ -12,7 +12,7 @@ def clear_user_table():
     db = SessionLocal()
     try:
         print("Deleting all users from the database...")
-        # Use raw SQL to bypass the ORM and its relationships
+        # Dependent rows are removed by ON DELETE CASCADE in the database
         db.execute(text("DELETE FROM users"))
         db.commit()
         print("Successfully deleted all users!")
@@ -0,0 +1,361 @@
+"""Generate large volumes of synthetic data for scale testing.
+
+Rows are built as plain dicts and written with Core ``executemany`` inserts
+in large batches, bypassing the ORM unit of work entirely. Primary keys are
+assigned up front from per-table ID ranges, so every user's rows are fully
+determined by ``--seed`` and the user's index, no matter how many worker
+processes share the work.
+
+Examples (from the backend directory)::
+
+    python scripts/generate_data.py --users 1000
+    python scripts/generate_data.py --users 10000 --workers 8 --database-url postgresql://...
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import accumulate
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+# Add the parent directory to the Python path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, func, select, text
+
+from auth.utils import get_password_hash
+from database import Base
+from models import Activity, Habit, HabitTracking, Log, LogEntry, Project, Task, TaskPriority, TaskStatus, User
+from models.log import LogType
+from services.habit_streaks import record_completion
+
+# Parents come before children so foreign keys resolve within a batch
+TABLES = [User, Project, Log, Habit, Task, Activity, LogEntry, HabitTracking]
+
+ACTIVITY_TYPES = ["web", "app", "music", "location"]
+ACTIVITY_WEIGHTS = [0.5, 0.3, 0.15, 0.05]
+TASK_STATUSES = list(TaskStatus)
+TASK_STATUS_WEIGHTS = [0.3, 0.2, 0.5]
+TASK_PRIORITIES = list(TaskPriority)
+TASK_PRIORITY_WEIGHTS = [0.3, 0.5, 0.2]
+WORDS = [
+    "review", "design", "deploy", "refactor", "write", "plan", "fix", "test", "release", "document",
+    "meeting", "budget", "draft", "research", "call", "email", "sync", "outline", "polish", "ship",
+]
+DOMAINS = ["github.com", "docs.python.org", "news.ycombinator.com", "stackoverflow.com", "example.com"]
+APPS = ["vscode", "terminal", "slack", "browser", "figma", "notes"]
+HOUR_WEIGHTS = [1, 1, 1, 1, 1, 2, 4, 8, 12, 14, 14, 12, 10, 12, 14, 14, 12, 10, 8, 7, 6, 4, 3, 2]
+# random.choices re-accumulates plain weights on every call
+ACTIVITY_CUM_WEIGHTS = list(accumulate(ACTIVITY_WEIGHTS))
+TASK_STATUS_CUM_WEIGHTS = list(accumulate(TASK_STATUS_WEIGHTS))
+TASK_PRIORITY_CUM_WEIGHTS = list(accumulate(TASK_PRIORITY_WEIGHTS))
+HOUR_CUM_WEIGHTS = list(accumulate(HOUR_WEIGHTS))
+HOURS = list(range(24))
+
+
+@dataclass
+class Volumes:
+    projects_per_user: int = 5
+    tasks_per_user: int = 200
+    activities_per_user: int = 5000
+    logs_per_user: int = 10
+    entries_per_log: int = 20
+    habits_per_user: int = 3
+    days: int = 365
+
+    def per_user(self) -> Dict[str, int]:
+        """Primary keys reserved per user in each table's ID range."""
+        return {
+            "users": 1,
+            "projects": self.projects_per_user,
+            "logs": self.logs_per_user,
+            "habits": self.habits_per_user,
+            "tasks": self.tasks_per_user,
+            "activities": self.activities_per_user,
+            "log_entries": self.logs_per_user * self.entries_per_log,
+            # Upper bound: one completion per habit per day
+            "habit_tracking": self.habits_per_user * self.days,
+        }
+
+
+def _random_text(rng: random.Random, mean_words: int) -> str:
+    # Log-normal lengths give the long tail of notes real users write
+    count = max(1, int(rng.lognormvariate(math.log(mean_words), 0.6)))
+    return " ".join(rng.choices(WORDS, k=count))
+
+
+def _random_timestamp(rng: random.Random, now: datetime, days: int) -> datetime:
+    # Recent days are busier than old ones, and activity follows the working day
+    age_days = min(days - 1, int(rng.expovariate(3.0 / days)))
+    hour = rng.choices(HOURS, cum_weights=HOUR_CUM_WEIGHTS)[0]
+    day = (now - timedelta(days=age_days)).replace(hour=hour, minute=0, second=0, microsecond=0)
+    return day + timedelta(seconds=rng.randrange(3600))
+
+
+def _activity_data(rng: random.Random, activity_type: str) -> dict:
+    if activity_type == "web":
+        data = {"url": f"https://{rng.choice(DOMAINS)}/{rng.randrange(10**6)}", "title": _random_text(rng, 6)}
+    elif activity_type == "app":
+        data = {"app": rng.choice(APPS), "window": _random_text(rng, 4)}
+    elif activity_type == "music":
+        data = {"track": _random_text(rng, 3), "artist": _random_text(rng, 2)}
+    else:
+        data = {"lat": round(rng.uniform(-90, 90), 5), "lon": round(rng.uniform(-180, 180), 5)}
+    data["duration_seconds"] = int(rng.lognormvariate(math.log(300), 1.0))
+    return data
+
+
+def generate_user(index: int, ids: Dict[str, int], volumes: Volumes, seed: int, now: datetime, password_hash: str):
+    """Build every row belonging to the user at ``index``, keyed by table name."""
+    rng = random.Random(seed * 1_000_003 + index)
+    per_user = volumes.per_user()
+
+    def first_id(table: str) -> int:
+        return ids[table] + index * per_user[table]
+
+    user_id = first_id("users")
+    rows: Dict[str, List[dict]] = {table.__tablename__: [] for table in TABLES}
+    rows["users"].append({
+        "id": user_id,
+        "username": f"user{user_id}",
+        "email": f"user{user_id}@example.com",
+        "full_name": f"Generated User {user_id}",
+        "hashed_password": password_hash,
+        "created_at": now - timedelta(days=volumes.days),
+    })
+
+    project_ids = [first_id("projects") + p for p in range(volumes.projects_per_user)]
+    for project_id in project_ids:
+        created = now - timedelta(days=rng.randrange(volumes.days))
+        rows["projects"].append({
+            "id": project_id,
+            "title": f"Project {project_id}",
+            "description": _random_text(rng, 20),
+            "owner_id": user_id,
+            "created_at": created,
+            "updated_at": created,
+            "start_date": created,
+        })
+
+    for t in range(volumes.tasks_per_user):
+        created = _random_timestamp(rng, now, volumes.days)
+        status = rng.choices(TASK_STATUSES, cum_weights=TASK_STATUS_CUM_WEIGHTS)[0]
+        rows["tasks"].append({
+            "id": first_id("tasks") + t,
+            "title": _random_text(rng, 4)[:100],
+            "description": _random_text(rng, 25),
+            "status": status,
+            "priority": rng.choices(TASK_PRIORITIES, cum_weights=TASK_PRIORITY_CUM_WEIGHTS)[0],
+            "due_date": created + timedelta(days=rng.randint(1, 30)) if rng.random() < 0.7 else None,
+            "created_at": created,
+            "updated_at": created,
+            "completed_at": created + timedelta(hours=rng.randint(1, 240)) if status == TaskStatus.DONE else None,
+            "user_id": user_id,
+            "project_id": rng.choice(project_ids),
+        })
+
+    for a in range(volumes.activities_per_user):
+        activity_type = rng.choices(ACTIVITY_TYPES, cum_weights=ACTIVITY_CUM_WEIGHTS)[0]
+        rows["activities"].append({
+            "id": first_id("activities") + a,
+            "user_id": user_id,
+            "project_id": rng.choice(project_ids),
+            "type": activity_type,
+            "data": _activity_data(rng, activity_type),
+            "timestamp": _random_timestamp(rng, now, volumes.days),
+        })
+
+    for l in range(volumes.logs_per_user):
+        log_id = first_id("logs") + l
+        created = _random_timestamp(rng, now, volumes.days)
+        rows["logs"].append({
+            "id": log_id,
+            "title": _random_text(rng, 4),
+            "content": _random_text(rng, 40),
+            "log_type": rng.choice(list(LogType)),
+            "created_at": created,
+            "updated_at": created,
+            "user_id": user_id,
+            "project_id": rng.choice(project_ids),
+        })
+        for e in range(volumes.entries_per_log):
+            entry_time = created + timedelta(minutes=rng.randrange(60 * 24 * 30))
+            rows["log_entries"].append({
+                "id": first_id("log_entries") + l * volumes.entries_per_log + e,
+                "content": _random_text(rng, 30),
+                "created_at": entry_time,
+                "updated_at": entry_time,
+                "log_id": log_id,
+                "user_id": user_id,
+            })
+
+    tracking_id = first_id("habit_tracking")
+    for h in range(volumes.habits_per_user):
+        habit_id = first_id("habits") + h
+        # Streak fields come from the same bitmap engine the API uses
+        habit = SimpleNamespace(
+            frequency="daily", target_days=[], streak=0, longest_streak=0,
+            last_completed_on=None, bitmap_start=None, completion_bitmap=b""
+        )
+        adherence = rng.uniform(0.3, 0.95)
+        for offset in range(volumes.days - 1, -1, -1):
+            if rng.random() >= adherence:
+                continue
+            completed = (now - timedelta(days=offset)).replace(hour=rng.choices(HOURS, cum_weights=HOUR_CUM_WEIGHTS)[0])
+            record_completion(habit, completed.date())
+            rows["habit_tracking"].append({"id": tracking_id, "habit_id": habit_id, "completed": completed})
+            tracking_id += 1
+        rows["habits"].append({
+            "id": habit_id,
+            "user_id": user_id,
+            "name": f"Habit {h + 1}",
+            "frequency": "daily",
+            "target_days": [],
+            "streak": habit.streak,
+            "longest_streak": habit.longest_streak,
+            "last_completed_on": habit.last_completed_on,
+            "bitmap_start": habit.bitmap_start,
+            "completion_bitmap": habit.completion_bitmap,
+            "created_at": now - timedelta(days=volumes.days),
+        })
+
+    return rows
+
+
+def _make_engine(database_url: str):
+    if database_url.startswith("sqlite"):
+        # SQLite serializes writers, so other workers wait for the lock
+        # instead of failing, and durability is traded for load speed
+        engine = create_engine(database_url, connect_args={"timeout": 300})
+
+        @event.listens_for(engine, "connect")
+        def _fast_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.close()
+
+        return engine
+    return create_engine(database_url)
+
+
+def _flush(engine, buffers: Dict[str, List[dict]]) -> int:
+    written = 0
+    with engine.begin() as conn:
+        for table in TABLES:
+            batch = buffers[table.__tablename__]
+            if batch:
+                conn.execute(table.__table__.insert(), batch)
+                written += len(batch)
+                batch.clear()
+    return written
+
+
+def generate_shard(args: Tuple) -> int:
+    """Generate and insert the users in ``[start, stop)``; runs in a worker process."""
+    database_url, start, stop, ids, volumes, seed, now, password_hash, batch_size = args
+    engine = _make_engine(database_url)
+    buffers: Dict[str, List[dict]] = {table.__tablename__: [] for table in TABLES}
+    buffered = written = 0
+    try:
+        for index in range(start, stop):
+            for table, rows in generate_user(index, ids, volumes, seed, now, password_hash).items():
+                buffers[table].extend(rows)
+                buffered += len(rows)
+            if buffered >= batch_size:
+                written += _flush(engine, buffers)
+                buffered = 0
+        written += _flush(engine, buffers)
+    finally:
+        engine.dispose()
+    return written
+
+
+def next_ids(engine) -> Dict[str, int]:
+    """First free primary key per table, so generated rows never collide."""
+    with engine.connect() as conn:
+        return {
+            table.__tablename__: (conn.execute(select(func.max(table.id))).scalar() or 0) + 1
+            for table in TABLES
+        }
+
+
+def reset_sequences(engine) -> None:
+    """Move PostgreSQL id sequences past the explicitly inserted keys."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        for table in TABLES:
+            name = table.__tablename__
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM {name}), 1))"
+            ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill the database with synthetic data for scale testing")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", "sqlite:///./sql_app.db"))
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--projects-per-user", type=int, default=Volumes.projects_per_user)
+    parser.add_argument("--tasks-per-user", type=int, default=Volumes.tasks_per_user)
+    parser.add_argument("--activities-per-user", type=int, default=Volumes.activities_per_user)
+    parser.add_argument("--logs-per-user", type=int, default=Volumes.logs_per_user)
+    parser.add_argument("--entries-per-log", type=int, default=Volumes.entries_per_log)
+    parser.add_argument("--habits-per-user", type=int, default=Volumes.habits_per_user)
+    parser.add_argument("--days", type=int, default=Volumes.days, help="length of the generated history")
+    parser.add_argument("--batch-size", type=int, default=20000, help="rows per insert transaction")
+    parser.add_argument("--workers", type=int, default=1, help="processes generating user shards in parallel")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    volumes = Volumes(
+        projects_per_user=args.projects_per_user,
+        tasks_per_user=args.tasks_per_user,
+        activities_per_user=args.activities_per_user,
+        logs_per_user=args.logs_per_user,
+        entries_per_log=args.entries_per_log,
+        habits_per_user=args.habits_per_user,
+        days=args.days
+    )
+    engine = _make_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    ids = next_ids(engine)
+    engine.dispose()
+
+    now = datetime.utcnow()
+    # Hash once: bcrypt would otherwise dominate the run
+    password_hash = get_password_hash("password123")
+    shard_size = math.ceil(args.users / max(1, args.workers * 4))
+    shards = [
+        (args.database_url, start, min(start + shard_size, args.users), ids, volumes, args.seed, now,
+         password_hash, args.batch_size)
+        for start in range(0, args.users, shard_size)
+    ]
+
+    print(f"Generating {args.users} users in {len(shards)} shards with {args.workers} worker(s)...")
+    started = time.perf_counter()
+    total = 0
+    if args.workers > 1:
+        with multiprocessing.Pool(args.workers) as pool:
+            for written in pool.imap_unordered(generate_shard, shards):
+                total += written
+                print(f"  {total} rows written ({total / (time.perf_counter() - started):.0f} rows/s)")
+    else:
+        for shard in shards:
+            total += generate_shard(shard)
+            print(f"  {total} rows written ({total / (time.perf_counter() - started):.0f} rows/s)")
+
+    reset_sequences(create_engine(args.database_url))
+    elapsed = time.perf_counter() - started
+    print(f"Done: {total} rows in {elapsed:.1f}s ({total / elapsed:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Profile how long it takes to import the API and where that time goes.
+
+Runs ``python -X importtime`` against ``main`` in fresh interpreters and
+prints the slowest modules and top-level packages by self time. The median
+import time is checked against a budget so startup regressions can fail a
+local check, e.g. ``python scripts/import_profile.py --budget-ms 1500``.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median wall time for "import main" measured on a development laptop with
+# the AI stack loaded lazily; raise it deliberately, not by accident
+DEFAULT_BUDGET_MS = 1500
+
+PROBE = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "print(round((time.perf_counter() - start) * 1000, 1))\n"
+)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Return ``(module, self_us, cumulative_us)`` for each line of -X importtime output."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def profile_once(module: str) -> Tuple[float, List[Tuple[str, int, int]]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(module=module)],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    wall_ms = float(result.stdout.strip().splitlines()[-1])
+    return wall_ms, parse_importtime(result.stderr)
+
+
+def by_package(entries: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in entries:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report import-time cost of the API")
+    parser.add_argument("--module", default="main", help="module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to sample")
+    parser.add_argument("--top", type=int, default=15, help="rows to show per table")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    # The first run warms the filesystem and bytecode caches
+    profile_once(args.module)
+    samples = [profile_once(args.module) for _ in range(args.runs)]
+    wall_times = [wall for wall, _ in samples]
+    # Show the breakdown of the median run rather than a noisy outlier
+    median_ms = statistics.median(wall_times)
+    _, entries = min(samples, key=lambda sample: abs(sample[0] - median_ms))
+
+    print(f"Slowest modules by self time (import {args.module}):")
+    for name, self_us, cumulative_us in sorted(entries, key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms self  {cumulative_us / 1000:8.1f} ms cumulative  {name}")
+
+    print("\nSelf time by top-level package:")
+    for package, self_us in sorted(by_package(entries).items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    print(
+        f"\nimport {args.module}: median {median_ms:.0f} ms over {args.runs} runs "
+        f"(min {min(wall_times):.0f}, max {max(wall_times):.0f}), budget {args.budget_ms:.0f} ms"
+    )
+    if median_ms > args.budget_ms:
+        print("Startup budget exceeded")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Stand-in replicator for trying read replicas locally with SQLite.
+
+Copies the primary database file onto one or more replica files every
+``--interval`` seconds with SQLite's online backup API, which gives a
+consistent snapshot while the API keeps writing. Run the API with e.g.::
+
+    DATABASE_URL=sqlite:///./sql_app.db \\
+    DATABASE_REPLICA_URLS=sqlite:///./replica.db \\
+    uvicorn main:app
+
+and alongside it ``python scripts/replicate_sqlite.py sql_app.db replica.db``.
+The interval plays the part of replication lag; keep it below
+``REPLICA_STICKY_SECONDS`` so users read their own writes.
+"""
+import argparse
+import sqlite3
+import time
+from typing import Sequence
+
+
+def replicate(primary_path: str, replica_paths: Sequence[str]) -> None:
+    """Overwrite each replica with a snapshot of the primary."""
+    source = sqlite3.connect(primary_path)
+    try:
+        for replica_path in replica_paths:
+            target = sqlite3.connect(replica_path)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+    finally:
+        source.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("primary", help="Path of the primary SQLite database")
+    parser.add_argument("replicas", nargs="+", help="Paths of the replica files to keep in sync")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between snapshots")
+    parser.add_argument("--once", action="store_true", help="Copy once and exit")
+    args = parser.parse_args()
+
+    while True:
+        replicate(args.primary, args.replicas)
+        if args.once:
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
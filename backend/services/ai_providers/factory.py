@@ -1,22 +1,36 @@
-from typing import Dict, Type
+import importlib
+from typing import Dict
 from . import AIProvider
-from .openai_provider import OpenAIProvider
-from .ollama_provider import OllamaProvider
-from .huggingface_provider import HuggingFaceProvider
-from ...config import settings
+from config import get_settings
+
+settings = get_settings()
 
 class AIProviderFactory:
-    _providers: Dict[str, Type[AIProvider]] = {
-        'openai': OpenAIProvider,
-        'ollama': OllamaProvider,
-        'huggingface': HuggingFaceProvider,
+    # Providers are referenced by "module:ClassName" and imported on first
+    # use, so the SDKs behind unused providers never load
+    _providers: Dict[str, str] = {
+        'openai': 'services.ai_providers.openai_provider:OpenAIProvider',
+        'ollama': 'services.ai_providers.ollama_provider:OllamaProvider',
+        'huggingface': 'services.ai_providers.huggingface_provider:HuggingFaceProvider',
     }
+    _instances: Dict[str, AIProvider] = {}
+
+    @classmethod
+    def register_provider(cls, name: str, path: str) -> None:
+        """Register an additional provider by its "module:ClassName" path."""
+        cls._providers[name] = path
+        cls._instances.pop(name, None)
 
     @classmethod
     def get_provider(cls) -> AIProvider:
         """Get the configured AI provider instance."""
-        provider_class = cls._providers.get(settings.ai.provider)
-        if not provider_class:
-            raise ValueError(f"Unsupported AI provider: {settings.ai.provider}")
-        
-        return provider_class()
+        name = settings.AI_PROVIDER
+        provider = cls._instances.get(name)
+        if provider is None:
+            path = cls._providers.get(name)
+            if not path:
+                raise ValueError(f"Unsupported AI provider: {name}")
+            module_name, _, class_name = path.partition(":")
+            provider_class = getattr(importlib.import_module(module_name), class_name)
+            provider = cls._instances[name] = provider_class()
+        return provider
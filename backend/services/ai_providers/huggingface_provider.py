@@ -1,16 +1,20 @@
 from typing import List, Dict, Any
-import aiohttp
 from . import AIProvider
-from ...config import settings
+from config import get_settings
+
+settings = get_settings()
 
 class HuggingFaceProvider(AIProvider):
     def __init__(self):
-        self.api_key = settings.ai.huggingface_api_key
-        self.model = settings.ai.model_name
+        self.api_key = settings.HUGGINGFACE_API_KEY
+        self.model = settings.AI_MODEL_NAME
         self.api_url = f"https://api-inference.huggingface.co/models/{self.model}"
         self.headers = {"Authorization": f"Bearer {self.api_key}"}
 
     async def _generate_response(self, prompt: str) -> str:
+        # Imported here so aiohttp is only loaded when this provider is used
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
             async with session.post(
                 self.api_url,
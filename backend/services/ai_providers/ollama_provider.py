@@ -1,14 +1,18 @@
 from typing import List, Dict, Any
-import aiohttp
 from . import AIProvider
-from ...config import settings
+from config import get_settings
+
+settings = get_settings()
 
 class OllamaProvider(AIProvider):
     def __init__(self):
-        self.base_url = settings.ai.ollama_host
-        self.model = settings.ai.model_name
+        self.base_url = settings.OLLAMA_HOST
+        self.model = settings.AI_MODEL_NAME
 
     async def _generate_response(self, prompt: str) -> str:
+        # Imported here so aiohttp is only loaded when this provider is used
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
             async with session.post(
                 f"{self.base_url}/api/generate",
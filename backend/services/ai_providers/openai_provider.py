@@ -1,11 +1,16 @@
 from typing import List, Dict, Any
-import openai
 from . import AIProvider
-from ...config import settings
+from config import get_settings
+
+settings = get_settings()
 
 class OpenAIProvider(AIProvider):
     def __init__(self):
-        openai.api_key = settings.ai.openai_api_key
+        # Imported here so the SDK is only loaded when this provider is selected
+        import openai
+        openai.api_key = settings.OPENAI_API_KEY
+        self.openai = openai
+        self.model = settings.AI_MODEL_NAME
 
     async def analyze_task(self, title: str, description: str) -> Dict[str, Any]:
         prompt = f"""Analyze this task:
@@ -19,8 +24,8 @@ Provide analysis in JSON format with:
 - complexity_analysis (text)
 - potential_challenges (list)"""
 
-        response = await openai.ChatCompletion.acreate(
-            model=settings.ai.model_name,
+        response = await self.openai.ChatCompletion.acreate(
+            model=self.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7
         )
@@ -38,8 +43,8 @@ Provide analysis in JSON format with:
 - suggested_order (list of task titles)
 - time_estimate (total hours)"""
 
-        response = await openai.ChatCompletion.acreate(
-            model=settings.ai.model_name,
+        response = await self.openai.ChatCompletion.acreate(
+            model=self.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7
         )
@@ -61,8 +66,8 @@ Provide optimization suggestions in JSON format with:
 - resource_allocation (text)
 - timeline_recommendations (text)"""
 
-        response = await openai.ChatCompletion.acreate(
-            model=settings.ai.model_name,
+        response = await self.openai.ChatCompletion.acreate(
+            model=self.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7
         )
@@ -1,18 +1,22 @@
 from typing import List, Dict, Any
 from .ai_providers.factory import AIProviderFactory
+from .metrics import AI_PROVIDER_CALL_DURATION
 
 class AIService:
     @staticmethod
     async def analyze_task(title: str, description: str) -> Dict[str, Any]:
         provider = AIProviderFactory.get_provider()
-        return await provider.analyze_task(title, description)
+        with AI_PROVIDER_CALL_DURATION.time(provider=type(provider).__name__, operation="analyze_task"):
+            return await provider.analyze_task(title, description)
 
     @staticmethod
     async def generate_task_summary(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
         provider = AIProviderFactory.get_provider()
-        return await provider.generate_task_summary(tasks)
+        with AI_PROVIDER_CALL_DURATION.time(provider=type(provider).__name__, operation="generate_task_summary"):
+            return await provider.generate_task_summary(tasks)
 
     @staticmethod
     async def suggest_task_optimization(task: Dict[str, Any], all_tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
         provider = AIProviderFactory.get_provider()
-        return await provider.suggest_task_optimization(task, all_tasks)
\ No newline at end of file
+        with AI_PROVIDER_CALL_DURATION.time(provider=type(provider).__name__, operation="suggest_task_optimization"):
+            return await provider.suggest_task_optimization(task, all_tasks)
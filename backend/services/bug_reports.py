@@ -0,0 +1,231 @@
+"""Deduplicating bug report ingestion.
+
+Reports are fingerprinted by their title and error logs. The request
+handler only updates an in-memory buffer keyed by fingerprint, so a burst of
+identical reports from a crash loop collapses into a single pending record
+with a count. A background writer drains the buffer every few seconds and
+appends one JSON line per fingerprint to ``bug_reports.jsonl``; all file IO
+happens in a worker thread under an exclusive file lock, so several API
+workers can share the log.
+
+``BUG_REPORTS.md`` is rendered periodically from the JSONL log with one
+section per fingerprint and its total occurrence count.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on O_APPEND writes of whole buffers
+    fcntl = None
+
+from config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BUG_REPORTS_DIR = os.path.join(PROJECT_ROOT, "BUG_REPORTS")
+BUG_REPORTS_LOG_PATH = os.path.join(BUG_REPORTS_DIR, "bug_reports.jsonl")
+BUG_REPORTS_PATH = os.path.join(BUG_REPORTS_DIR, "BUG_REPORTS.md")
+
+RENDERED_MARKER = "<!-- Generated from bug_reports.jsonl; edits will be overwritten -->"
+
+_NUMBERS = re.compile(r"0x[0-9a-fA-F]+|\d+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(text: str) -> str:
+    # Line numbers, ports, ids and addresses differ between otherwise
+    # identical crashes, so they do not take part in the fingerprint
+    return _WHITESPACE.sub(" ", _NUMBERS.sub("#", text)).strip().lower()
+
+
+def fingerprint(title: str, error_logs: Optional[List[str]] = None) -> str:
+    """Stable hash identifying repeats of the same problem."""
+    digest = hashlib.sha256(_normalize(title).encode("utf-8"))
+    for line in error_logs or []:
+        digest.update(b"\n")
+        digest.update(_normalize(line).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class BugReportStore:
+    def __init__(self, log_path: str = BUG_REPORTS_LOG_PATH, flush_interval: float = None, max_pending: int = None):
+        self.log_path = log_path
+        self.flush_interval = settings.BUG_REPORT_FLUSH_SECONDS if flush_interval is None else flush_interval
+        self.max_pending = max_pending or settings.BUG_REPORT_MAX_PENDING
+        self.dropped = 0
+        # Reports waiting for the writer, coalesced by fingerprint
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # Fingerprints this process has already written in full
+        self._written = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._writer: Optional[asyncio.Task] = None
+
+    def submit(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record a report without blocking on IO.
+
+        Returns the fingerprint and the number of occurrences buffered for it
+        since the last flush, or None for ``pending`` if the buffer is full.
+        """
+        key = fingerprint(report["title"], report.get("errorLogs"))
+        now = datetime.utcnow().isoformat()
+        pending = self._pending.get(key)
+        if pending is None:
+            if len(self._pending) >= self.max_pending:
+                # Only a flood of distinct reports gets here; repeats of a
+                # buffered report are always counted
+                self.dropped += 1
+                return {"fingerprint": key, "pending": None}
+            pending = self._pending[key] = {"fingerprint": key, "count": 0, "first_seen": now}
+            if key not in self._written:
+                pending["report"] = report
+        pending["count"] += 1
+        pending["last_seen"] = now
+        self._ensure_writer()
+        return {"fingerprint": key, "pending": pending["count"]}
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._wakeup = asyncio.Event()
+            self._writer = asyncio.create_task(self._run_writer())
+        self._wakeup.set()
+
+    async def _run_writer(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Let a burst accumulate so it is written as a single line
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to write bug reports: {str(e)}")
+
+    async def flush(self) -> int:
+        """Append all pending records to the log and return how many were written."""
+        if not self._pending:
+            return 0
+        records, self._pending = list(self._pending.values()), {}
+        try:
+            await asyncio.to_thread(self._append, records)
+        except Exception:
+            # Put the records back so the next flush retries them
+            for record in records:
+                self._merge_back(record)
+            raise
+        self._written.update(record["fingerprint"] for record in records)
+        return len(records)
+
+    def _merge_back(self, record: Dict[str, Any]) -> None:
+        pending = self._pending.get(record["fingerprint"])
+        if pending is None:
+            self._pending[record["fingerprint"]] = record
+            return
+        pending["count"] += record["count"]
+        pending["first_seen"] = record["first_seen"]
+        if "report" in record:
+            pending["report"] = record["report"]
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        data = "".join(json.dumps(record) + "\n" for record in records).encode("utf-8")
+        fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    async def stop(self) -> None:
+        """Cancel the writer and flush whatever is still buffered."""
+        if self._writer is not None:
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        await self.flush()
+
+
+def load_reports(log_path: str = BUG_REPORTS_LOG_PATH) -> List[Dict[str, Any]]:
+    """Aggregate the JSONL log into one entry per fingerprint, most recent first."""
+    reports: Dict[str, Dict[str, Any]] = {}
+    if not os.path.exists(log_path):
+        return []
+    with open(log_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn line from a crash mid-write only loses that record
+                continue
+            entry = reports.setdefault(record["fingerprint"], {
+                "fingerprint": record["fingerprint"],
+                "count": 0,
+                "first_seen": record["first_seen"],
+                "last_seen": record["last_seen"],
+                "report": None,
+            })
+            entry["count"] += record["count"]
+            entry["first_seen"] = min(entry["first_seen"], record["first_seen"])
+            entry["last_seen"] = max(entry["last_seen"], record["last_seen"])
+            if entry["report"] is None and record.get("report"):
+                entry["report"] = record["report"]
+    return sorted(reports.values(), key=lambda entry: entry["last_seen"], reverse=True)
+
+
+def render_markdown(reports: List[Dict[str, Any]]) -> str:
+    sections = [f"{RENDERED_MARKER}\n# Bug Reports\n"]
+    for entry in reports:
+        report = entry["report"] or {}
+        error_logs = "\n".join(report.get("errorLogs") or []) or "No error logs provided"
+        sections.append(f"""
+## {report.get("title", "Unknown report")}
+**Fingerprint:** `{entry["fingerprint"]}`
+**Occurrences:** {entry["count"]}
+**First reported:** {entry["first_seen"]}
+**Last reported:** {entry["last_seen"]}
+
+### Description
+{report.get("description", "")}
+
+### System Information
+```json
+{report.get("systemInfo", "")}
+```
+
+### Error Logs
+```
+{error_logs}
+```
+
+---
+""")
+    return "".join(sections)
+
+
+def render_bug_reports(log_path: str = BUG_REPORTS_LOG_PATH, markdown_path: str = BUG_REPORTS_PATH) -> None:
+    """Rewrite the markdown summary from the log, replacing the file atomically."""
+    if not os.path.exists(log_path):
+        return
+    if os.path.exists(markdown_path):
+        with open(markdown_path, encoding="utf-8") as f:
+            rendered = f.readline().strip() == RENDERED_MARKER
+        if not rendered:
+            # Keep reports written by the old append-only markdown writer
+            os.replace(markdown_path, markdown_path[:-len(".md")] + ".archive.md")
+    temp_path = f"{markdown_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(render_markdown(load_reports(log_path)))
+    os.replace(temp_path, markdown_path)
+
+
+bug_report_store = BugReportStore()
@@ -0,0 +1,202 @@
+"""In-process pub/sub for live change notifications.
+
+Handlers call ``publish_change`` after committing a write. The event goes
+out on ``user:<id>`` for the record's owner and ``project:<id>`` for the
+project it belongs to, and ``event_hub`` hands it to every open
+subscription on those channels. Clients keep one ``/api/events`` stream
+open instead of polling each listing.
+
+Each subscription buffers pending events keyed by record, so a burst of
+updates to one task is delivered once, with its latest state. The buffer is
+bounded: when a slow client lets it overflow it is dropped and the client
+gets a single ``resync`` event telling it to refetch.
+
+Cross-process delivery goes through an ``EventBackend``. The default
+``LocalEventBackend`` only reaches subscribers in this process; multi-worker
+deployments set ``EVENT_BACKEND`` to a ``module:ClassName`` whose
+``publish`` broadcasts to every worker (e.g. over Redis pub/sub), each of
+which passes what it receives to its hub's ``deliver``.
+"""
+import asyncio
+import importlib
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[List[str], Dict[str, Any]], None]
+
+
+class EventBackend(ABC):
+    async def start(self, deliver: Deliver) -> None:
+        """Begin routing published events to ``deliver`` (callable from any thread)."""
+        self._deliver = deliver
+
+    @abstractmethod
+    def publish(self, channels: List[str], event: Dict[str, Any]) -> None:
+        """Send ``event`` to the hubs of all workers; must not block."""
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class LocalEventBackend(EventBackend):
+    """Delivers to this process only."""
+
+    def publish(self, channels: List[str], event: Dict[str, Any]) -> None:
+        self._deliver(channels, event)
+
+
+def load_backend(path: str) -> EventBackend:
+    """Instantiate a backend from a ``module:ClassName`` string."""
+    module_name, _, class_name = path.partition(":")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    return backend_class()
+
+
+class Subscription:
+    def __init__(self, channels: Iterable[str], max_pending: int):
+        self.channels = frozenset(channels)
+        self.max_pending = max_pending
+        # Latest undelivered event per (entity, id)
+        self._pending: "OrderedDict[Tuple[str, Any], Dict[str, Any]]" = OrderedDict()
+        self._overflowed = False
+        self._wakeup = asyncio.Event()
+
+    def push(self, event: Dict[str, Any]) -> None:
+        key = (event["entity"], event["id"])
+        self._pending.pop(key, None)
+        if len(self._pending) >= self.max_pending:
+            # The client has fallen too far behind for individual events to
+            # help; it refetches instead
+            self._pending.clear()
+            self._overflowed = True
+        else:
+            self._pending[key] = event
+        self._wakeup.set()
+
+    async def next_batch(self, timeout: float, coalesce: float = 0) -> List[Dict[str, Any]]:
+        """
+        Wait up to ``timeout`` seconds for events and return all pending ones,
+        or an empty list on timeout. Once woken, waits another ``coalesce``
+        seconds so the rest of a burst collapses into the same batch.
+        """
+        if not self._pending and not self._overflowed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+            if coalesce:
+                await asyncio.sleep(coalesce)
+        self._wakeup.clear()
+        batch = [{"type": "resync"}] if self._overflowed else []
+        batch.extend(self._pending.values())
+        self._pending.clear()
+        self._overflowed = False
+        return batch
+
+
+class EventHub:
+    def __init__(self, backend: Optional[EventBackend] = None, max_pending: int = None):
+        self.backend = backend
+        self.max_pending = max_pending or settings.EVENT_QUEUE_SIZE
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        if self.backend is None:
+            self.backend = load_backend(settings.EVENT_BACKEND) if settings.EVENT_BACKEND else LocalEventBackend()
+        await self.backend.start(self.deliver)
+
+    async def stop(self) -> None:
+        if self.backend is not None:
+            await self.backend.stop()
+        self._loop = None
+
+    def subscribe(self, channels: Iterable[str]) -> Subscription:
+        subscription = Subscription(channels, self.max_pending)
+        for channel in subscription.channels:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for channel in subscription.channels:
+            subscribers = self._subscriptions.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[channel]
+
+    def publish(self, channels: List[str], event: Dict[str, Any]) -> None:
+        """Publish through the backend; safe from any thread, a no-op before ``start``."""
+        if self._loop is None or not channels:
+            return
+        try:
+            self.backend.publish(channels, event)
+        except Exception as e:
+            # Live updates are best effort; the write itself already committed
+            logger.error(f"Failed to publish {event.get('type')} event: {str(e)}")
+
+    def deliver(self, channels: List[str], event: Dict[str, Any]) -> None:
+        """Hand an event to this process's subscribers; safe from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._fan_out(channels, event)
+        else:
+            loop.call_soon_threadsafe(self._fan_out, channels, event)
+
+    def _fan_out(self, channels: List[str], event: Dict[str, Any]) -> None:
+        # A subscription on both the user and the project channel gets one copy
+        targets = set()
+        for channel in channels:
+            targets.update(self._subscriptions.get(channel, ()))
+        for subscription in targets:
+            subscription.push(event)
+
+
+event_hub = EventHub()
+
+
+def publish_change(
+    entity: str,
+    action: str,
+    record_id: Any,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    data: Any = None
+) -> None:
+    """
+    Announce that a record was created, updated or deleted.
+
+    Call after the commit. ``data`` is the record as the API serializes it
+    (e.g. the response schema), so clients can apply the change without a
+    refetch; deletes send none.
+    """
+    channels = []
+    if user_id is not None:
+        channels.append(f"user:{user_id}")
+    if project_id is not None:
+        channels.append(f"project:{project_id}")
+    event_hub.publish(channels, {
+        "type": f"{entity}.{action}",
+        "entity": entity,
+        "action": action,
+        "id": record_id,
+        "project_id": project_id,
+        "data": jsonable_encoder(data) if data is not None else None,
+    })
@@ -0,0 +1,181 @@
+"""Streaming export of everything a user owns.
+
+Rows are read with Core selects and ``yield_per`` so the database driver
+streams them (a server-side cursor on PostgreSQL) and no ORM objects or
+identity map build up. Each row becomes one NDJSON line of the form
+``{"type": "<entity>", "data": {...}}``; memory use stays flat no matter how
+large the history is.
+"""
+import base64
+import enum
+import json
+import zipfile
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from models.activity import Activity
+from models.concept import ConceptNote
+from models.development import Goal, GoalProgress, Habit, HabitTracking
+from models.idea import Idea, Tag, idea_tags
+from models.journal import Journal, JournalEntry
+from models.log import Log
+from models.log_entry import LogEntry
+from models.mindmap import Mindmap
+from models.project import Project
+from models.project_idea import project_ideas
+from models.task_dependency import task_dependencies
+from models.task import Task
+from models.user import User
+
+EXPORT_FORMAT_VERSION = 1
+YIELD_PER = 1000
+
+# Columns that never leave the server
+EXCLUDED_COLUMNS = {"user": {"hashed_password"}}
+
+
+def _live_projects(user_id: int):
+    return select(Project.id).where(Project.owner_id == user_id, Project.deleted_at.is_(None))
+
+
+def _owned(model, user_id: int) -> List[Any]:
+    """Conditions for the user's rows, minus those of tombstoned projects, which aren't exported."""
+    conditions = [model.user_id == user_id]
+    if "project_id" in model.__table__.c:
+        conditions.append(or_(model.project_id.is_(None), model.project_id.in_(_live_projects(user_id))))
+    return conditions
+
+
+def _owned_by(model) -> Callable[[int], Any]:
+    return lambda user_id: select(model.__table__).where(*_owned(model, user_id))
+
+
+def _in_projects_of(table) -> Callable[[int], Any]:
+    return lambda user_id: select(table).where(table.c.project_id.in_(_live_projects(user_id)))
+
+
+# (type name, statement for a user id, sort column); parents come before
+# their children so the stream can be imported in a single pass
+EXPORT_ENTITIES: List[Tuple[str, Callable[[int], Any], str]] = [
+    ("user", lambda user_id: select(User.__table__).where(User.id == user_id), "id"),
+    ("project", lambda user_id: (
+        select(Project.__table__).where(Project.owner_id == user_id, Project.deleted_at.is_(None))
+    ), "id"),
+    ("task", _owned_by(Task), "id"),
+    ("task_dependency", lambda user_id: (
+        select(task_dependencies).where(task_dependencies.c.task_id.in_(select(Task.id).where(*_owned(Task, user_id))))
+    ), "task_id"),
+    ("idea", _owned_by(Idea), "id"),
+    ("tag", lambda user_id: (
+        select(Tag.__table__).where(Tag.id.in_(
+            select(idea_tags.c.tag_id).where(idea_tags.c.idea_id.in_(select(Idea.id).where(Idea.user_id == user_id)))
+        ))
+    ), "id"),
+    ("idea_tag", lambda user_id: (
+        select(idea_tags).where(idea_tags.c.idea_id.in_(select(Idea.id).where(Idea.user_id == user_id)))
+    ), "idea_id"),
+    ("project_idea", _in_projects_of(project_ideas), "project_id"),
+    ("concept", _owned_by(ConceptNote), "id"),
+    ("mindmap", _in_projects_of(Mindmap.__table__), "id"),
+    ("log", _owned_by(Log), "id"),
+    ("log_entry", lambda user_id: (
+        select(LogEntry.__table__).where(LogEntry.user_id == user_id, or_(
+            LogEntry.log_id.is_(None), LogEntry.log_id.in_(select(Log.id).where(*_owned(Log, user_id)))
+        ))
+    ), "id"),
+    ("journal", _owned_by(Journal), "id"),
+    ("journal_entry", _owned_by(JournalEntry), "id"),
+    ("activity", _owned_by(Activity), "id"),
+    ("goal", _owned_by(Goal), "id"),
+    ("goal_progress", lambda user_id: (
+        select(GoalProgress.__table__).where(GoalProgress.goal_id.in_(select(Goal.id).where(Goal.user_id == user_id)))
+    ), "id"),
+    ("habit", _owned_by(Habit), "id"),
+    ("habit_tracking", lambda user_id: (
+        select(HabitTracking.__table__).where(HabitTracking.habit_id.in_(select(Habit.id).where(Habit.user_id == user_id)))
+    ), "id"),
+]
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def iter_entity_rows(db: Session, user_id: int, entity: Tuple[str, Callable[[int], Any], str]) -> Iterator[Dict[str, Any]]:
+    name, statement, order_column = entity
+    stmt = statement(user_id)
+    stmt = stmt.order_by(stmt.selected_columns[order_column]).execution_options(yield_per=YIELD_PER)
+    excluded = EXCLUDED_COLUMNS.get(name, set())
+    for row in db.execute(stmt).mappings():
+        yield {key: value for key, value in row.items() if key not in excluded}
+
+
+def iter_ndjson(db: Session, user_id: int) -> Iterator[bytes]:
+    """Yield the whole export as NDJSON, one encoded line per row."""
+    header = {"type": "export", "data": {
+        "version": EXPORT_FORMAT_VERSION,
+        "user_id": user_id,
+        "exported_at": datetime.utcnow().isoformat(),
+    }}
+    yield (json.dumps(header) + "\n").encode("utf-8")
+    for entity in EXPORT_ENTITIES:
+        lines = []
+        for row in iter_entity_rows(db, user_id, entity):
+            lines.append(json.dumps({"type": entity[0], "data": row}, default=_default))
+            # Hand off chunks of lines instead of one tiny write per row
+            if len(lines) >= YIELD_PER:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _ChunkBuffer:
+    """Write-only file object that lets ``zipfile`` emit into a generator."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+
+    def write(self, data: bytes) -> int:
+        if not data:
+            return 0
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_zip(db: Session, user_id: int) -> Iterator[bytes]:
+    """Yield a zip archive with one NDJSON file per entity type."""
+    buffer = _ChunkBuffer()
+    # A non-seekable target makes zipfile use data descriptors, so nothing
+    # has to be rewritten after an entry is streamed
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for entity in EXPORT_ENTITIES:
+            with archive.open(f"{entity[0]}.ndjson", mode="w", force_zip64=True) as member:
+                for row in iter_entity_rows(db, user_id, entity):
+                    member.write((json.dumps(row, default=_default) + "\n").encode("utf-8"))
+                    if len(buffer.chunks) >= 16:
+                        yield buffer.drain()
+    # Whatever is left, including the central directory written on close
+    yield buffer.drain()
@@ -0,0 +1,166 @@
+"""Habit streak engine backed by a per-habit completion bitmap.
+
+Each habit stores one bit per calendar day in ``Habit.completion_bitmap``,
+where bit ``i`` represents ``Habit.bitmap_start + i days``. A year of history
+fits in 46 bytes, so streaks and heatmaps never need to touch the
+``habit_tracking`` table.
+
+Streaks are counted in *periods* whose length depends on the schedule:
+
+- ``daily`` habits: one period per day
+- ``weekly`` habits without target days: one period per ISO week
+- ``monthly`` habits: one period per calendar month
+- any habit with ``target_days``: one period per scheduled weekday
+
+Scheduled periods are numbered consecutively, so a streak continues when a
+completion lands in the period directly after the previous one.
+"""
+from datetime import date, timedelta
+from typing import List, Optional
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+def _target_weekdays(habit) -> List[int]:
+    """Return the sorted weekday numbers (0 = Monday) a habit is scheduled on."""
+    days = {WEEKDAYS.index(day.lower()) for day in (habit.target_days or []) if day.lower() in WEEKDAYS}
+    return sorted(days)
+
+
+def period_index(habit, day: date) -> Optional[int]:
+    """
+    Map a day to the index of the schedule period it belongs to.
+
+    Returns None when the day is not part of the habit's schedule (for
+    example a Tuesday for a Monday/Wednesday/Friday habit).
+    """
+    targets = _target_weekdays(habit)
+    if targets:
+        if day.weekday() not in targets:
+            return None
+        week = (day.toordinal() - 1) // 7
+        return week * len(targets) + targets.index(day.weekday())
+    if habit.frequency == "weekly":
+        return (day.toordinal() - 1) // 7
+    if habit.frequency == "monthly":
+        return day.year * 12 + day.month - 1
+    return day.toordinal()
+
+
+def latest_period(habit, day: date) -> int:
+    """Return the index of the most recent scheduled period at or before ``day``."""
+    targets = _target_weekdays(habit)
+    if targets:
+        for offset in range(7):
+            index = period_index(habit, day - timedelta(days=offset))
+            if index is not None:
+                return index
+    return period_index(habit, day)
+
+
+def is_completed(habit, day: date) -> bool:
+    """Check whether the bitmap has a completion recorded for ``day``."""
+    if habit.bitmap_start is None or not habit.completion_bitmap:
+        return False
+    offset = (day - habit.bitmap_start).days
+    if offset < 0 or offset >= len(habit.completion_bitmap) * 8:
+        return False
+    return bool(habit.completion_bitmap[offset // 8] & (1 << (offset % 8)))
+
+
+def _set_bit(habit, day: date) -> None:
+    """Set the bit for ``day``, growing the bitmap in whole bytes as needed."""
+    bitmap = bytearray(habit.completion_bitmap or b"")
+    if habit.bitmap_start is None:
+        habit.bitmap_start = day
+    offset = (day - habit.bitmap_start).days
+    if offset < 0:
+        # Backfilled day before the current origin: prepend whole bytes so
+        # existing bit positions keep their alignment.
+        shift = (-offset + 7) // 8
+        bitmap[0:0] = bytes(shift)
+        habit.bitmap_start = habit.bitmap_start - timedelta(days=shift * 8)
+        offset = (day - habit.bitmap_start).days
+    if offset // 8 >= len(bitmap):
+        bitmap.extend(bytes(offset // 8 - len(bitmap) + 1))
+    bitmap[offset // 8] |= 1 << (offset % 8)
+    # Assign a new bytes object so SQLAlchemy detects the change
+    habit.completion_bitmap = bytes(bitmap)
+
+
+def _advance(habit, day: date) -> None:
+    """Apply a scheduled completion on ``day`` to the running streak counters."""
+    index = period_index(habit, day)
+    if index is None:
+        return
+    last = period_index(habit, habit.last_completed_on) if habit.last_completed_on else None
+    if last is not None and index == last:
+        # Another completion inside the same week or month
+        habit.last_completed_on = max(habit.last_completed_on, day)
+        return
+    if last is not None and index == last + 1:
+        habit.streak = (habit.streak or 0) + 1
+    else:
+        habit.streak = 1
+    habit.last_completed_on = day
+    habit.longest_streak = max(habit.longest_streak or 0, habit.streak)
+
+
+def recompute_streaks(habit) -> None:
+    """
+    Rebuild streak counters from the bitmap alone.
+
+    Used when a completion is backfilled before the latest completion or when
+    the habit's schedule changes. Runs in time proportional to the bitmap
+    size, never the tracking table.
+    """
+    habit.streak = 0
+    habit.longest_streak = 0
+    habit.last_completed_on = None
+    if habit.bitmap_start is None or not habit.completion_bitmap:
+        return
+    for byte_index, byte in enumerate(habit.completion_bitmap):
+        if not byte:
+            continue
+        for bit in range(8):
+            if byte & (1 << bit):
+                _advance(habit, habit.bitmap_start + timedelta(days=byte_index * 8 + bit))
+
+
+def record_completion(habit, day: date) -> bool:
+    """
+    Record a completion for ``day`` and update streaks in O(1).
+
+    Returns False if the day was already marked as completed.
+    """
+    if is_completed(habit, day):
+        return False
+    _set_bit(habit, day)
+    if habit.last_completed_on is not None and day < habit.last_completed_on:
+        recompute_streaks(habit)
+    else:
+        _advance(habit, day)
+    return True
+
+
+def current_streak(habit, today: date) -> int:
+    """
+    Return the streak as it stands on ``today``.
+
+    The stored streak is only valid while no scheduled period has been
+    missed. Today's period still counts as pending; a scheduled day that
+    already passed does not.
+    """
+    if not habit.streak or habit.last_completed_on is None:
+        return 0
+    last = period_index(habit, habit.last_completed_on)
+    allowed_gap = 1 if period_index(habit, today) is not None else 0
+    if latest_period(habit, today) - last > allowed_gap:
+        return 0
+    return habit.streak
+
+
+def heatmap(habit, start: date, end: date) -> List[int]:
+    """Return one 0/1 value per day between ``start`` and ``end`` inclusive."""
+    days = (end - start).days + 1
+    return [int(is_completed(habit, start + timedelta(days=i))) for i in range(max(days, 0))]
@@ -0,0 +1,359 @@
+"""Streaming import of the format written by ``services.export``.
+
+The upload is read one line at a time and rows are inserted in batches per
+entity type, each batch in its own transaction. Primary keys are never
+carried over: every row gets a fresh id, and foreign keys are rewritten
+through per-type maps of old id to new id. Only types that other rows point
+at (projects, ideas, tags, logs, journals, goals, habits) keep such a map,
+so leaf rows like tasks and activities cost nothing once written.
+
+The export lists parents before their children, which is what lets a single
+pass resolve every reference. Rows whose parent is not in the upload are
+skipped and counted. References between rows of one type (a stored
+occurrence's recurring task) can point either way, so they are inserted as
+NULL and set once all rows of the type are in; one whose target is not in
+the upload stays NULL.
+"""
+import base64
+import json
+import logging
+import os
+import threading
+import uuid
+import zipfile
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Date, DateTime, Enum, LargeBinary, bindparam, insert, select, update
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from models.activity import Activity
+from models.concept import ConceptNote
+from models.development import Goal, GoalProgress, Habit, HabitTracking
+from models.idea import Idea, Tag, idea_tags
+from models.journal import Journal, JournalEntry
+from models.log import Log
+from models.log_entry import LogEntry
+from models.mindmap import Mindmap
+from models.project import Project
+from models.project_idea import project_ideas
+from models.task_dependency import task_dependencies
+from models.task import Task
+from services.export import EXPORT_ENTITIES, EXPORT_FORMAT_VERSION
+from services.journal_tags import rebuild_user_tags
+from services.journal_stats import rebuild_journal_stats
+from services.sync import MODELS_BY_ENTITY, record_changes
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Target table per export type; "user" rows are not imported, every owner
+# column is set to the importing user instead
+IMPORT_TABLES = {
+    "project": Project.__table__,
+    "task": Task.__table__,
+    "task_dependency": task_dependencies,
+    "idea": Idea.__table__,
+    "tag": Tag.__table__,
+    "idea_tag": idea_tags,
+    "project_idea": project_ideas,
+    "concept": ConceptNote.__table__,
+    "mindmap": Mindmap.__table__,
+    "log": Log.__table__,
+    "log_entry": LogEntry.__table__,
+    "journal": Journal.__table__,
+    "journal_entry": JournalEntry.__table__,
+    "activity": Activity.__table__,
+    "goal": Goal.__table__,
+    "goal_progress": GoalProgress.__table__,
+    "habit": Habit.__table__,
+    "habit_tracking": HabitTracking.__table__,
+}
+
+# Tags are shared between users, so they are matched by name instead of
+# being inserted again
+NATURAL_KEYS = {"tag": "name"}
+
+_TYPE_BY_TABLE = {table.name: name for name, table in IMPORT_TABLES.items()}
+_TYPE_BY_TABLE["users"] = "user"
+
+# Types whose new ids have to be remembered for later rows
+REFERENCED_TYPES = {
+    _TYPE_BY_TABLE[fk.column.table.name]
+    for table in IMPORT_TABLES.values()
+    for fk in table.foreign_keys
+} - {"user"}
+
+# Foreign keys from a type to itself, set after the type's last batch
+SELF_REFERENCES = {
+    name: columns
+    for name, table in IMPORT_TABLES.items()
+    if (columns := [fk.parent.name for fk in table.foreign_keys if fk.column.table is table])
+}
+
+
+def _coercer(column) -> Optional[Callable[[Any], Any]]:
+    """Undo the JSON encoding ``services.export`` applied to a column."""
+    column_type = column.type
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat
+    if isinstance(column_type, Date):
+        return date.fromisoformat
+    if isinstance(column_type, Enum) and column_type.enum_class is not None:
+        return column_type.enum_class
+    if isinstance(column_type, LargeBinary):
+        return base64.b64decode
+    return None
+
+
+class ImportJob:
+    def __init__(self, user_id: int):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.status = "pending"
+        self.total_bytes = 0
+        self.bytes_read = 0
+        self.imported: Dict[str, int] = {}
+        self.skipped = 0
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+
+    @property
+    def progress(self) -> float:
+        if self.status == "completed":
+            return 1.0
+        if not self.total_bytes:
+            return 0.0
+        return round(min(self.bytes_read / self.total_bytes, 1.0), 4)
+
+
+class ImportJobStore:
+    """Recent import jobs of this process, oldest evicted first."""
+
+    def __init__(self, max_jobs: int = 100):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, user_id: int) -> ImportJob:
+        job = ImportJob(user_id)
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        return job
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+def iter_records(path: str) -> Iterator[Tuple[str, Dict[str, Any], int]]:
+    """Yield ``(type, data, bytes consumed)`` from an NDJSON or zip export."""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            members = set(archive.namelist())
+            for name, _, _ in EXPORT_ENTITIES:
+                if f"{name}.ndjson" not in members:
+                    continue
+                with archive.open(f"{name}.ndjson") as member:
+                    for line in member:
+                        if line.strip():
+                            yield name, json.loads(line), len(line)
+        return
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("type") == "export":
+                version = record.get("data", {}).get("version")
+                if version != EXPORT_FORMAT_VERSION:
+                    raise ValueError(f"Unsupported export version: {version}")
+                continue
+            yield record["type"], record["data"], len(line)
+
+
+def total_bytes(path: str) -> int:
+    """Size used for progress; the uncompressed size for zip uploads."""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return sum(info.file_size for info in archive.infolist())
+    return os.path.getsize(path)
+
+
+class Importer:
+    def __init__(self, db: Session, user_id: int, job: ImportJob, batch_size: int = None):
+        self.db = db
+        self.user_id = user_id
+        self.job = job
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        self.id_maps: Dict[str, Dict[int, int]] = {name: {} for name in REFERENCED_TYPES}
+        self._coercers: Dict[str, Dict[str, Callable[[Any], Any]]] = {}
+        self._type: Optional[str] = None
+        self._batch: List[Dict[str, Any]] = []
+        # (column, new id, old id it points at) of the current type
+        self._self_references: List[Tuple[str, int, int]] = []
+
+    def add(self, name: str, data: Dict[str, Any]) -> None:
+        if name != self._type:
+            # Parents are flushed before any of their children are read
+            self.finish()
+            self._type = name
+        self._batch.append(data)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        batch, self._batch = self._batch, []
+        name = self._type
+        if not batch or name == "user":
+            return
+        table = IMPORT_TABLES.get(name)
+        if table is None:
+            self.job.skipped += len(batch)
+            return
+        old_ids, rows = [], []
+        for data in batch:
+            row = self._prepare(name, table, data)
+            if row is None:
+                self.job.skipped += 1
+                continue
+            old_ids.append(data.get("id"))
+            rows.append(row)
+        if not rows:
+            return
+        deferred = [
+            (column, index, row[column])
+            for column in SELF_REFERENCES.get(name, ())
+            for index, row in enumerate(rows)
+            if row.get(column) is not None
+        ]
+        for column, index, _ in deferred:
+            rows[index][column] = None
+        try:
+            if name in NATURAL_KEYS:
+                new_ids = self._upsert_by_key(table, NATURAL_KEYS[name], rows)
+            elif name in REFERENCED_TYPES or name in MODELS_BY_ENTITY:
+                # insertmanyvalues returns the new ids in parameter order
+                stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+                new_ids = self.db.execute(stmt, rows).scalars().all()
+                if name in MODELS_BY_ENTITY:
+                    # Core inserts bypass the flush hook that feeds the change log
+                    record_changes(self.db.connection(), self.user_id, name, new_ids)
+            else:
+                self.db.execute(insert(table), rows)
+                new_ids = None
+                if name == "task_dependency":
+                    # Edges are logged on their dependent task, as the dependency routes do
+                    record_changes(self.db.connection(), self.user_id, "task", [row["task_id"] for row in rows])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        if name in self.id_maps:
+            self.id_maps[name].update(zip(old_ids, new_ids))
+        self._self_references.extend((column, new_ids[index], old_id) for column, index, old_id in deferred)
+        self.job.imported[name] = self.job.imported.get(name, 0) + len(rows)
+
+    def finish(self) -> None:
+        """Flush the current type's last batch and set its references to itself."""
+        self.flush()
+        references, self._self_references = self._self_references, []
+        if not references:
+            return
+        name = self._type
+        table = IMPORT_TABLES[name]
+        updates: Dict[str, List[Dict[str, int]]] = defaultdict(list)
+        for column, row_id, old_id in references:
+            new_id = self.id_maps[name].get(old_id)
+            if new_id is not None:
+                updates[column].append({"row_id": row_id, "target_id": new_id})
+        try:
+            for column, params in updates.items():
+                stmt = update(table).where(table.c.id == bindparam("row_id")).values({column: bindparam("target_id")})
+                self.db.execute(stmt, params)
+            if name in MODELS_BY_ENTITY:
+                record_changes(
+                    self.db.connection(), self.user_id, name,
+                    [param["row_id"] for params in updates.values() for param in params]
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def _prepare(self, name: str, table, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        coercers = self._coercers.get(name)
+        if coercers is None:
+            coercers = self._coercers[name] = {
+                column.name: coercer for column in table.columns if (coercer := _coercer(column))
+            }
+        row = {}
+        for column in table.columns:
+            # Fresh primary keys come from the database
+            if column.name not in data or (column.primary_key and column.name == "id"):
+                continue
+            value = data[column.name]
+            if value is not None and column.name in coercers:
+                value = coercers[column.name](value)
+            row[column.name] = value
+        for fk in table.foreign_keys:
+            column = fk.parent.name
+            parent = _TYPE_BY_TABLE.get(fk.column.table.name)
+            if fk.column.table is table:
+                # Remapped by finish(), the target may come later
+                continue
+            if parent == "user":
+                row[column] = self.user_id
+            elif row.get(column) is not None:
+                new_id = self.id_maps[parent].get(row[column])
+                if new_id is None:
+                    return None
+                row[column] = new_id
+        return row
+
+    def _upsert_by_key(self, table, key: str, rows: List[Dict[str, Any]]) -> List[int]:
+        keys = {row[key] for row in rows}
+        existing = dict(self.db.execute(select(table.c[key], table.c.id).where(table.c[key].in_(keys))).all())
+        missing = list({row[key]: row for row in rows if row[key] not in existing}.values())
+        if missing:
+            stmt = insert(table).returning(table.c[key], table.c.id)
+            existing.update(self.db.execute(stmt, missing).all())
+        return [existing[row[key]] for row in rows]
+
+
+def run_import(job: ImportJob, path: str, session_factory: Callable[[], Session]) -> None:
+    """Import the upload at ``path`` for the job's user, then delete it."""
+    db = session_factory()
+    try:
+        job.status = "running"
+        job.total_bytes = total_bytes(path)
+        importer = Importer(db, job.user_id, job)
+        for name, data, size in iter_records(path):
+            importer.add(name, data)
+            job.bytes_read += size
+        importer.finish()
+        # Rows went in through Core inserts, so derive the tag index and
+        # journal counters in one pass each
+        if job.imported.get("journal_entry"):
+            rebuild_user_tags(db, job.user_id)
+        if job.imported.get("journal") or job.imported.get("journal_entry"):
+            rebuild_journal_stats(db, job.user_id)
+        job.status = "completed"
+    except Exception as e:
+        # Batches committed before the failure stay in place; the counts
+        # tell the user how far the import got
+        logger.error(f"Import job {job.id} failed: {str(e)}")
+        job.status = "failed"
+        job.error = str(e)
+    finally:
+        job.finished_at = datetime.utcnow()
+        db.close()
+        os.remove(path)
+
+
+import_jobs = ImportJobStore()
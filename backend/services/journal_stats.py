@@ -0,0 +1,88 @@
+"""Denormalized per-journal statistics.
+
+``Journal.entry_count``, ``word_count`` and ``last_entry_at`` let journal
+lists render without touching the entries. Every entry write in a journal
+calls ``adjust_journal_stats`` before committing, so the counters change in
+the same transaction as the entry. Counts move by relative increments,
+which keeps concurrent writers from overwriting each other, and
+``last_entry_at`` is re-read from the ``(journal_id, created_at, id)``
+index, which also covers deleting the newest entry.
+"""
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from models.journal import Journal, JournalEntry
+
+
+def count_words(content: Optional[str]) -> int:
+    return len(content.split()) if content else 0
+
+
+def _latest_entry_at(journal_id):
+    return (
+        select(func.max(JournalEntry.created_at))
+        .where(JournalEntry.journal_id == journal_id)
+        .scalar_subquery()
+    )
+
+
+def adjust_journal_stats(db: Session, journal_id: int, entries: int = 0, words: int = 0) -> None:
+    """
+    Apply an entry write to the journal's counters.
+
+    Call after the entry change is flushed (``db.delete`` and new entries
+    need a ``db.flush()``), with ``entries`` +1/-1 for a create/delete and
+    ``words`` the change in word count.
+    """
+    db.execute(
+        update(Journal)
+        .where(Journal.id == journal_id)
+        .values(
+            entry_count=Journal.entry_count + entries,
+            word_count=Journal.word_count + words,
+            last_entry_at=_latest_entry_at(journal_id),
+            # Entry writes are not edits of the journal itself
+            updated_at=Journal.updated_at
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def rebuild_journal_stats(db: Session, user_id: int, batch_size: int = 1000) -> None:
+    """Recompute the counters of all the user's journals, e.g. after a bulk import."""
+    entries, words = defaultdict(int), defaultdict(int)
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(JournalEntry.id, JournalEntry.journal_id, JournalEntry.content)
+            .where(
+                JournalEntry.user_id == user_id,
+                JournalEntry.journal_id.isnot(None),
+                JournalEntry.id > last_id
+            )
+            .order_by(JournalEntry.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        for _, journal_id, content in rows:
+            entries[journal_id] += 1
+            words[journal_id] += count_words(content)
+        last_id = rows[-1][0]
+    journal_ids = db.execute(select(Journal.id).where(Journal.user_id == user_id)).scalars().all()
+    for journal_id in journal_ids:
+        db.execute(
+            update(Journal)
+            .where(Journal.id == journal_id)
+            .values(
+                entry_count=entries[journal_id],
+                word_count=words[journal_id],
+                last_entry_at=_latest_entry_at(journal_id),
+                updated_at=Journal.updated_at
+            )
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
@@ -0,0 +1,121 @@
+"""Normalized journal tags and per-user tag counts.
+
+``JournalEntry.tags`` (JSON) is what the API returns, but it cannot be
+indexed. Every write that changes an entry's tags also goes through
+``sync_entry_tags``, which updates the ``journal_entry_tags`` association
+rows and the ``journal_tag_counts`` counters in the same transaction, so
+tag filters become index lookups and the tag cloud is a single read.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from models.journal import JournalEntry, JournalTagCount, journal_entry_tags
+
+MAX_TAG_LENGTH = 50
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """Trimmed, de-duplicated tags in their original order, as stored in the index."""
+    seen = []
+    for tag in tags or []:
+        tag = str(tag).strip()[:MAX_TAG_LENGTH]
+        if tag and tag not in seen:
+            seen.append(tag)
+    return seen
+
+
+def _adjust_counts(db: Session, user_id: int, deltas: Dict[str, int]) -> None:
+    increments = [{"user_id": user_id, "tag": tag, "count": delta} for tag, delta in deltas.items() if delta > 0]
+    if increments:
+        dialect_insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else postgresql_insert
+        upsert = dialect_insert(JournalTagCount)
+        db.execute(
+            upsert.on_conflict_do_update(
+                index_elements=["user_id", "tag"],
+                set_={"count": JournalTagCount.count + upsert.excluded.count}
+            ),
+            increments
+        )
+    decrements = {tag: delta for tag, delta in deltas.items() if delta < 0}
+    for tag, delta in decrements.items():
+        db.execute(
+            update(JournalTagCount)
+            .where(JournalTagCount.user_id == user_id, JournalTagCount.tag == tag)
+            .values(count=JournalTagCount.count + delta)
+        )
+    if decrements:
+        db.execute(delete(JournalTagCount).where(JournalTagCount.user_id == user_id, JournalTagCount.count <= 0))
+
+
+def _sync(db: Session, entry_id: int, user_id: int, old_tags, new_tags) -> None:
+    old, new = set(normalize_tags(old_tags)), set(normalize_tags(new_tags))
+    added, removed = new - old, old - new
+    if removed:
+        db.execute(delete(journal_entry_tags).where(
+            journal_entry_tags.c.entry_id == entry_id,
+            journal_entry_tags.c.tag.in_(removed)
+        ))
+    if added:
+        db.execute(insert(journal_entry_tags), [
+            {"entry_id": entry_id, "tag": tag, "user_id": user_id} for tag in added
+        ])
+    if added or removed:
+        _adjust_counts(db, user_id, {**{tag: 1 for tag in added}, **{tag: -1 for tag in removed}})
+
+
+def sync_entry_tags(db: Session, entry: JournalEntry, old_tags: Optional[Iterable[str]] = None) -> None:
+    """
+    Bring the index rows and counts for ``entry`` in line with its tags.
+
+    ``old_tags`` are the tags the entry had before this change (None for a
+    new entry). Call once the entry has an id, before committing.
+    """
+    _sync(db, entry.id, entry.user_id, old_tags, entry.tags)
+
+
+def remove_entry_tags(db: Session, entry: JournalEntry) -> None:
+    """Drop ``entry`` from the tag counts; call before deleting it."""
+    _sync(db, entry.id, entry.user_id, entry.tags, None)
+
+
+def entries_with_any_tag(user_id: int, tags: Iterable[str]):
+    """Subquery of the user's entry ids carrying at least one of ``tags``."""
+    return select(journal_entry_tags.c.entry_id).where(
+        journal_entry_tags.c.user_id == user_id,
+        journal_entry_tags.c.tag.in_(normalize_tags(tags))
+    )
+
+
+def rebuild_user_tags(db: Session, user_id: int, batch_size: int = 1000) -> None:
+    """Re-derive a user's index rows and counts from the JSON column, e.g. after a bulk import."""
+    db.execute(delete(journal_entry_tags).where(journal_entry_tags.c.user_id == user_id))
+    db.execute(delete(JournalTagCount).where(JournalTagCount.user_id == user_id))
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(JournalEntry.id, JournalEntry.tags)
+            .where(JournalEntry.user_id == user_id, JournalEntry.id > last_id)
+            .order_by(JournalEntry.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        links = [
+            {"entry_id": entry_id, "tag": tag, "user_id": user_id}
+            for entry_id, tags in rows for tag in normalize_tags(tags)
+        ]
+        if links:
+            db.execute(insert(journal_entry_tags), links)
+        last_id = rows[-1][0]
+    counts = db.execute(
+        select(journal_entry_tags.c.tag, func.count())
+        .where(journal_entry_tags.c.user_id == user_id)
+        .group_by(journal_entry_tags.c.tag)
+    ).all()
+    if counts:
+        db.execute(insert(JournalTagCount), [{"user_id": user_id, "tag": tag, "count": count} for tag, count in counts])
+    db.commit()
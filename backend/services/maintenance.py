@@ -0,0 +1,170 @@
+"""Periodic database maintenance jobs run in the background of the API process."""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import Base, SessionLocal
+from models.project import Project
+from models.refresh_token import RefreshToken
+from models.password_reset import PasswordReset
+from services.bug_reports import render_bug_reports
+from services.reminders import reminder_scheduler
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def _delete_in_batches(db: Session, model, condition, batch_size: int) -> int:
+    """
+    Delete rows matching ``condition`` in primary-key batches.
+
+    Each batch is committed on its own so the purge never holds a long write
+    lock or builds a huge transaction.
+    """
+    deleted = 0
+    while True:
+        ids = [row[0] for row in db.query(model.id).filter(condition).limit(batch_size).all()]
+        if not ids:
+            break
+        db.query(model).filter(model.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+        deleted += len(ids)
+        if len(ids) < batch_size:
+            break
+    return deleted
+
+
+def purge_expired_auth_tokens(db: Session, batch_size: int = None) -> Dict[str, int]:
+    """Delete expired or revoked refresh tokens and expired or used password resets."""
+    batch_size = batch_size or settings.TOKEN_PURGE_BATCH_SIZE
+    now = datetime.utcnow()
+    refresh_tokens = _delete_in_batches(
+        db,
+        RefreshToken,
+        or_(RefreshToken.expires_at < now, RefreshToken.revoked == True),
+        batch_size
+    )
+    password_resets = _delete_in_batches(
+        db,
+        PasswordReset,
+        or_(PasswordReset.expires_at < now, PasswordReset.used_at.isnot(None)),
+        batch_size
+    )
+    return {"refresh_tokens": refresh_tokens, "password_resets": password_resets}
+
+
+def purge_expired_auth_tokens_job() -> None:
+    """Run the auth token purge with its own session."""
+    db = SessionLocal()
+    try:
+        purged = purge_expired_auth_tokens(db)
+        if any(purged.values()):
+            logger.info(f"Purged expired auth tokens: {purged}")
+    finally:
+        db.close()
+
+
+def _cascading_children(table) -> List[tuple]:
+    """
+    ``(child table, foreign key column)`` for every ON DELETE CASCADE
+    reference to ``table`` from another table. Self-references (occurrences
+    of a recurring task) are left to the database's own cascade.
+    """
+    return [
+        (child, fk.parent)
+        for child in Base.metadata.sorted_tables
+        for fk in child.foreign_keys
+        if fk.column.table is table and child is not table and fk.ondelete == "CASCADE"
+    ]
+
+
+def _purge_rows(db: Session, table, condition, batch_size: int) -> int:
+    """
+    Delete rows of ``table`` matching ``condition`` and everything that
+    cascades from them, deepest tables first.
+
+    The database would cascade on its own, but one DELETE of a big project
+    would then remove every dependent row in a single transaction.
+    """
+    deleted = 0
+    for child, column in _cascading_children(table):
+        deleted += _purge_rows(db, child, column.in_(select(table.c.id).where(condition)), batch_size)
+    if "id" not in table.c:
+        # Association tables hold one small row per link
+        deleted += db.execute(delete(table).where(condition)).rowcount
+        db.commit()
+        return deleted
+    while True:
+        ids = db.execute(select(table.c.id).where(condition).limit(batch_size)).scalars().all()
+        if not ids:
+            break
+        db.execute(delete(table).where(table.c.id.in_(ids)))
+        db.commit()
+        deleted += len(ids)
+        if len(ids) < batch_size:
+            break
+    return deleted
+
+
+def purge_deleted_projects(db: Session, batch_size: int = None) -> Dict[str, int]:
+    """Remove tombstoned projects and their rows in bounded batches."""
+    batch_size = batch_size or settings.PROJECT_PURGE_BATCH_SIZE
+    project_ids = db.execute(select(Project.id).where(Project.deleted_at.isnot(None))).scalars().all()
+    rows = 0
+    for project_id in project_ids:
+        rows += _purge_rows(db, Project.__table__, Project.id == project_id, batch_size)
+    return {"projects": len(project_ids), "rows": rows}
+
+
+def purge_deleted_projects_job() -> None:
+    """Run the project purge with its own session."""
+    db = SessionLocal()
+    try:
+        purged = purge_deleted_projects(db)
+        if purged["projects"]:
+            logger.info(f"Purged deleted projects: {purged}")
+    finally:
+        db.close()
+
+
+async def run_periodically(job: Callable[[], None], interval_seconds: float) -> None:
+    """Run a blocking job in a worker thread every ``interval_seconds``."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(job)
+        except Exception as e:
+            logger.error(f"Maintenance job {job.__name__} failed: {str(e)}")
+
+
+def start_maintenance_tasks() -> List[asyncio.Task]:
+    """Schedule all periodic maintenance jobs on the running event loop."""
+    tasks = [
+        asyncio.create_task(run_periodically(
+            purge_expired_auth_tokens_job,
+            settings.TOKEN_PURGE_INTERVAL_MINUTES * 60
+        )),
+        asyncio.create_task(run_periodically(
+            render_bug_reports,
+            settings.BUG_REPORT_RENDER_INTERVAL_SECONDS
+        )),
+        asyncio.create_task(run_periodically(
+            purge_deleted_projects_job,
+            settings.PROJECT_PURGE_INTERVAL_SECONDS
+        )),
+    ]
+    if settings.REMINDERS_ENABLED:
+        tasks.append(asyncio.create_task(reminder_scheduler.run()))
+    return tasks
+
+
+async def stop_maintenance_tasks(tasks: List[asyncio.Task]) -> None:
+    """Cancel periodic jobs and wait for them to finish."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
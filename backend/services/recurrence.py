@@ -0,0 +1,162 @@
+"""Recurrence rules for recurring tasks.
+
+Rules use a subset of RFC 5545 RRULE syntax, e.g.
+``FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;COUNT=10``:
+
+- ``FREQ``: ``DAILY``, ``WEEKLY``, ``MONTHLY`` or ``YEARLY`` (required)
+- ``INTERVAL``: repeat every n periods (default 1)
+- ``BYDAY``: weekdays (``MO`` .. ``SU``) for daily and weekly rules
+- ``COUNT`` or ``UNTIL`` (``YYYYMMDD`` or ``YYYYMMDDTHHMMSS[Z]``, UTC)
+
+The series starts at the template task's due date, which is its first
+occurrence when it matches the rule. Monthly and yearly rules skip periods
+that lack the start's day (the 31st, February 29th).
+
+Expansions are cached per rule, start and window, so listing the same
+calendar range again doesn't regenerate it.
+"""
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+# Occurrences returned for one series in one window at most. Without a
+# window start these are the latest ones before the window's end
+MAX_OCCURRENCES = 1000
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+PERIOD_DAYS = {"DAILY": 1, "WEEKLY": 7}
+
+
+class RecurrenceRule(NamedTuple):
+    freq: str
+    interval: int = 1
+    by_day: Tuple[int, ...] = ()
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+
+def _parse_until(value: str) -> datetime:
+    for format in ("%Y%m%dT%H%M%SZ", "%Y%m%dT%H%M%S", "%Y%m%d"):
+        try:
+            until = datetime.strptime(value, format)
+        except ValueError:
+            continue
+        # A bare date includes that whole day
+        return until + timedelta(days=1, microseconds=-1) if format == "%Y%m%d" else until
+    raise ValueError(f"Invalid UNTIL: {value}")
+
+
+@lru_cache(maxsize=256)
+def parse_rule(rule: str) -> RecurrenceRule:
+    """Parse a rule string; raises ``ValueError`` naming the offending part."""
+    text = rule.strip()
+    if text.upper().startswith("RRULE:"):
+        text = text[len("RRULE:"):]
+    parts = {}
+    for part in filter(None, text.split(";")):
+        key, separator, value = part.partition("=")
+        if not separator or not value:
+            raise ValueError(f"Invalid rule part: {part}")
+        parts[key.strip().upper()] = value.strip().upper()
+
+    freq = parts.pop("FREQ", None)
+    if freq not in FREQUENCIES:
+        raise ValueError("FREQ must be one of " + ", ".join(FREQUENCIES))
+    try:
+        interval = int(parts.pop("INTERVAL", "1"))
+        count = int(parts.pop("COUNT")) if "COUNT" in parts else None
+    except ValueError:
+        raise ValueError("INTERVAL and COUNT must be integers")
+    if interval < 1 or (count is not None and count < 1):
+        raise ValueError("INTERVAL and COUNT must be positive")
+    by_day = ()
+    if "BYDAY" in parts:
+        if freq not in ("DAILY", "WEEKLY"):
+            raise ValueError("BYDAY is only supported for DAILY and WEEKLY rules")
+        days = parts.pop("BYDAY").split(",")
+        if any(day not in WEEKDAYS for day in days):
+            raise ValueError("BYDAY takes weekdays MO, TU, WE, TH, FR, SA, SU")
+        by_day = tuple(sorted({WEEKDAYS.index(day) for day in days}))
+    until = _parse_until(parts.pop("UNTIL")) if "UNTIL" in parts else None
+    if count is not None and until is not None:
+        raise ValueError("COUNT and UNTIL are mutually exclusive")
+    if parts:
+        raise ValueError("Unsupported rule parts: " + ", ".join(sorted(parts)))
+    return RecurrenceRule(freq, interval, by_day, count, until)
+
+
+def _add_months(start: datetime, months: int) -> Optional[datetime]:
+    year, month = divmod(start.month - 1 + months, 12)
+    try:
+        return start.replace(year=start.year + year, month=month + 1)
+    except ValueError:
+        return None
+
+
+def _candidates(rule: RecurrenceRule, dtstart: datetime, first_period: int) -> Iterator[Tuple[datetime, bool]]:
+    """
+    ``(candidate, matches)`` in order from period ``first_period`` of the
+    series. Candidates that don't match still bound the search, so a rule
+    that never matches ends at the window instead of looping.
+    """
+    period = first_period
+    while True:
+        if rule.freq == "DAILY":
+            day = dtstart + timedelta(days=period * rule.interval)
+            yield day, not rule.by_day or day.weekday() in rule.by_day
+        elif rule.freq == "WEEKLY":
+            if rule.by_day:
+                week_start = dtstart - timedelta(days=dtstart.weekday()) + timedelta(weeks=period * rule.interval)
+                for weekday in rule.by_day:
+                    day = week_start + timedelta(days=weekday)
+                    yield day, day >= dtstart
+            else:
+                yield dtstart + timedelta(weeks=period * rule.interval), True
+        else:
+            months = period * rule.interval * (12 if rule.freq == "YEARLY" else 1)
+            day = _add_months(dtstart, months)
+            if day is None:
+                yield _add_months(dtstart.replace(day=1), months), False
+            else:
+                yield day, True
+        period += 1
+
+
+def _naive(timestamp: Optional[datetime]) -> Optional[datetime]:
+    # Due dates are stored as naive UTC; query bounds may carry an offset
+    if timestamp is not None and timestamp.tzinfo is not None:
+        return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+@lru_cache(maxsize=1024)
+def _expand(rule_text: str, dtstart: datetime, start: Optional[datetime], end: datetime) -> Tuple[datetime, ...]:
+    rule = parse_rule(rule_text)
+    first_period = 0
+    if rule.count is None and rule.freq in PERIOD_DAYS and start is not None and start > dtstart:
+        # Without a COUNT the periods before the window needn't be walked
+        first_period = max((start - dtstart).days // (PERIOD_DAYS[rule.freq] * rule.interval) - 1, 0)
+    # An open start keeps only the last occurrences walked, rather than
+    # stopping at the series' oldest ones
+    occurrences = deque(maxlen=MAX_OCCURRENCES if start is None else None)
+    seen = 0
+    for occurrence, matches in _candidates(rule, dtstart, first_period):
+        if occurrence > end or (rule.until is not None and occurrence > rule.until):
+            break
+        if not matches:
+            continue
+        seen += 1
+        if start is None or occurrence >= start:
+            occurrences.append(occurrence)
+            if start is not None and len(occurrences) >= MAX_OCCURRENCES:
+                break
+        if rule.count is not None and seen >= rule.count:
+            break
+    return tuple(occurrences)
+
+
+def expand(rule: str, dtstart: datetime, start: Optional[datetime], end: datetime) -> Tuple[datetime, ...]:
+    """Occurrences of the series starting at ``dtstart`` within ``[start, end]``."""
+    return _expand(rule, _naive(dtstart), _naive(start), _naive(end))
@@ -0,0 +1,190 @@
+"""Due-date reminders.
+
+``ReminderScheduler`` sends a ``reminder.due`` event on the owner's live
+update channel (see ``services.events``) ``REMINDER_LEAD_MINUTES`` before
+each open task is due.
+
+Rather than scanning every task on each tick, it keeps a min-heap of just
+the reminders firing before ``loaded_until``, at most
+``REMINDER_WINDOW_MINUTES`` ahead, and reads the next slice of the
+``due_date`` index as the window advances. Task creates, updates and
+deletes reach it through the change log (``services.sync``), which it tails
+by sequence number, so writes from any path or worker reschedule or drop
+their reminder; superseded heap entries are skipped when popped.
+
+Sending claims each reminder with a conditional update of
+``tasks.reminder_sent_for`` that also re-checks the task is still open and
+due at that time, so only one worker sends it, and moving the due date
+re-arms it. Tasks already past due when they are first seen get none.
+"""
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import SessionLocal
+from models.task import Task, TaskStatus
+from services.events import publish_change
+from services.sync import change_log
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Change log entries read per query while catching up
+CHANGE_BATCH_SIZE = 1000
+
+Reminder = Dict[str, Any]
+
+
+def _unsent():
+    """Open tasks with a due date whose reminder for that date hasn't gone out."""
+    return (
+        Task.due_date.is_not(None),
+        Task.status != TaskStatus.DONE,
+        or_(Task.reminder_sent_for.is_(None), Task.reminder_sent_for != Task.due_date),
+    )
+
+
+class ReminderScheduler:
+    def __init__(
+        self,
+        lead: timedelta = None,
+        window: timedelta = None,
+        poll_interval: float = None,
+        session_factory: Callable[[], Session] = None
+    ):
+        self.lead = lead if lead is not None else timedelta(minutes=settings.REMINDER_LEAD_MINUTES)
+        self.window = window or timedelta(minutes=settings.REMINDER_WINDOW_MINUTES)
+        self.poll_interval = poll_interval or settings.REMINDER_POLL_SECONDS
+        self.session_factory = session_factory or SessionLocal
+        self._heap: List[Tuple[datetime, int]] = []
+        # Current reminder per task; heap entries that don't match it are stale
+        self._pending: Dict[int, Reminder] = {}
+        self.loaded_until: Optional[datetime] = None
+        self.last_seq: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _add(self, row) -> None:
+        fire_at = row.due_date - self.lead
+        self._pending[row.id] = {
+            "fire_at": fire_at,
+            "task_id": row.id,
+            "user_id": row.user_id,
+            "project_id": row.project_id,
+            "title": row.title,
+            "due_date": row.due_date,
+        }
+        heapq.heappush(self._heap, (fire_at, row.id))
+
+    def _select(self, *conditions):
+        return select(Task.id, Task.user_id, Task.project_id, Task.title, Task.due_date).where(*_unsent(), *conditions)
+
+    def load_until(self, db: Session, now: datetime, until: datetime) -> None:
+        """Add the reminders firing before ``until`` that aren't held yet."""
+        lower = now if self.loaded_until is None else max(now, self.loaded_until + self.lead)
+        for row in db.execute(self._select(Task.due_date >= lower, Task.due_date < until + self.lead)):
+            self._add(row)
+        self.loaded_until = until
+
+    def apply_changes(self, db: Session, now: datetime) -> None:
+        """Reschedule or drop the reminders of tasks written since the last call."""
+        while True:
+            entries = db.execute(
+                select(change_log.c.seq, change_log.c.entity_id)
+                .where(change_log.c.seq > self.last_seq, change_log.c.entity == "task")
+                .order_by(change_log.c.seq)
+                .limit(CHANGE_BATCH_SIZE)
+            ).all()
+            if not entries:
+                return
+            self.last_seq = entries[-1].seq
+            ids = {entry.entity_id for entry in entries}
+            for task_id in ids:
+                self._pending.pop(task_id, None)
+            for row in db.execute(self._select(
+                Task.id.in_(ids), Task.due_date >= now, Task.due_date < self.loaded_until + self.lead
+            )):
+                self._add(row)
+            if len(entries) < CHANGE_BATCH_SIZE:
+                return
+
+    def pop_due(self, now: datetime) -> List[Reminder]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, task_id = heapq.heappop(self._heap)
+            reminder = self._pending.get(task_id)
+            if reminder is not None and reminder["fire_at"] == fire_at:
+                due.append(self._pending.pop(task_id))
+        if len(self._heap) > 2 * len(self._pending) + 64:
+            # Drop entries superseded by reschedules
+            self._heap = [(reminder["fire_at"], task_id) for task_id, reminder in self._pending.items()]
+            heapq.heapify(self._heap)
+        return due
+
+    def send(self, db: Session, reminders: List[Reminder]) -> int:
+        claimed = []
+        for reminder in reminders:
+            result = db.execute(
+                update(Task)
+                .where(Task.id == reminder["task_id"], Task.due_date == reminder["due_date"], *_unsent())
+                # Not an edit of the task; keep updated_at as it was
+                .values(reminder_sent_for=Task.due_date, updated_at=Task.updated_at)
+            )
+            if result.rowcount:
+                claimed.append(reminder)
+        db.commit()
+        for reminder in claimed:
+            publish_change("reminder", "due", reminder["task_id"], reminder["user_id"], data={
+                "task_id": reminder["task_id"],
+                "project_id": reminder["project_id"],
+                "title": reminder["title"],
+                "due_date": reminder["due_date"],
+            })
+        return len(claimed)
+
+    def tick(self, db: Session, now: datetime = None) -> int:
+        """Catch up with task writes, advance the window and send what is due; returns how many were sent."""
+        now = now or datetime.utcnow()
+        if self.last_seq is None:
+            # Changes logged while the first window loads are replayed next tick
+            self.last_seq = db.execute(select(func.max(change_log.c.seq))).scalar() or 0
+            self.load_until(db, now, now + self.window)
+        else:
+            self.apply_changes(db, now)
+            if self.loaded_until - now <= self.window / 2:
+                self.load_until(db, now, now + self.window)
+        return self.send(db, self.pop_due(now))
+
+    def seconds_until_next(self, now: datetime) -> float:
+        delay = self.poll_interval
+        if self._heap:
+            delay = min(delay, (self._heap[0][0] - now).total_seconds())
+        return max(delay, 0)
+
+    def _tick_job(self) -> None:
+        db = self.session_factory()
+        try:
+            sent = self.tick(db)
+            if sent:
+                logger.info(f"Sent {sent} due-date reminders")
+        finally:
+            db.close()
+
+    async def run(self) -> None:
+        """Tick in a worker thread whenever a reminder is due or the poll interval passes."""
+        while True:
+            try:
+                await asyncio.to_thread(self._tick_job)
+            except Exception as e:
+                logger.error(f"Reminder scheduler tick failed: {str(e)}")
+            await asyncio.sleep(self.seconds_until_next(datetime.utcnow()))
+
+
+reminder_scheduler = ReminderScheduler()
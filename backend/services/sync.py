@@ -0,0 +1,200 @@
+"""Change log for delta sync.
+
+An ``after_flush`` hook on every ORM session records, for each synced record
+that was inserted, updated or deleted, one ``change_log`` row carrying a
+fresh sequence number and the owning user. Each record keeps only its
+latest entry, so the log grows with the number of records and tombstones,
+not with write volume. A client that last synced at ``seq`` asks for the
+user's entries after it and gets back just the records that changed since,
+deletes included.
+
+Entity names match the export format. Deleting or tombstoning a project
+removes its tasks, concepts and mindmaps with it (in the database, without
+ORM events), so clients drop those along with the project's tombstone.
+Deleting a recurring task also removes its stored occurrences in the
+database, but those get tombstones of their own, logged by the task routes
+before the delete.
+Writes that go through Core statements instead of the ORM call
+``record_changes`` themselves.
+
+Readers resume from the highest ``seq`` they have seen, so sequence numbers
+must become visible in order. SQLite lets one transaction write at a time,
+which makes allocation order commit order. On PostgreSQL, entries are
+written with a provisional negative ``seq`` (invisible to readers, who ask
+for ``seq > since``) and get their final numbers in ``before_commit`` under
+a transaction-level advisory lock, which is held until the commit is
+visible. Concurrent writes of one record meet on the unique
+``(entity, entity_id)`` index and upsert instead of failing.
+"""
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, event, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from models.change_log import ChangeLogEntry
+from models.concept import ConceptNote
+from models.idea import Idea
+from models.journal import JournalEntry
+from models.log import Log
+from models.log_entry import LogEntry
+from models.mindmap import Mindmap
+from models.project import Project
+from models.task import Task
+
+SYNCED_MODELS = {
+    Project: "project",
+    Task: "task",
+    Idea: "idea",
+    ConceptNote: "concept",
+    Mindmap: "mindmap",
+    Log: "log",
+    LogEntry: "log_entry",
+    JournalEntry: "journal_entry",
+}
+MODELS_BY_ENTITY = {entity: model for model, entity in SYNCED_MODELS.items()}
+
+change_log = ChangeLogEntry.__table__
+
+# Arbitrary key of the advisory lock serializing seq assignment on PostgreSQL
+SEQ_LOCK_KEY = 0x63686C67
+# Connection.info flag: this transaction wrote provisional entries
+PROVISIONAL = "change_log_provisional"
+
+
+def _next_seq():
+    return func.nextval(func.pg_get_serial_sequence(change_log.name, "seq"))
+
+
+def record_changes(connection, user_id: int, entity: str, ids: Iterable[int], action: str = "upsert") -> None:
+    """
+    Append ``action`` entries for ``ids``, replacing each record's previous
+    entry. Call it inside a ``Session`` transaction, whose commit assigns
+    the final sequence numbers.
+    """
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        return
+    if connection.dialect.name == "postgresql":
+        statement = pg_insert(change_log).values([
+            {"seq": -_next_seq(), "user_id": user_id, "entity": entity, "entity_id": id, "action": action}
+            for id in ids
+        ])
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=[change_log.c.entity, change_log.c.entity_id],
+            set_={
+                "seq": statement.excluded.seq,
+                "user_id": statement.excluded.user_id,
+                "action": statement.excluded.action,
+                "changed_at": func.now(),
+            }
+        ))
+        connection.info[PROVISIONAL] = True
+        return
+    connection.execute(delete(change_log).where(change_log.c.entity == entity, change_log.c.entity_id.in_(ids)))
+    connection.execute(insert(change_log), [
+        {"user_id": user_id, "entity": entity, "entity_id": id, "action": action} for id in ids
+    ])
+
+
+def assign_final_seqs(connection) -> None:
+    """Replace this transaction's provisional seqs; the lock is held until it commits."""
+    if not connection.info.pop(PROVISIONAL, False):
+        return
+    connection.execute(select(func.pg_advisory_xact_lock(SEQ_LOCK_KEY)))
+    connection.execute(update(change_log).where(change_log.c.seq < 0).values(seq=_next_seq()))
+
+
+def _owner_id(connection, instance) -> Optional[int]:
+    if isinstance(instance, Project):
+        return instance.owner_id
+    if isinstance(instance, Mindmap):
+        # Mindmaps belong to a project, not a user
+        return connection.execute(select(Project.owner_id).where(Project.id == instance.project_id)).scalar()
+    return instance.user_id
+
+
+def _record_flush(session: Session, flush_context) -> None:
+    changes: Dict[Tuple[str, int], Tuple[Any, str]] = {}
+    for instance in session.new:
+        if type(instance) in SYNCED_MODELS:
+            changes[(SYNCED_MODELS[type(instance)], instance.id)] = (instance, "upsert")
+    for instance in session.dirty:
+        if type(instance) in SYNCED_MODELS and session.is_modified(instance, include_collections=False):
+            # Tombstoned projects read as deleted; the purge job removes them later
+            action = "delete" if isinstance(instance, Project) and instance.deleted_at is not None else "upsert"
+            changes[(SYNCED_MODELS[type(instance)], instance.id)] = (instance, action)
+    for instance in session.deleted:
+        if type(instance) in SYNCED_MODELS:
+            changes[(SYNCED_MODELS[type(instance)], instance.id)] = (instance, "delete")
+    if not changes:
+        return
+
+    connection = session.connection()
+    grouped: Dict[Tuple[int, str, str], List[int]] = defaultdict(list)
+    for (entity, id), (instance, action) in changes.items():
+        user_id = _owner_id(connection, instance)
+        if user_id is not None:
+            grouped[(user_id, entity, action)].append(id)
+    for (user_id, entity, action), ids in grouped.items():
+        record_changes(connection, user_id, entity, ids, action)
+
+
+def _commit_in_seq_order(session: Session) -> None:
+    if session.bind is None or session.bind.dialect.name != "postgresql" or not session.in_transaction():
+        return
+    # Flush now so entries written by the commit's own flush are numbered too
+    session.flush()
+    assign_final_seqs(session.connection())
+
+
+def _forget_provisional(connection) -> None:
+    connection.info.pop(PROVISIONAL, None)
+
+
+event.listen(Session, "after_flush", _record_flush)
+event.listen(Session, "before_commit", _commit_in_seq_order)
+event.listen(Connection, "rollback", _forget_provisional)
+
+
+def changes_since(db: Session, user_id: int, since: int, limit: int) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """
+    Return the user's changes after ``since`` in sequence order, the
+    sequence number to resume from, and whether more changes are waiting.
+
+    Upserts carry the record's current row; records that vanished without a
+    tombstone (removed by a database cascade) are reported as deleted.
+    """
+    entries = db.execute(
+        select(change_log.c.seq, change_log.c.entity, change_log.c.entity_id, change_log.c.action)
+        .where(change_log.c.user_id == user_id, change_log.c.seq > since)
+        .order_by(change_log.c.seq)
+        .limit(limit + 1)
+    ).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    upserts: Dict[str, List[int]] = defaultdict(list)
+    for entry in entries:
+        if entry.action == "upsert" and entry.entity in MODELS_BY_ENTITY:
+            upserts[entry.entity].append(entry.entity_id)
+    rows: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    for entity, ids in upserts.items():
+        table = MODELS_BY_ENTITY[entity].__table__
+        for row in db.execute(select(table).where(table.c.id.in_(ids))).mappings():
+            rows[(entity, row["id"])] = dict(row)
+
+    changes = []
+    for entry in entries:
+        data = rows.get((entry.entity, entry.entity_id)) if entry.action == "upsert" else None
+        changes.append({
+            "seq": entry.seq,
+            "entity": entry.entity,
+            "id": entry.entity_id,
+            "action": "upsert" if data is not None else "delete",
+            "data": data,
+        })
+    next_since = entries[-1].seq if entries else since
+    return changes, next_since, has_more
@@ -0,0 +1,423 @@
+"""Dependency graph of a project's tasks.
+
+``task_dependencies`` holds one edge per prerequisite. A ``TaskGraph`` keeps
+a project's tasks in a topological order that is maintained incrementally
+as edges are added (Pearce-Kelly), which is also where an edge closing a
+cycle is rejected. For every task it tracks
+
+- ``depth``: open tasks on the longest chain ending at it, itself included,
+  i.e. the earliest step by which it can be finished;
+- ``height``: open tasks on the longest chain starting at it;
+- ``deadline``: the latest it may finish for it and every task after it to
+  meet their due dates.
+
+Tasks carry no estimates, so each open task counts as one step of
+``TASK_GRAPH_STEP_HOURS`` and done tasks take none. After an edge, status or
+due date change only the tasks downstream (depth) or upstream (height,
+deadline) whose values actually move are recomputed.
+
+The critical path is the longest chain of open tasks. A task's float is how
+many steps it can slip without lengthening that chain; its slack is how
+many hours are left before a due date it is bound by would be missed.
+
+Built graphs are cached per project and kept current from the change log
+(``services.sync``): every write to a task or its dependencies, from any
+path or worker, logs the task, and the cache tails the log's task entries
+and applies each changed task's status, due date, project and edges to the
+cached graphs with the incremental methods above. Writes to other records
+or to projects that aren't cached cost one range read of the log.
+"""
+import heapq
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import RoutingSession
+from models.change_log import ChangeLogEntry
+from models.task import Task, TaskStatus
+from models.task_dependency import task_dependencies
+
+settings = get_settings()
+
+# Change log entries read per query while catching up
+CHANGE_BATCH_SIZE = 1000
+
+
+class DependencyCycleError(ValueError):
+    def __init__(self, cycle: List[int]):
+        # Each task in ``cycle`` depends on the one after it
+        self.cycle = cycle
+        super().__init__("Dependency would create a cycle: " + " -> ".join(str(id) for id in cycle))
+
+
+class TaskGraph:
+    def __init__(self, step: timedelta = None):
+        self.step = step or timedelta(hours=settings.TASK_GRAPH_STEP_HOURS)
+        self.preds: Dict[int, Set[int]] = {}
+        self.succs: Dict[int, Set[int]] = {}
+        self.done: Dict[int, bool] = {}
+        self.due: Dict[int, Optional[datetime]] = {}
+        self.order: Dict[int, int] = {}
+        self.depth: Dict[int, int] = {}
+        self.height: Dict[int, int] = {}
+        self.deadline: Dict[int, Optional[datetime]] = {}
+        self._next_order = 0
+
+    @classmethod
+    def build(
+        cls,
+        tasks: Iterable[Tuple[int, bool, Optional[datetime]]],
+        edges: Iterable[Tuple[int, int]],
+        step: timedelta = None
+    ) -> "TaskGraph":
+        """Build from ``(id, done, due_date)`` rows and ``(task_id, depends_on_id)`` edges in one pass."""
+        graph = cls(step)
+        for task_id, done, due in tasks:
+            graph.preds[task_id] = set()
+            graph.succs[task_id] = set()
+            graph.done[task_id] = done
+            graph.due[task_id] = due
+        for task_id, depends_on_id in edges:
+            # Edges left behind by a task moved to another project are inert
+            if task_id in graph.preds and depends_on_id in graph.preds:
+                graph.preds[task_id].add(depends_on_id)
+                graph.succs[depends_on_id].add(task_id)
+
+        # Kahn's algorithm, lowest id first among the ready tasks
+        remaining = {task_id: len(preds) for task_id, preds in graph.preds.items()}
+        heap = [task_id for task_id, count in remaining.items() if count == 0]
+        heapq.heapify(heap)
+        while len(graph.order) < len(graph.preds):
+            if not heap:
+                # Only concurrent inserts can store a cycle; break it at its
+                # lowest id instead of failing the whole project
+                task_id = min(id for id, count in remaining.items() if count > 0)
+                for pred in [pred for pred in graph.preds[task_id] if pred not in graph.order]:
+                    graph.preds[task_id].discard(pred)
+                    graph.succs[pred].discard(task_id)
+                remaining[task_id] = 0
+                heap.append(task_id)
+            task_id = heapq.heappop(heap)
+            graph.order[task_id] = graph._next_order
+            graph._next_order += 1
+            for succ in graph.succs[task_id]:
+                remaining[succ] -= 1
+                if remaining[succ] == 0:
+                    heapq.heappush(heap, succ)
+
+        ordered = graph.topological_order()
+        for task_id in ordered:
+            graph.depth[task_id] = graph._depth_of(task_id)
+        for task_id in reversed(ordered):
+            graph.height[task_id], graph.deadline[task_id] = graph._height_and_deadline_of(task_id)
+        return graph
+
+    @classmethod
+    def load(cls, db: Session, project_id: int) -> "TaskGraph":
+        tasks = db.execute(
+            select(Task.id, Task.status, Task.due_date).where(Task.project_id == project_id)
+        ).all()
+        edges = db.execute(
+            select(task_dependencies.c.task_id, task_dependencies.c.depends_on_id)
+            .join(Task, Task.id == task_dependencies.c.task_id)
+            .where(Task.project_id == project_id)
+        ).all()
+        return cls.build(((id, status == TaskStatus.DONE, due) for id, status, due in tasks), edges)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self.preds
+
+    def _weight(self, task_id: int) -> int:
+        return 0 if self.done[task_id] else 1
+
+    def _depth_of(self, task_id: int) -> int:
+        return self._weight(task_id) + max((self.depth[pred] for pred in self.preds[task_id]), default=0)
+
+    def _height_and_deadline_of(self, task_id: int) -> Tuple[int, Optional[datetime]]:
+        height = self._weight(task_id) + max((self.height[succ] for succ in self.succs[task_id]), default=0)
+        # Each open successor needs one step between this task finishing and its own deadline
+        limits = [self.due[task_id]] if self.due[task_id] is not None else []
+        limits.extend(
+            self.deadline[succ] - self.step * self._weight(succ)
+            for succ in self.succs[task_id] if self.deadline[succ] is not None
+        )
+        return height, min(limits) if limits else None
+
+    # Changes
+
+    def add_task(self, task_id: int, done: bool = False, due: Optional[datetime] = None) -> None:
+        self.preds[task_id] = set()
+        self.succs[task_id] = set()
+        self.done[task_id] = done
+        self.due[task_id] = due
+        self.order[task_id] = self._next_order
+        self._next_order += 1
+        self.depth[task_id] = self.height[task_id] = self._weight(task_id)
+        self.deadline[task_id] = due
+
+    def update_task(self, task_id: int, done: bool, due: Optional[datetime]) -> None:
+        self.done[task_id] = done
+        self.due[task_id] = due
+        self._propagate_forward([task_id])
+        self._propagate_backward([task_id])
+
+    def remove_task(self, task_id: int) -> None:
+        preds = self.preds.pop(task_id)
+        succs = self.succs.pop(task_id)
+        for pred in preds:
+            self.succs[pred].discard(task_id)
+        for succ in succs:
+            self.preds[succ].discard(task_id)
+        for values in (self.done, self.due, self.order, self.depth, self.height, self.deadline):
+            del values[task_id]
+        self._propagate_forward(succs)
+        self._propagate_backward(preds)
+
+    def check_dependency(self, task_id: int, depends_on_id: int) -> None:
+        """Raise ``DependencyCycleError`` if ``add_dependency`` would, without changing the graph."""
+        if task_id == depends_on_id:
+            raise DependencyCycleError([task_id, task_id])
+        upper = self.order[depends_on_id]
+        if depends_on_id not in self.preds[task_id] and self.order[task_id] < upper:
+            self._search(task_id, self.succs, lambda node: self.order[node] < upper, depends_on_id)
+
+    def add_dependency(self, task_id: int, depends_on_id: int) -> None:
+        """Make ``task_id`` wait for ``depends_on_id``; raises ``DependencyCycleError`` if it already (indirectly) waits the other way."""
+        if depends_on_id in self.preds[task_id]:
+            return
+        if task_id == depends_on_id:
+            raise DependencyCycleError([task_id, task_id])
+        lower, upper = self.order[task_id], self.order[depends_on_id]
+        if lower < upper:
+            # The prerequisite comes later in the current order. Only tasks
+            # ordered between the two can be affected: those reachable from
+            # task_id move behind those that reach depends_on_id
+            forward = self._search(task_id, self.succs, lambda node: self.order[node] < upper, depends_on_id)
+            backward = self._search(depends_on_id, self.preds, lambda node: self.order[node] > lower)
+            nodes = sorted(backward, key=self.order.get) + sorted(forward, key=self.order.get)
+            slots = sorted(self.order[node] for node in nodes)
+            for node, slot in zip(nodes, slots):
+                self.order[node] = slot
+        self.preds[task_id].add(depends_on_id)
+        self.succs[depends_on_id].add(task_id)
+        self._propagate_forward([task_id])
+        self._propagate_backward([depends_on_id])
+
+    def remove_dependency(self, task_id: int, depends_on_id: int) -> None:
+        if depends_on_id not in self.preds[task_id]:
+            return
+        self.preds[task_id].discard(depends_on_id)
+        self.succs[depends_on_id].discard(task_id)
+        self._propagate_forward([task_id])
+        self._propagate_backward([depends_on_id])
+
+    def _search(self, start: int, edges: Dict[int, Set[int]], within, target: int = None) -> List[int]:
+        parents: Dict[int, Optional[int]] = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbour in edges[node]:
+                if neighbour == target:
+                    # target already depends on start through this path
+                    path = [neighbour]
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    raise DependencyCycleError(path + [target])
+                if neighbour not in parents and within(neighbour):
+                    parents[neighbour] = node
+                    stack.append(neighbour)
+        return list(parents)
+
+    def _propagate_forward(self, start: Iterable[int]) -> None:
+        # Visit in topological order so each task is recomputed after all of its prerequisites
+        heap = [(self.order[node], node) for node in start]
+        heapq.heapify(heap)
+        visited = set()
+        while heap:
+            _, node = heapq.heappop(heap)
+            if node in visited:
+                continue
+            visited.add(node)
+            depth = self._depth_of(node)
+            if depth != self.depth[node]:
+                self.depth[node] = depth
+                for succ in self.succs[node]:
+                    heapq.heappush(heap, (self.order[succ], succ))
+
+    def _propagate_backward(self, start: Iterable[int]) -> None:
+        heap = [(-self.order[node], node) for node in start]
+        heapq.heapify(heap)
+        visited = set()
+        while heap:
+            _, node = heapq.heappop(heap)
+            if node in visited:
+                continue
+            visited.add(node)
+            values = self._height_and_deadline_of(node)
+            if values != (self.height[node], self.deadline[node]):
+                self.height[node], self.deadline[node] = values
+                for pred in self.preds[node]:
+                    heapq.heappush(heap, (-self.order[pred], pred))
+
+    # Queries
+
+    def topological_order(self) -> List[int]:
+        return sorted(self.order, key=self.order.get)
+
+    def is_blocked(self, task_id: int) -> bool:
+        return any(not self.done[pred] for pred in self.preds[task_id])
+
+    def ready(self) -> List[int]:
+        """Open tasks whose prerequisites are all done, in topological order."""
+        return [id for id in self.topological_order() if not self.done[id] and not self.is_blocked(id)]
+
+    def blocked(self) -> List[int]:
+        """Open tasks still waiting for an open prerequisite, in topological order."""
+        return [id for id in self.topological_order() if not self.done[id] and self.is_blocked(id)]
+
+    def length(self) -> int:
+        """Open tasks on the critical path."""
+        return max(self.depth.values(), default=0)
+
+    def critical_path(self) -> List[int]:
+        length = self.length()
+        if not length:
+            return []
+        node = min((id for id in self.order if self.height[id] == length), key=self.order.get)
+        path = []
+        while True:
+            if not self.done[node]:
+                path.append(node)
+            remaining = self.height[node] - self._weight(node)
+            if not remaining:
+                return path
+            node = min((succ for succ in self.succs[node] if self.height[succ] == remaining), key=self.order.get)
+
+    def schedule(self, now: datetime = None) -> List[Dict[str, Any]]:
+        """Per-task dependency state and timing, in topological order."""
+        now = now or datetime.utcnow()
+        length = self.length()
+        items = []
+        for task_id in self.topological_order():
+            done = self.done[task_id]
+            total_float = None if done else length - (self.depth[task_id] + self.height[task_id] - 1)
+            slack_hours = None
+            if not done and self.deadline[task_id] is not None:
+                finish = now + self.step * self.depth[task_id]
+                slack_hours = round((self.deadline[task_id] - finish).total_seconds() / 3600, 2)
+            items.append({
+                "task_id": task_id,
+                "state": "done" if done else "blocked" if self.is_blocked(task_id) else "ready",
+                "depends_on": sorted(self.preds[task_id]),
+                "earliest_finish": None if done else self.depth[task_id],
+                "total_float": total_float,
+                "slack_hours": slack_hours,
+                "critical": total_float == 0,
+            })
+        return items
+
+
+class TaskGraphCache:
+    def __init__(self, max_projects: int = None):
+        self.max_projects = max_projects or settings.TASK_GRAPH_CACHE_SIZE
+        self._graphs: "OrderedDict[int, TaskGraph]" = OrderedDict()
+        # Held while graphs change and while callers read them
+        self._lock = threading.RLock()
+        # Serializes catching up and loading, which read the database
+        self._refresh_lock = threading.Lock()
+        self.last_seq: Optional[int] = None
+
+    @contextmanager
+    def get(self, db: Session, project_id: int) -> Iterator[TaskGraph]:
+        """
+        Yield the project's graph, current as of the latest logged task write.
+        The graph is shared: read it only inside the block and don't change it.
+        """
+        if isinstance(db, RoutingSession):
+            # A replica may lag the log position, which primary reads have
+            # moved on; a graph loaded from it would miss the writes between
+            db.use_primary()
+        with self._refresh_lock:
+            self._catch_up(db)
+            graph = self._graphs.get(project_id)
+            if graph is None:
+                # Writes committed after the cursor was read are applied on the next catch-up
+                graph = TaskGraph.load(db, project_id)
+            with self._lock:
+                self._graphs[project_id] = graph
+                self._graphs.move_to_end(project_id)
+                while len(self._graphs) > self.max_projects:
+                    self._graphs.popitem(last=False)
+        with self._lock:
+            yield graph
+
+    def clear(self) -> None:
+        """Forget every graph and the log position, e.g. when switching databases."""
+        with self._refresh_lock, self._lock:
+            self._graphs.clear()
+            self.last_seq = None
+
+    def _catch_up(self, db: Session) -> None:
+        if self.last_seq is None:
+            self.last_seq = db.execute(select(func.max(ChangeLogEntry.seq))).scalar() or 0
+            return
+        while True:
+            entries = db.execute(
+                select(ChangeLogEntry.seq, ChangeLogEntry.entity_id)
+                .where(ChangeLogEntry.seq > self.last_seq, ChangeLogEntry.entity == "task")
+                .order_by(ChangeLogEntry.seq)
+                .limit(CHANGE_BATCH_SIZE)
+            ).all()
+            if not entries:
+                return
+            ids = {entry.entity_id for entry in entries}
+            rows = {
+                row.id: row for row in db.execute(
+                    select(Task.id, Task.project_id, Task.status, Task.due_date).where(Task.id.in_(ids))
+                )
+            }
+            edges = db.execute(
+                select(task_dependencies.c.task_id, task_dependencies.c.depends_on_id).where(or_(
+                    task_dependencies.c.task_id.in_(ids), task_dependencies.c.depends_on_id.in_(ids)
+                ))
+            ).all()
+            with self._lock:
+                for project_id, graph in list(self._graphs.items()):
+                    try:
+                        self._apply(graph, project_id, ids, rows, edges)
+                    except DependencyCycleError:
+                        # Concurrent inserts stored a cycle; a rebuild breaks it
+                        del self._graphs[project_id]
+                self.last_seq = entries[-1].seq
+            if len(entries) < CHANGE_BATCH_SIZE:
+                return
+
+    @staticmethod
+    def _apply(graph: TaskGraph, project_id: int, ids: Set[int], rows: Dict[int, Any], edges: List[Tuple[int, int]]) -> None:
+        """Bring the tasks ``ids`` and every edge touching them in line with ``rows`` and ``edges``."""
+        for task_id in ids:
+            row = rows.get(task_id)
+            if row is None or row.project_id != project_id:
+                if task_id in graph:
+                    graph.remove_task(task_id)
+            elif task_id in graph:
+                graph.update_task(task_id, done=row.status == TaskStatus.DONE, due=row.due_date)
+            else:
+                graph.add_task(task_id, done=row.status == TaskStatus.DONE, due=row.due_date)
+        wanted = {(task_id, depends_on_id) for task_id, depends_on_id in edges if task_id in graph and depends_on_id in graph}
+        current = {(task_id, pred) for task_id in ids if task_id in graph for pred in graph.preds[task_id]}
+        current.update((succ, task_id) for task_id in ids if task_id in graph for succ in graph.succs[task_id])
+        for task_id, depends_on_id in current - wanted:
+            graph.remove_dependency(task_id, depends_on_id)
+        for task_id, depends_on_id in sorted(wanted - current):
+            graph.add_dependency(task_id, depends_on_id)
+
+
+task_graphs = TaskGraphCache()
@@ -0,0 +1,122 @@
+"""Unified, newest-first timeline over tasks, activities, logs and journal entries.
+
+Each source is read with its own keyset query in ``(timestamp, id)`` order
+from a ``(user_id, timestamp, id)`` index, fetching at most one page (plus
+one row) per source, and the sorted streams are combined with
+``heapq.merge``. A page therefore costs one short range scan per source
+however far back the client has scrolled, and memory stays bounded by
+``sources * limit`` rows.
+
+Items are ordered by ``(timestamp, source, id)`` descending, where the
+source's position in ``TIMELINE_SOURCES`` breaks timestamp ties. Pages
+continue after a ``(timestamp, type, id)`` position, which the router
+round-trips as an opaque cursor.
+"""
+import heapq
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, literal, null, or_, select
+from sqlalchemy.orm import Session
+
+from models.activity import Activity
+from models.journal import JournalEntry
+from models.log import Log
+from models.task import Task
+from utils.pagination import sort_key
+
+SUMMARY_LENGTH = 200
+
+# (timestamp, source type, id) of the last item a page returned
+Position = Tuple[datetime, str, int]
+
+
+class TimelineSource(NamedTuple):
+    model: type
+    timestamp: object
+    summary: object
+
+
+TIMELINE_SOURCES: Dict[str, TimelineSource] = {
+    "task": TimelineSource(Task, Task.created_at, Task.title),
+    "activity": TimelineSource(Activity, Activity.timestamp, Activity.type),
+    "log": TimelineSource(Log, Log.created_at, Log.title),
+    "journal_entry": TimelineSource(JournalEntry, JournalEntry.created_at, func.substr(JournalEntry.content, 1, SUMMARY_LENGTH)),
+}
+SOURCE_RANK = {name: rank for rank, name in enumerate(TIMELINE_SOURCES)}
+
+
+def _naive_utc(timestamp: datetime) -> datetime:
+    # Task and log timestamps are naive UTC, activity and journal ones may be
+    # aware; compare everything as naive UTC
+    if timestamp.tzinfo is not None:
+        return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+def _source_query(db: Session, name: str, user_id: int, from_date, to_date, position: Optional[Position], limit: int):
+    source = TIMELINE_SOURCES[name]
+    model = source.model
+    dialect_name = db.get_bind().dialect.name
+    timestamp_key = sort_key(source.timestamp, dialect_name)
+    query = select(
+        literal(name).label("type"),
+        model.id.label("id"),
+        source.timestamp.label("timestamp"),
+        source.summary.label("summary"),
+        model.project_id.label("project_id") if hasattr(model, "project_id") else null().label("project_id"),
+    ).where(model.user_id == user_id, source.timestamp.isnot(None))
+    if from_date:
+        query = query.where(timestamp_key >= sort_key(from_date, dialect_name))
+    if to_date:
+        query = query.where(timestamp_key <= sort_key(to_date, dialect_name))
+    if position:
+        timestamp, cursor_type, cursor_id = position
+        boundary = sort_key(timestamp, dialect_name)
+        rank, cursor_rank = SOURCE_RANK[name], SOURCE_RANK[cursor_type]
+        if rank < cursor_rank:
+            # Ties with the cursor's timestamp sort after it in this source
+            query = query.where(timestamp_key <= boundary)
+        elif rank > cursor_rank:
+            query = query.where(timestamp_key < boundary)
+        else:
+            query = query.where(or_(timestamp_key < boundary, and_(timestamp_key == boundary, model.id < cursor_id)))
+    return query.order_by(timestamp_key.desc(), model.id.desc()).limit(limit)
+
+
+def _merge_key(item: dict) -> Tuple[datetime, int, int]:
+    return item["timestamp"], SOURCE_RANK[item["type"]], item["id"]
+
+
+def _stream(db: Session, name: str, *args) -> Iterator[dict]:
+    for row in db.execute(_source_query(db, name, *args)):
+        item = dict(row._mapping)
+        item["timestamp"] = _naive_utc(item["timestamp"])
+        yield item
+
+
+def timeline_page(
+    db: Session,
+    user_id: int,
+    types: Sequence[str],
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    position: Optional[Position] = None,
+    limit: int = 50
+) -> Tuple[List[dict], Optional[Position]]:
+    """
+    Return up to ``limit`` timeline items of ``types`` newest first, starting
+    after ``position``, and the position to continue from (None on the last
+    page).
+    """
+    streams = [
+        _stream(db, name, user_id, from_date, to_date, position, limit + 1)
+        for name in TIMELINE_SOURCES if name in types
+    ]
+    items = []
+    for item in heapq.merge(*streams, key=_merge_key, reverse=True):
+        if len(items) == limit:
+            last = items[-1]
+            return items, (last["timestamp"], last["type"], last["id"])
+        items.append(item)
+    return items, None
@@ -1,10 +1,20 @@
+import os
+
+# Every test client shares one address, so the per-IP buckets would carry
+# over between tests; the middleware has its own tests
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+# The scheduler would tick against the application database, not the test one
+os.environ.setdefault("REMINDERS_ENABLED", "false")
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
-from ..database import Base, get_db
-from ..main import app
+from database import Base, get_db
+from main import app
+from services.task_graph import task_graphs
+from utils import QueryCounter
 
 SQLALCHEMY_DATABASE_URL = "sqlite://"
 
@@ -26,6 +36,8 @@ def test_db():
             db.close()
     
     app.dependency_overrides[get_db] = override_get_db
+    # Cached dependency graphs follow the change log of the previous database
+    task_graphs.clear()
     yield engine
     Base.metadata.drop_all(bind=engine)
 
@@ -55,3 +67,28 @@ def auth_headers(test_user, client):
     assert response.status_code == 200
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def register_user(client):
+    """Return a factory registering a user and returning its bearer headers."""
+    def register(username):
+        response = client.post("/api/auth/register", json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": "testpassword123",
+            "full_name": username.title()
+        })
+        assert response.status_code == 200
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return register
+
+@pytest.fixture
+def user_headers(register_user):
+    return register_user("testuser")
+
+@pytest.fixture
+def query_counter(test_db):
+    """Return a factory for QueryCounter blocks bound to the test engine."""
+    def make_counter():
+        return QueryCounter(test_db)
+    return make_counter
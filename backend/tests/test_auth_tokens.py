@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from auth.utils import hash_token
+from database import Base
+from models import PasswordReset, RefreshToken, User
+from services.maintenance import purge_expired_auth_tokens
+
+def test_purge_deletes_expired_and_used_tokens_in_batches():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    user = User(username="owner", email="owner@example.com")
+    db.add(user)
+    db.flush()
+    now = datetime.utcnow()
+    past, future = now - timedelta(days=1), now + timedelta(days=1)
+    db.add_all(
+        [RefreshToken(token_hash=hash_token(f"expired{i}"), expires_at=past, user_id=user.id) for i in range(3)]
+        + [RefreshToken(token_hash=hash_token(f"revoked{i}"), expires_at=future, revoked=True, user_id=user.id) for i in range(2)]
+        + [RefreshToken(token_hash=hash_token("live"), expires_at=future, user_id=user.id)]
+        + [PasswordReset(reset_token_hash=hash_token(f"stale{i}"), expires_at=past, user_id=user.id) for i in range(2)]
+        + [PasswordReset(reset_token_hash=hash_token(f"used{i}"), expires_at=future, used_at=now, user_id=user.id) for i in range(2)]
+        + [PasswordReset(reset_token_hash=hash_token("pending"), expires_at=future, user_id=user.id)]
+    )
+    db.commit()
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(1))
+
+    purged = purge_expired_auth_tokens(db, batch_size=2)
+
+    assert purged == {"refresh_tokens": 5, "password_resets": 4}
+    # Five refresh tokens take three batches, four resets take two more
+    assert len(commits) == 5
+    assert db.execute(select(RefreshToken.token_hash)).scalars().all() == [hash_token("live")]
+    assert db.execute(select(PasswordReset.reset_token_hash)).scalars().all() == [hash_token("pending")]
+
+def test_refresh_token_is_stored_hashed_and_rotates(client, test_db):
+    response = client.post("/api/auth/register", json={
+        "username": "tokenuser", "email": "token@example.com", "password": "testpassword123", "full_name": "T"
+    })
+    refresh_token = response.json()["refresh_token"]
+    with Session(test_db) as db:
+        assert db.execute(select(RefreshToken.token_hash)).scalars().all() == [hash_token(refresh_token)]
+
+    response = client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 200
+    assert response.json()["refresh_token"] != refresh_token
+    # The old token was revoked by the rotation
+    assert client.post("/api/auth/refresh", json={"refresh_token": refresh_token}).status_code == 401
+
+def test_password_reset_token_is_looked_up_by_hash(client, test_db, register_user):
+    register_user("testuser")
+    token = client.post("/api/auth/password-reset/request", json={"email": "testuser@example.com"}).json()["token"]
+    with Session(test_db) as db:
+        assert db.execute(select(PasswordReset.reset_token_hash)).scalar() == hash_token(token)
+
+    reset = {"token": token, "new_password": "newpassword456"}
+    assert client.post("/api/auth/password-reset/verify", json=reset).status_code == 200
+    assert client.post("/api/auth/password-reset/verify", json=reset).status_code == 400
+    login = client.post("/api/auth/login", json={"username": "testuser", "password": "newpassword456"})
+    assert login.status_code == 200
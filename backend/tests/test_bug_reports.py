@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+from services.bug_reports import (
+    BugReportStore,
+    fingerprint,
+    load_reports,
+    render_bug_reports,
+    RENDERED_MARKER
+)
+
+def make_report(title="Crash in TaskList", line=42):
+    return {
+        "title": title,
+        "description": "The page went blank",
+        "systemInfo": "{}",
+        "errorLogs": [f"TypeError at TaskList.js:{line}"]
+    }
+
+def test_fingerprint_ignores_numbers_and_whitespace():
+    assert fingerprint("Crash  in TaskList", ["Error at 0x1f:10"]) == fingerprint("crash in tasklist", ["Error at 0x2a:99"])
+    assert fingerprint("Crash", ["TypeError"]) != fingerprint("Crash", ["ReferenceError"])
+
+def test_burst_of_identical_reports_is_written_once(tmp_path):
+    log_path = str(tmp_path / "bug_reports.jsonl")
+
+    async def run():
+        store = BugReportStore(log_path=log_path, flush_interval=0.01)
+        for i in range(5000):
+            store.submit(make_report(line=i))
+        store.submit(make_report(title="Other crash"))
+        await store.stop()
+
+    asyncio.run(run())
+    with open(log_path) as f:
+        records = [json.loads(line) for line in f]
+
+    assert len(records) == 2
+    counts = {record["report"]["title"]: record["count"] for record in records}
+    assert counts == {"Crash in TaskList": 5000, "Other crash": 1}
+
+def test_full_buffer_drops_new_fingerprints_but_counts_repeats(tmp_path):
+    async def run():
+        store = BugReportStore(log_path=str(tmp_path / "log.jsonl"), flush_interval=10, max_pending=1)
+        store.submit(make_report())
+        assert store.submit(make_report(title="Second"))["pending"] is None
+        assert store.submit(make_report())["pending"] == 2
+        assert store.dropped == 1
+        await store.stop()
+
+    asyncio.run(run())
+
+def test_render_merges_flushes_and_archives_legacy_markdown(tmp_path):
+    log_path = str(tmp_path / "bug_reports.jsonl")
+    markdown_path = str(tmp_path / "BUG_REPORTS.md")
+    with open(markdown_path, "w") as f:
+        f.write("# Bug Reports\n\n## Old report\n")
+
+    async def run():
+        # Two stores stand in for two API workers sharing the log
+        for _ in range(2):
+            store = BugReportStore(log_path=log_path, flush_interval=0)
+            store.submit(make_report())
+            store.submit(make_report())
+            await store.stop()
+
+    asyncio.run(run())
+    assert load_reports(log_path)[0]["count"] == 4
+
+    render_bug_reports(log_path, markdown_path)
+    with open(markdown_path) as f:
+        rendered = f.read()
+    assert rendered.startswith(RENDERED_MARKER)
+    assert "**Occurrences:** 4" in rendered
+    assert (tmp_path / "BUG_REPORTS.archive.md").read_text().startswith("# Bug Reports")
+
+    # Re-rendering replaces the generated file instead of archiving it again
+    render_bug_reports(log_path, markdown_path)
+    assert (tmp_path / "BUG_REPORTS.archive.md").read_text().startswith("# Bug Reports")
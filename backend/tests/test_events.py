@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+from services.events import EventHub, LocalEventBackend
+
+def _event(entity, id, **data):
+    return {"type": f"{entity}.updated", "entity": entity, "id": id, "data": data}
+
+def test_burst_coalesces_to_latest_state():
+    async def scenario():
+        hub = EventHub(LocalEventBackend(), max_pending=10)
+        await hub.start()
+        subscription = hub.subscribe(["user:1"])
+        for title in ["a", "b", "c"]:
+            hub.publish(["user:1"], _event("task", 1, title=title))
+        hub.publish(["user:1"], _event("task", 2, title="other"))
+        return await subscription.next_batch(timeout=1)
+
+    batch = asyncio.run(scenario())
+
+    assert [(event["id"], event["data"]["title"]) for event in batch] == [(1, "c"), (2, "other")]
+
+def test_channels_route_and_deduplicate():
+    async def scenario():
+        hub = EventHub(LocalEventBackend(), max_pending=10)
+        await hub.start()
+        owner = hub.subscribe(["user:1", "project:7"])
+        member = hub.subscribe(["user:2", "project:7"])
+        stranger = hub.subscribe(["user:3"])
+        hub.publish(["user:1", "project:7"], _event("task", 1))
+        return [await sub.next_batch(timeout=0.05) for sub in (owner, member, stranger)]
+
+    owner, member, stranger = asyncio.run(scenario())
+
+    assert len(owner) == 1 and len(member) == 1 and stranger == []
+
+def test_overflow_replaces_backlog_with_resync():
+    async def scenario():
+        hub = EventHub(LocalEventBackend(), max_pending=3)
+        await hub.start()
+        subscription = hub.subscribe(["user:1"])
+        for id in range(5):
+            hub.publish(["user:1"], _event("task", id))
+        return await subscription.next_batch(timeout=1)
+
+    batch = asyncio.run(scenario())
+
+    assert batch[0] == {"type": "resync"}
+    assert len(batch) <= 3
+
+def test_publish_from_worker_thread_and_unsubscribe():
+    async def scenario():
+        hub = EventHub(LocalEventBackend(), max_pending=10)
+        await hub.start()
+        subscription = hub.subscribe(["user:1"])
+        # Sync route handlers run in the threadpool
+        worker = threading.Thread(target=hub.publish, args=(["user:1"], _event("log", 4)))
+        worker.start()
+        worker.join()
+        received = await subscription.next_batch(timeout=1)
+        hub.unsubscribe(subscription)
+        hub.publish(["user:1"], _event("log", 5))
+        await asyncio.sleep(0)
+        return received, await subscription.next_batch(timeout=0.05)
+
+    received, after_unsubscribe = asyncio.run(scenario())
+
+    assert [event["id"] for event in received] == [4]
+    assert after_unsubscribe == []
@@ -0,0 +1,76 @@
+import io
+import json
+import zipfile
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import Journal, JournalEntry, Log, LogEntry, Project, Task, User, task_dependencies
+from services.export import iter_ndjson, iter_zip
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def _seed(db):
+    owner = User(username="owner", email="owner@example.com", hashed_password="secret")
+    other = User(username="other", email="other@example.com", hashed_password="secret")
+    db.add_all([owner, other])
+    db.flush()
+    project = Project(title="Mine", owner_id=owner.id)
+    db.add_all([project, Project(title="Theirs", owner_id=other.id)])
+    db.flush()
+    journal = Journal(title="Diary", user_id=owner.id)
+    db.add_all([journal, Task(title="Do it", project_id=project.id, user_id=owner.id)])
+    db.flush()
+    db.add(JournalEntry(content="hello", tags=["a"], user_id=owner.id, journal_id=journal.id))
+    db.commit()
+    return owner
+
+def test_ndjson_export_contains_only_the_users_rows():
+    db = _session()
+    owner = _seed(db)
+
+    lines = [json.loads(line) for line in b"".join(iter_ndjson(db, owner.id)).splitlines()]
+
+    assert lines[0]["type"] == "export"
+    assert lines[0]["data"]["user_id"] == owner.id
+    records = {}
+    for line in lines[1:]:
+        records.setdefault(line["type"], []).append(line["data"])
+    assert [project["title"] for project in records["project"]] == ["Mine"]
+    assert records["task"][0]["title"] == "Do it"
+    assert records["journal_entry"][0]["tags"] == ["a"]
+    assert "hashed_password" not in records["user"][0]
+
+def test_zip_export_has_one_file_per_entity_type():
+    db = _session()
+    owner = _seed(db)
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(iter_zip(db, owner.id))))
+
+    assert archive.testzip() is None
+    tasks = [json.loads(line) for line in archive.read("task.ndjson").splitlines()]
+    assert [task["title"] for task in tasks] == ["Do it"]
+    assert archive.read("goal.ndjson") == b""
+
+def test_rows_of_tombstoned_projects_are_left_out():
+    db = _session()
+    owner = _seed(db)
+    gone = Project(title="Gone", owner_id=owner.id, deleted_at=datetime.utcnow())
+    db.add(gone)
+    db.flush()
+    tasks = [Task(title=f"Step {i}", project_id=gone.id, user_id=owner.id) for i in range(2)]
+    log = Log(title="Notes", user_id=owner.id, project_id=gone.id)
+    db.add_all([*tasks, log])
+    db.flush()
+    db.execute(task_dependencies.insert().values(task_id=tasks[1].id, depends_on_id=tasks[0].id))
+    db.add(LogEntry(content="c", user_id=owner.id, log_id=log.id))
+    db.commit()
+
+    types = [json.loads(line)["type"] for line in b"".join(iter_ndjson(db, owner.id)).splitlines()[1:]]
+
+    assert sorted(types) == ["journal", "journal_entry", "project", "task", "user"]
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from models import GoalProgress
+
+START = datetime(2026, 3, 1)
+
+@pytest.fixture
+def goal_id(client, user_headers):
+    goal = client.post("/api/development/goals", json={
+        "title": "Read", "description": "Books", "category": "learning"
+    }, headers=user_headers)
+    assert goal.status_code == 200
+    return goal.json()["id"]
+
+@pytest.fixture
+def daily_progress(test_db, goal_id):
+    """Ten daily updates rising by 5 per day, from 10 to 55."""
+    with Session(test_db) as db:
+        db.add_all(
+            GoalProgress(goal_id=goal_id, value=10 + 5 * day, timestamp=START + timedelta(days=day))
+            for day in range(10)
+        )
+        db.commit()
+
+def _progress(client, headers, goal_id, **params):
+    response = client.get(f"/api/development/goals/{goal_id}/progress", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+def test_updates_are_bucketed_beyond_the_point_limit(client, user_headers, goal_id, daily_progress):
+    raw = _progress(client, user_headers, goal_id)
+    assert [point["count"] for point in raw["points"]] == [1] * 10
+
+    series = _progress(client, user_headers, goal_id, points=2)
+
+    assert series["total_updates"] == 10
+    assert [(p["count"], p["min"], p["max"], p["value"]) for p in series["points"]] == [
+        (5, 10, 30, 20), (5, 35, 55, 45)
+    ]
+
+def test_from_and_to_bound_the_window(client, user_headers, goal_id, daily_progress):
+    series = _progress(
+        client, user_headers, goal_id,
+        **{"from": (START + timedelta(days=2)).isoformat(), "to": (START + timedelta(days=5)).isoformat()}
+    )
+
+    assert series["total_updates"] == 4
+    assert [point["value"] for point in series["points"]] == [20, 25, 30, 35]
+    assert series["start"].startswith("2026-03-03") and series["end"].startswith("2026-03-06")
+    assert _progress(client, user_headers, goal_id, **{"from": "2026-04-01T00:00:00"})["total_updates"] == 0
+
+def test_velocity_and_projected_completion(client, user_headers, goal_id, daily_progress):
+    series = _progress(client, user_headers, goal_id)
+
+    assert series["velocity_per_day"] == pytest.approx(5)
+    # 10 + 5 per day reaches 100 on day 18
+    assert series["projected_completion"].startswith("2026-03-19T00:00")
+
+def test_velocity_of_updates_within_a_day(client, test_db, user_headers, goal_id):
+    with Session(test_db) as db:
+        db.add_all(
+            GoalProgress(goal_id=goal_id, value=50 + hour, timestamp=START + timedelta(hours=hour))
+            for hour in range(4)
+        )
+        db.commit()
+
+    assert _progress(client, user_headers, goal_id)["velocity_per_day"] == pytest.approx(24, rel=1e-9)
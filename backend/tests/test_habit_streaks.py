@@ -0,0 +1,98 @@
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+from services.habit_streaks import (
+    record_completion,
+    current_streak,
+    heatmap,
+    is_completed
+)
+
+def make_habit(frequency="daily", target_days=None):
+    return SimpleNamespace(
+        frequency=frequency,
+        target_days=target_days or [],
+        streak=0,
+        longest_streak=0,
+        last_completed_on=None,
+        bitmap_start=None,
+        completion_bitmap=b""
+    )
+
+def test_daily_streak_counts_consecutive_days():
+    habit = make_habit()
+    start = date(2024, 3, 1)
+    for offset in range(5):
+        assert record_completion(habit, start + timedelta(days=offset))
+
+    assert habit.streak == 5
+    assert habit.longest_streak == 5
+    assert current_streak(habit, start + timedelta(days=5)) == 5
+    assert current_streak(habit, start + timedelta(days=6)) == 0
+
+def test_duplicate_completion_is_ignored():
+    habit = make_habit()
+    day = date(2024, 3, 1)
+    assert record_completion(habit, day)
+    assert not record_completion(habit, day)
+    assert habit.streak == 1
+
+def test_gap_resets_streak_but_keeps_longest():
+    habit = make_habit()
+    for day in [date(2024, 3, 1), date(2024, 3, 2), date(2024, 3, 3), date(2024, 3, 5)]:
+        record_completion(habit, day)
+
+    assert habit.streak == 1
+    assert habit.longest_streak == 3
+
+def test_backfill_before_bitmap_start_recomputes():
+    habit = make_habit()
+    record_completion(habit, date(2024, 3, 10))
+    record_completion(habit, date(2024, 3, 9))
+    record_completion(habit, date(2024, 2, 1))
+
+    assert habit.bitmap_start <= date(2024, 2, 1)
+    assert is_completed(habit, date(2024, 2, 1))
+    assert is_completed(habit, date(2024, 3, 10))
+    assert habit.streak == 2
+    assert habit.last_completed_on == date(2024, 3, 10)
+
+def test_target_days_skip_unscheduled_days():
+    habit = make_habit("weekly", ["monday", "wednesday", "friday"])
+    # Mon, Wed, Fri, Mon with an unscheduled Saturday in between
+    for day in [date(2024, 3, 4), date(2024, 3, 6), date(2024, 3, 8), date(2024, 3, 9), date(2024, 3, 11)]:
+        record_completion(habit, day)
+
+    assert habit.streak == 4
+    # Tuesday after the last Monday: Wednesday is still pending
+    assert current_streak(habit, date(2024, 3, 12)) == 4
+    # Thursday: Wednesday was missed
+    assert current_streak(habit, date(2024, 3, 14)) == 0
+
+def test_weekly_streak_counts_weeks():
+    habit = make_habit("weekly")
+    for day in [date(2024, 3, 4), date(2024, 3, 7), date(2024, 3, 13), date(2024, 3, 18)]:
+        record_completion(habit, day)
+
+    assert habit.streak == 3
+
+def test_heatmap_reads_bitmap():
+    habit = make_habit()
+    record_completion(habit, date(2024, 1, 2))
+    record_completion(habit, date(2024, 1, 4))
+
+    assert heatmap(habit, date(2024, 1, 1), date(2024, 1, 5)) == [0, 1, 0, 1, 0]
+
+def test_habit_listing_reports_the_current_streak(client, user_headers):
+    habit = client.post("/api/development/habits", json={"name": "Run", "frequency": "daily"}, headers=user_headers).json()
+    today = datetime.utcnow()
+    for days_ago in (2, 1, 0):
+        completed = (today - timedelta(days=days_ago)).isoformat()
+        client.post(f"/api/development/habits/{habit['id']}/track", json={
+            "habit_id": habit["id"], "completed": completed
+        }, headers=user_headers)
+    client.post("/api/development/habits", json={"name": "Read", "frequency": "daily"}, headers=user_headers)
+
+    habits = client.get("/api/development/habits", headers=user_headers).json()
+
+    assert [(h["name"], h["streak"], h["current_streak"]) for h in habits] == [("Run", 3, 3), ("Read", 0, 0)]
@@ -0,0 +1,114 @@
+from datetime import datetime
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import ChangeLogEntry, Idea, Project, Task, TaskStatus, User
+from models.idea import Tag
+from services.export import iter_ndjson
+from services.imports import import_jobs, run_import
+
+def _session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+def _export_to_file(db, user_id, path):
+    with open(path, "wb") as f:
+        for chunk in iter_ndjson(db, user_id):
+            f.write(chunk)
+
+def test_import_remaps_ids_and_reuses_tags(tmp_path):
+    Session = _session_factory(tmp_path)
+    db = Session()
+    source = User(username="source", email="source@example.com", hashed_password="x")
+    target = User(username="target", email="target@example.com", hashed_password="x")
+    db.add_all([source, target])
+    db.flush()
+    project = Project(title="Mine", owner_id=source.id)
+    idea = Idea(title="Idea", user_id=source.id, tags=[Tag(name="shared")])
+    db.add_all([project, idea])
+    db.flush()
+    db.add_all([Task(title=f"Task {i}", project_id=project.id, user_id=source.id) for i in range(3)])
+    db.commit()
+    _export_to_file(db, source.id, tmp_path / "export.ndjson")
+
+    job = import_jobs.create(target.id)
+    run_import(job, str(tmp_path / "export.ndjson"), Session)
+
+    assert job.status == "completed", job.error
+    assert job.imported == {"project": 1, "task": 3, "idea": 1, "tag": 1, "idea_tag": 1}
+    assert not (tmp_path / "export.ndjson").exists()
+    db.expire_all()
+    imported_project = db.execute(select(Project).where(Project.owner_id == target.id)).scalar_one()
+    assert imported_project.id != project.id
+    tasks = db.execute(select(Task).where(Task.user_id == target.id)).scalars().all()
+    assert {task.project_id for task in tasks} == {imported_project.id}
+    imported_idea = db.execute(select(Idea).where(Idea.user_id == target.id)).scalar_one()
+    assert [tag.name for tag in imported_idea.tags] == ["shared"]
+    assert db.execute(select(Tag)).scalars().all() == imported_idea.tags
+    # Core inserts still reach the change log, so the target's next sync sees them
+    synced = db.execute(select(ChangeLogEntry.entity).where(ChangeLogEntry.user_id == target.id)).scalars().all()
+    assert sorted(synced) == ["idea", "project", "task", "task", "task"]
+
+def test_stored_occurrences_keep_their_recurring_task(tmp_path):
+    Session = _session_factory(tmp_path)
+    db = Session()
+    source = User(username="source", email="source@example.com", hashed_password="x")
+    target = User(username="target", email="target@example.com", hashed_password="x")
+    db.add_all([source, target])
+    db.flush()
+    project = Project(title="Mine", owner_id=source.id)
+    db.add(project)
+    db.flush()
+    series = Task(
+        title="Daily", project_id=project.id, user_id=source.id,
+        due_date=datetime(2026, 1, 5, 9), recurrence_rule="FREQ=DAILY"
+    )
+    db.add(series)
+    db.flush()
+    db.add(Task(
+        title="Daily", project_id=project.id, user_id=source.id, status=TaskStatus.DONE,
+        recurrence_parent_id=series.id, occurrence_date=datetime(2026, 1, 6, 9)
+    ))
+    db.commit()
+    _export_to_file(db, source.id, tmp_path / "export.ndjson")
+
+    job = import_jobs.create(target.id)
+    run_import(job, str(tmp_path / "export.ndjson"), Session)
+
+    assert job.status == "completed", job.error
+    assert (job.imported["task"], job.skipped) == (2, 0)
+    imported = db.execute(select(Task).where(Task.user_id == target.id).order_by(Task.id)).scalars().all()
+    assert imported[1].recurrence_parent_id == imported[0].id
+
+def test_rows_with_missing_parents_are_skipped(tmp_path):
+    Session = _session_factory(tmp_path)
+    db = Session()
+    user = User(username="target", email="target@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    path = tmp_path / "export.ndjson"
+    path.write_text(
+        '{"type": "export", "data": {"version": 1}}\n'
+        '{"type": "task", "data": {"id": 1, "title": "Orphan", "project_id": 42, "user_id": 7}}\n'
+    )
+
+    job = import_jobs.create(user.id)
+    run_import(job, str(path), Session)
+
+    assert job.status == "completed"
+    assert job.skipped == 1
+    assert db.execute(select(Task)).scalars().all() == []
+
+def test_unsupported_version_fails_the_job(tmp_path):
+    Session = _session_factory(tmp_path)
+    path = tmp_path / "export.ndjson"
+    path.write_text('{"type": "export", "data": {"version": 99}}\n')
+
+    job = import_jobs.create(1)
+    run_import(job, str(path), Session)
+
+    assert job.status == "failed"
+    assert "version" in job.error
@@ -0,0 +1,60 @@
+import pytest
+
+@pytest.fixture
+def journal_id(client, user_headers):
+    return client.post("/api/journals", json={"title": "Diary"}, headers=user_headers).json()["id"]
+
+def _journal(client, user_headers):
+    journals = client.get("/api/journals", headers=user_headers).json()
+    return journals[0]
+
+def test_entries_page_newest_first_with_cursor(client, user_headers, journal_id):
+    # Created within the same second, so the pages rely on the id tie-break
+    created = [
+        client.post(f"/api/journals/{journal_id}/entries", json={"content": f"entry {i}"}, headers=user_headers).json()["id"]
+        for i in range(5)
+    ]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get(f"/api/journals/{journal_id}/entries", params=params, headers=user_headers)
+        assert response.status_code == 200
+        assert len(response.json()) <= 2
+        seen += [entry["id"] for entry in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == sorted(created, reverse=True)
+
+def test_invalid_cursor_is_rejected(client, user_headers, journal_id):
+    response = client.get(f"/api/journals/{journal_id}/entries?cursor=not-a-cursor", headers=user_headers)
+
+    assert response.status_code == 400
+
+def test_journal_stats_follow_entry_writes(client, user_headers, journal_id):
+    first = client.post(f"/api/journals/{journal_id}/entries", json={"content": "one two three"}, headers=user_headers).json()
+    second = client.post(f"/api/journals/{journal_id}/entries", json={"content": "four"}, headers=user_headers).json()
+
+    journal = _journal(client, user_headers)
+    assert (journal["entry_count"], journal["word_count"]) == (2, 4)
+    assert journal["last_entry_at"] is not None
+
+    client.put(f"/api/journals/{journal_id}/entries/{first['id']}", json={"content": "one"}, headers=user_headers)
+    assert _journal(client, user_headers)["word_count"] == 2
+
+    client.delete(f"/api/journals/{journal_id}/entries/{second['id']}", headers=user_headers)
+    client.delete(f"/api/journals/{journal_id}/entries/{first['id']}", headers=user_headers)
+    journal = _journal(client, user_headers)
+    assert (journal["entry_count"], journal["word_count"], journal["last_entry_at"]) == (0, 0, None)
+
+def test_journal_stats_follow_writes_through_activity_routes(client, user_headers, journal_id):
+    entry = client.post(f"/api/journals/{journal_id}/entries", json={"content": "a b c"}, headers=user_headers).json()
+
+    client.put(f"/api/activities/journal/{entry['id']}", json={"content": "a b"}, headers=user_headers)
+    assert _journal(client, user_headers)["word_count"] == 2
+
+    assert client.delete(f"/api/activities/journal/{entry['id']}", headers=user_headers).status_code == 200
+    journal = _journal(client, user_headers)
+    assert (journal["entry_count"], journal["word_count"], journal["last_entry_at"]) == (0, 0, None)
@@ -0,0 +1,75 @@
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import JournalEntry, JournalTagCount, User
+from models.journal import journal_entry_tags
+from services.journal_tags import (
+    entries_with_any_tag,
+    normalize_tags,
+    rebuild_user_tags,
+    remove_entry_tags,
+    sync_entry_tags
+)
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    user = User(username="writer", email="writer@example.com")
+    db.add(user)
+    db.commit()
+    return db, user
+
+def _add_entry(db, user, tags):
+    entry = JournalEntry(user_id=user.id, content="entry", tags=tags)
+    db.add(entry)
+    db.flush()
+    sync_entry_tags(db, entry)
+    db.commit()
+    return entry
+
+def _counts(db, user):
+    return dict(db.execute(
+        select(JournalTagCount.tag, JournalTagCount.count).where(JournalTagCount.user_id == user.id)
+    ).all())
+
+def test_normalize_tags_trims_and_deduplicates():
+    assert normalize_tags([" work", "work", "", "home "]) == ["work", "home"]
+    assert normalize_tags(None) == []
+
+def test_counts_follow_creates_updates_and_deletes():
+    db, user = _session()
+    first = _add_entry(db, user, ["work", "mood"])
+    second = _add_entry(db, user, ["work"])
+    assert _counts(db, user) == {"work": 2, "mood": 1}
+
+    old_tags = list(first.tags)
+    first.tags = ["home"]
+    sync_entry_tags(db, first, old_tags)
+    db.commit()
+    assert _counts(db, user) == {"work": 1, "home": 1}
+
+    remove_entry_tags(db, second)
+    db.delete(second)
+    db.commit()
+    assert _counts(db, user) == {"home": 1}
+
+def test_tag_filter_uses_the_association_table():
+    db, user = _session()
+    tagged = _add_entry(db, user, ["work"])
+    _add_entry(db, user, ["home"])
+
+    ids = db.execute(select(JournalEntry.id).where(JournalEntry.id.in_(entries_with_any_tag(user.id, ["work", "other"])))).scalars().all()
+
+    assert ids == [tagged.id]
+
+def test_rebuild_recreates_index_from_json():
+    db, user = _session()
+    db.add_all([JournalEntry(user_id=user.id, content="a", tags=["x", "y"]), JournalEntry(user_id=user.id, content="b", tags=["x"])])
+    db.commit()
+
+    rebuild_user_tags(db, user.id, batch_size=1)
+
+    assert _counts(db, user) == {"x": 2, "y": 1}
+    assert len(db.execute(select(journal_entry_tags)).all()) == 3
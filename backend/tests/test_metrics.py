@@ -0,0 +1,57 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from middleware.metrics import MetricsMiddleware
+from services.metrics import (
+    MetricsRegistry,
+    HTTP_REQUESTS,
+    DB_STATEMENTS_PER_REQUEST,
+    instrument_engine
+)
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(2.0, route="/a")
+
+    output = registry.render()
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in output
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in output
+    assert 'latency_seconds_count{route="/a"} 3' in output
+    assert 'latency_seconds_sum{route="/a"} 2.55' in output
+
+def test_counter_and_label_escaping():
+    registry = MetricsRegistry()
+    counter = registry.counter("events", "Events.", ("name",))
+    counter.inc(name='say "hi"')
+    counter.inc(2, name='say "hi"')
+
+    assert 'events_total{name="say \\"hi\\""} 3' in registry.render()
+
+def test_middleware_records_route_template_and_sql_statements():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    app = FastAPI()
+
+    @app.get("/api/metrics-test/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        return {"id": item_id}
+
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+    route = "/api/metrics-test/{item_id}"
+    before = HTTP_REQUESTS.get(method="GET", route=route, status="200")
+
+    assert client.get("/api/metrics-test/1").status_code == 200
+    assert client.get("/api/metrics-test/2").status_code == 200
+
+    assert HTTP_REQUESTS.get(method="GET", route=route, status="200") == before + 2
+    assert DB_STATEMENTS_PER_REQUEST.count(route=route) == 2
+    assert DB_STATEMENTS_PER_REQUEST.total(route=route) == 4
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import Activity, Log, LogEntry, Project, Task, User
+from services.maintenance import purge_deleted_projects
+
+def _session():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def _foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def _count(db, model):
+    return db.execute(select(func.count()).select_from(model)).scalar()
+
+def test_purge_removes_tombstoned_projects_in_batches():
+    db = _session()
+    user = User(username="owner", email="owner@example.com")
+    db.add(user)
+    db.flush()
+    doomed = Project(title="Doomed", owner_id=user.id, deleted_at=datetime.utcnow())
+    kept = Project(title="Kept", owner_id=user.id)
+    db.add_all([doomed, kept])
+    db.flush()
+    for project in (doomed, kept):
+        db.add_all([Task(title=f"Task {i}", project_id=project.id, user_id=user.id) for i in range(5)])
+        db.add_all([Activity(type="web", project_id=project.id, user_id=user.id) for i in range(3)])
+        log = Log(title="Log", project_id=project.id, user_id=user.id)
+        db.add(log)
+        db.flush()
+        db.add_all([LogEntry(content="entry", log_id=log.id, user_id=user.id) for i in range(4)])
+    db.commit()
+
+    purged = purge_deleted_projects(db, batch_size=2)
+
+    assert purged == {"projects": 1, "rows": 5 + 3 + 1 + 4 + 1}
+    assert db.execute(select(Project.title)).scalars().all() == ["Kept"]
+    assert _count(db, Task) == 5
+    assert _count(db, Activity) == 3
+    assert _count(db, LogEntry) == 4
+
+def test_deleting_a_user_cascades_in_the_database():
+    db = _session()
+    user = User(username="owner", email="owner@example.com")
+    db.add(user)
+    db.flush()
+    project = Project(title="Project", owner_id=user.id)
+    db.add(project)
+    db.flush()
+    db.add(Task(title="Task", project_id=project.id, user_id=user.id))
+    db.commit()
+
+    db.delete(user)
+    db.commit()
+
+    assert _count(db, Project) == 0
+    assert _count(db, Task) == 0
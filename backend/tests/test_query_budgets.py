@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from models.activity import Activity
+from models.user import User
+from utils import QueryCounter, QueryBudgetExceeded
+
+@pytest.fixture
+def seeded(client, user_headers, test_db):
+    project_ids = []
+    for i in range(5):
+        project = client.post(
+            "/api/projects/",
+            json={"title": f"Project {i}", "description": "Seeded"},
+            headers=user_headers
+        )
+        assert project.status_code == 200, project.text
+        task = client.post(
+            "/api/tasks/",
+            json={"title": f"Task {i}", "project_id": project.json()["id"]},
+            headers=user_headers
+        )
+        assert task.status_code in (200, 201), task.text
+        project_ids.append(project.json()["id"])
+
+    with Session(test_db) as db:
+        user = db.query(User).filter(User.username == "testuser").one()
+        db.add_all(
+            Activity(user_id=user.id, project_id=project_id, type="web", data={"url": "https://example.com"})
+            for project_id in project_ids
+        )
+        db.commit()
+    return user_headers
+
+def test_counter_flags_repeated_statements():
+    engine = create_engine("sqlite://")
+    with QueryCounter(engine) as queries:
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT :i"), {"i": i})
+
+    assert queries.count == 3
+    assert queries.repeated() == {"SELECT ?": 3}
+    with pytest.raises(QueryBudgetExceeded):
+        queries.assert_no_repeats()
+    with pytest.raises(QueryBudgetExceeded):
+        queries.assert_max(2)
+
+# One query loads the current user, the rest belong to the endpoint
+@pytest.mark.parametrize("path, budget", [
+    ("/api/projects/", 2),
+    ("/api/tasks/", 2),
+    ("/api/activities/activities", 2),
+])
+def test_list_endpoint_query_budgets(client, seeded, query_counter, path, budget):
+    with query_counter() as queries:
+        response = client.get(path, headers=seeded)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 5
+    queries.assert_max(budget)
+    queries.assert_no_repeats()
+
+# Listings select the response columns only; eager relationships such as
+# Activity.user or Project.owner must not be joined in
+@pytest.mark.parametrize("path", [
+    "/api/projects/",
+    "/api/activities/activities",
+    "/api/projects/{project_id}/activities",
+])
+def test_list_endpoints_do_not_load_relationships(client, seeded, query_counter, path):
+    project_id = client.get("/api/projects/", headers=seeded).json()[0]["id"]
+    with query_counter() as queries:
+        response = client.get(path.format(project_id=project_id), headers=seeded)
+
+    assert response.status_code == 200
+    listing = queries.statements[-1]
+    assert " JOIN " not in listing
+    assert "users." not in listing
@@ -0,0 +1,80 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from auth.utils import create_access_token
+from middleware.rate_limit import InMemoryRateLimitBackend, RateLimitMiddleware
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_app(backend, **kwargs):
+    app = FastAPI()
+
+    @app.get("/api/tasks")
+    def tasks():
+        return {"ok": True}
+
+    @app.post("/api/auth/login")
+    def login():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, backend=backend, enabled=True, **kwargs)
+    return app
+
+def test_bucket_refills_over_time():
+    clock = FakeClock()
+    backend = InMemoryRateLimitBackend(clock=clock)
+
+    async def run():
+        assert await backend.consume("k", 2, capacity=2, refill_per_second=1) == 0
+        assert await backend.consume("k", 1, capacity=2, refill_per_second=1) == 1
+        clock.now = 1.0
+        assert await backend.consume("k", 1, capacity=2, refill_per_second=1) == 0
+
+    asyncio.run(run())
+
+def test_lru_evicts_idle_keys():
+    backend = InMemoryRateLimitBackend(max_keys=2)
+
+    async def run():
+        for key in ["a", "b", "c"]:
+            await backend.consume(key, 1, capacity=1, refill_per_second=0)
+
+    asyncio.run(run())
+    assert list(backend._buckets) == ["b", "c"]
+
+def test_requests_over_capacity_get_429():
+    backend = InMemoryRateLimitBackend(clock=FakeClock())
+    client = TestClient(make_app(backend, ip_capacity=3, ip_refill_per_second=0.5))
+
+    for _ in range(3):
+        assert client.get("/api/tasks").status_code == 200
+    response = client.get("/api/tasks")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "2"
+
+def test_expensive_routes_cost_more():
+    backend = InMemoryRateLimitBackend(clock=FakeClock())
+    client = TestClient(make_app(backend, ip_capacity=6, ip_refill_per_second=1))
+
+    assert client.post("/api/auth/login").status_code == 200
+    assert client.post("/api/auth/login").status_code == 429
+    assert client.get("/api/tasks").status_code == 200
+
+def test_user_rejection_refunds_the_ip_bucket():
+    backend = InMemoryRateLimitBackend(clock=FakeClock())
+    client = TestClient(make_app(
+        backend, ip_capacity=3, ip_refill_per_second=1, user_capacity=1, user_refill_per_second=1
+    ))
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'alice'})}"}
+
+    assert client.get("/api/tasks", headers=headers).status_code == 200
+    assert client.get("/api/tasks", headers=headers).status_code == 429
+    # Others behind the same address keep the two tokens the throttled user didn't spend
+    assert [client.get("/api/tasks").status_code for _ in range(3)] == [200, 200, 429]
@@ -0,0 +1,114 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from models import Task
+from services.recurrence import MAX_OCCURRENCES, expand, parse_rule
+
+MONDAY = datetime(2026, 1, 5, 9, 0)
+
+def test_weekly_rule_with_days_and_count():
+    occurrences = expand("FREQ=WEEKLY;BYDAY=MO,TH;COUNT=5", MONDAY, None, datetime(2027, 1, 1))
+
+    assert [occurrence.day for occurrence in occurrences] == [5, 8, 12, 15, 19]
+
+def test_window_skips_ahead_and_months_without_the_day():
+    assert len(expand("FREQ=DAILY", datetime(2000, 1, 1, 9), datetime(2026, 1, 1), datetime(2026, 1, 10, 23))) == 10
+    assert [occurrence.month for occurrence in expand(
+        "FREQ=MONTHLY", datetime(2026, 1, 31), datetime(2026, 2, 1), datetime(2026, 8, 1)
+    )] == [3, 5, 7]
+    # Without a start the series' latest occurrences are kept, up to the cap
+    open_start = expand("FREQ=DAILY", datetime(2020, 1, 1, 9), None, datetime(2026, 1, 10, 23))
+    assert len(open_start) == MAX_OCCURRENCES and open_start[-1] == datetime(2026, 1, 10, 9)
+    # A rule that never matches still stops at the window
+    assert expand("FREQ=DAILY;INTERVAL=7;BYDAY=TU", MONDAY, None, datetime(2026, 3, 1)) == ()
+
+@pytest.mark.parametrize("rule", ["FREQ=HOURLY", "FREQ=DAILY;COUNT=0", "FREQ=MONTHLY;BYDAY=MO", "FREQ=DAILY;BYSETPOS=1"])
+def test_invalid_rules(rule):
+    with pytest.raises(ValueError):
+        parse_rule(rule)
+
+@pytest.fixture
+def standup(client, user_headers):
+    project = client.post("/api/projects/", json={"title": "Team", "description": "d"}, headers=user_headers).json()
+    response = client.post("/api/tasks/", json={
+        "title": "Standup notes",
+        "project_id": project["id"],
+        "due_date": "2026-01-05T09:00:00",
+        "recurrence_rule": "FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR"
+    }, headers=user_headers)
+    assert response.status_code == 200
+    return response.json()
+
+def test_occurrences_expand_lazily_in_window(client, test_db, user_headers, standup):
+    window = {"due_date_from": "2026-01-05T00:00:00", "due_date_to": "2026-01-11T23:59:59", "sort_by": "due_date"}
+
+    tasks = client.get("/api/tasks/", params=window, headers=user_headers).json()
+
+    assert [task["due_date"][:10] for task in tasks] == [f"2026-01-{day:02d}" for day in range(5, 10)]
+    assert all(task["id"] is None and task["recurrence_parent_id"] == standup["id"] for task in tasks)
+    # Without a window the recurring task is listed once, as itself
+    assert [task["id"] for task in client.get("/api/tasks/", headers=user_headers).json()] == [standup["id"]]
+
+def test_completed_occurrence_is_stored_once(client, user_headers, standup):
+    url = f"/api/tasks/{standup['id']}/occurrences/2026-01-06T09:00:00"
+
+    response = client.put(url, json={"status": "done"}, headers=user_headers)
+    assert response.status_code == 200
+    stored = response.json()
+    assert stored["id"] != standup["id"] and stored["occurrence_date"] == "2026-01-06T09:00:00"
+    assert client.put(url, json={"title": "Standup (short)"}, headers=user_headers).json()["id"] == stored["id"]
+
+    window = {"due_date_from": "2026-01-05T00:00:00", "due_date_to": "2026-01-07T23:59:59", "sort_by": "due_date"}
+    tasks = client.get("/api/tasks/", params=window, headers=user_headers).json()
+    assert [(task["title"], task["status"]) for task in tasks] == [
+        ("Standup notes", "todo"), ("Standup (short)", "done"), ("Standup notes", "todo")
+    ]
+    todo = client.get("/api/tasks/", params={**window, "status": "todo"}, headers=user_headers).json()
+    assert len(todo) == 2
+
+    missing = client.put(f"/api/tasks/{standup['id']}/occurrences/2026-01-10T09:00:00", json={"status": "done"}, headers=user_headers)
+    assert missing.status_code == 404
+
+def test_rule_validation(client, user_headers, standup):
+    response = client.post("/api/tasks/", json={
+        "title": "Review", "project_id": standup["project_id"], "recurrence_rule": "FREQ=WEEKLY"
+    }, headers=user_headers)
+    assert response.status_code == 400
+    response = client.put(f"/api/tasks/{standup['id']}", json={"recurrence_rule": "FREQ=SOMETIMES"}, headers=user_headers)
+    assert response.status_code == 400
+
+def test_status_of_the_series_is_set_per_occurrence(client, user_headers, standup):
+    response = client.put(f"/api/tasks/{standup['id']}", json={"status": "done"}, headers=user_headers)
+    assert response.status_code == 400
+    assert client.put(f"/api/tasks/{standup['id']}", json={"title": "Standup"}, headers=user_headers).status_code == 200
+
+    window = {"due_date_from": "2026-01-05T00:00:00", "due_date_to": "2026-01-06T23:59:59"}
+    assert len(client.get("/api/tasks/", params=window, headers=user_headers).json()) == 2
+    # Clearing the rule ends the series, after which the task is an ordinary one
+    ended = client.put(
+        f"/api/tasks/{standup['id']}", json={"recurrence_rule": None, "status": "done"}, headers=user_headers
+    )
+    assert ended.status_code == 200 and ended.json()["status"] == "done"
+
+def test_concurrent_first_edits_share_the_stored_occurrence(client, test_db, user_headers, standup):
+    def store_first(session, flush_context, instances):
+        # Another request stores the occurrence between the lookup and the insert
+        with Session(test_db) as other:
+            other.add(Task(
+                title="Standup notes", project_id=standup["project_id"], user_id=standup["user_id"],
+                due_date=datetime(2026, 1, 6, 9), recurrence_parent_id=standup["id"],
+                occurrence_date=datetime(2026, 1, 6, 9)
+            ))
+            other.commit()
+
+    event.listen(Session, "before_flush", store_first, once=True)
+    response = client.put(
+        f"/api/tasks/{standup['id']}/occurrences/2026-01-06T09:00:00", json={"status": "done"}, headers=user_headers
+    )
+
+    assert response.status_code == 200 and response.json()["status"] == "done"
+    with Session(test_db) as db:
+        assert db.query(Task).filter(Task.recurrence_parent_id == standup["id"]).count() == 1
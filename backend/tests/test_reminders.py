@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import Project, Task, TaskStatus, User
+from services.events import event_hub
+from services.reminders import ReminderScheduler
+
+NOW = datetime(2026, 3, 1, 9, 0)
+LEAD = timedelta(minutes=30)
+WINDOW = timedelta(hours=1)
+
+def _session():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def _foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def _setup(db):
+    user = User(username="owner", email="owner@example.com")
+    db.add(user)
+    db.flush()
+    project = Project(title="Plans", owner_id=user.id)
+    db.add(project)
+    db.flush()
+    return user, project
+
+def _task(db, user, project, title, due_date, **kwargs):
+    task = Task(title=title, due_date=due_date, user_id=user.id, project_id=project.id, **kwargs)
+    db.add(task)
+    db.commit()
+    return task
+
+def _sent(monkeypatch):
+    sent = []
+    monkeypatch.setattr(event_hub, "publish", lambda channels, event: sent.append((channels, event)))
+    return sent
+
+def test_only_the_window_is_held_and_reminders_fire_once(monkeypatch):
+    sent = _sent(monkeypatch)
+    db = _session()
+    user, project = _setup(db)
+    soon = _task(db, user, project, "Soon", NOW + timedelta(minutes=45))
+    later = _task(db, user, project, "Later", NOW + timedelta(hours=5))
+    _task(db, user, project, "Overdue", NOW - timedelta(minutes=5))
+    _task(db, user, project, "Done", NOW + timedelta(minutes=40), status=TaskStatus.DONE)
+    scheduler = ReminderScheduler(LEAD, WINDOW, session_factory=lambda: db)
+
+    assert scheduler.tick(db, NOW) == 0
+    assert len(scheduler) == 1
+
+    assert scheduler.tick(db, NOW + timedelta(minutes=15)) == 1
+    channels, reminder = sent[0]
+    assert channels == [f"user:{user.id}"]
+    assert reminder["type"] == "reminder.due" and reminder["data"]["title"] == "Soon"
+
+    # A second scheduler (another worker) finds nothing left to send
+    other = ReminderScheduler(LEAD, WINDOW, session_factory=lambda: db)
+    assert other.tick(db, NOW + timedelta(minutes=16)) == 0
+    assert db.get(Task, soon.id).reminder_sent_for == soon.due_date
+
+    # The window slides forward to pick up later tasks
+    assert scheduler.tick(db, later.due_date - LEAD) == 1
+    assert [event["id"] for _, event in sent] == [soon.id, later.id]
+
+def test_task_writes_reschedule_reminders(monkeypatch):
+    sent = _sent(monkeypatch)
+    db = _session()
+    user, project = _setup(db)
+    moved = _task(db, user, project, "Moved", NOW + timedelta(minutes=40))
+    finished = _task(db, user, project, "Finished", NOW + timedelta(minutes=40))
+    removed = _task(db, user, project, "Removed", NOW + timedelta(minutes=40))
+    scheduler = ReminderScheduler(LEAD, WINDOW, session_factory=lambda: db)
+    scheduler.tick(db, NOW)
+
+    moved.due_date = NOW + timedelta(minutes=50)
+    finished.status = TaskStatus.DONE
+    db.delete(removed)
+    _task(db, user, project, "Created", NOW + timedelta(minutes=35))
+    db.commit()
+
+    assert scheduler.tick(db, NOW + timedelta(minutes=10)) == 1
+    assert scheduler.tick(db, NOW + timedelta(minutes=20)) == 1
+    assert [event["data"]["title"] for _, event in sent] == ["Created", "Moved"]
+    assert len(scheduler) == 0
+
+    # Moving the due date again re-arms the reminder
+    moved.due_date = NOW + timedelta(minutes=55)
+    db.commit()
+    assert scheduler.tick(db, NOW + timedelta(minutes=25)) == 1
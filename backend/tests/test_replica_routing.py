@@ -0,0 +1,108 @@
+import asyncio
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from auth.utils import create_access_token
+from database import Base, ReplicaPool, RoutingSession
+from middleware import replica_routing
+from middleware.replica_routing import ReplicaRoutingMiddleware
+from models import Project, Task, User
+from scripts.replicate_sqlite import replicate
+from services.task_graph import task_graphs
+
+def _engines(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=primary)
+    replicate(str(tmp_path / "primary.db"), [str(tmp_path / "replica.db")])
+    return primary, replica
+
+def _users(db):
+    return db.execute(select(func.count()).select_from(User)).scalar()
+
+def test_reads_use_the_replica_until_the_session_writes(tmp_path):
+    primary, replica = _engines(tmp_path)
+    Session = sessionmaker(bind=primary, class_=RoutingSession)
+    with Session() as db:
+        db.add(User(username="first", email="first@example.com"))
+        db.commit()
+
+    with Session(replica=replica) as db:
+        # The replica hasn't caught up yet
+        assert _users(db) == 0
+        db.add(User(username="second", email="second@example.com"))
+        db.commit()
+        assert _users(db) == 2
+
+    replicate(str(tmp_path / "primary.db"), [str(tmp_path / "replica.db")])
+    with Session(replica=replica) as db:
+        assert _users(db) == 2
+
+def test_pool_round_robins_and_skips_failed_replicas(tmp_path):
+    primary, replica = _engines(tmp_path)
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    now = [0.0]
+    pool = ReplicaPool([primary, broken, replica], retry_seconds=30, check_seconds=10, clock=lambda: now[0])
+
+    assert [pool.choose() for _ in range(4)] == [primary, replica, primary, replica]
+
+    (tmp_path / "missing").mkdir()
+    now[0] = 31
+    assert broken in [pool.choose() for _ in range(3)]
+    gone = create_engine(f"sqlite:///{tmp_path / 'gone' / 'replica.db'}")
+    assert ReplicaPool([gone]).choose() is None
+
+def test_writes_keep_the_user_on_the_primary(monkeypatch, tmp_path):
+    _, replica = _engines(tmp_path)
+    monkeypatch.setattr(replica_routing, "replicas", ReplicaPool([replica]))
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope.get("state", {}).get("read_replica"))
+
+    now = [100.0]
+    middleware = ReplicaRoutingMiddleware(app, sticky_seconds=5, clock=lambda: now[0])
+
+    def request(method, ip="10.0.0.1", token=None):
+        headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+        asyncio.run(middleware({"type": "http", "method": method, "headers": headers, "client": (ip, 1234)}, None, None))
+        return seen[-1]
+
+    assert request("GET") is True
+    request("POST")
+    assert request("GET") is False
+    assert request("GET", ip="10.0.0.2") is True
+    now[0] += 6
+    assert request("GET") is True
+
+    # Registering carries no token; the reads that follow with one stay on the primary
+    request("POST", ip="10.0.0.3")
+    token = create_access_token({"sub": "newcomer"})
+    assert request("GET", ip="10.0.0.3", token=token) is False
+    # A write with a token sticks the user wherever they read from next
+    request("POST", ip="10.0.0.4", token=token)
+    assert request("GET", ip="10.0.0.5", token=token) is False
+    assert request("GET", ip="10.0.0.5") is True
+
+def test_task_graphs_load_from_the_primary(tmp_path):
+    primary, replica = _engines(tmp_path)
+    Session = sessionmaker(bind=primary, class_=RoutingSession)
+    with Session() as db:
+        user = User(username="owner", email="owner@example.com")
+        db.add(user)
+        db.flush()
+        project = Project(title="Plan", owner_id=user.id)
+        db.add(project)
+        db.flush()
+        db.add(Task(title="Not replicated yet", project_id=project.id, user_id=user.id))
+        db.commit()
+        project_id = project.id
+
+    task_graphs.clear()
+    try:
+        with Session(replica=replica) as db:
+            with task_graphs.get(db, project_id) as graph:
+                assert len(graph.preds) == 1
+    finally:
+        task_graphs.clear()
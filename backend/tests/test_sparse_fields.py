@@ -0,0 +1,38 @@
+import pytest
+
+@pytest.fixture
+def project_id(client, user_headers):
+    project = client.post("/api/projects/", json={"title": "Project", "description": "Long"}, headers=user_headers)
+    for i in range(3):
+        client.post(
+            "/api/tasks/",
+            json={"title": f"Task {i}", "description": "x" * 200, "project_id": project.json()["id"]},
+            headers=user_headers
+        )
+    return project.json()["id"]
+
+def test_fields_narrow_payload_and_select(client, user_headers, project_id, query_counter):
+    with query_counter() as queries:
+        response = client.get("/api/tasks/?fields=title,status,due_date", headers=user_headers)
+
+    assert response.status_code == 200
+    assert [set(task) for task in response.json()] == [{"id", "title", "status", "due_date"}] * 3
+    assert "tasks.description" not in queries.statements[-1]
+
+def test_unknown_fields_are_rejected(client, user_headers, project_id):
+    response = client.get("/api/projects/?fields=title,secret", headers=user_headers)
+
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
+
+def test_relationship_fields_fall_back_to_trimmed_objects(client, user_headers):
+    client.post("/api/ideas/", json={"title": "Idea", "description": "Long", "tags": ["a"]}, headers=user_headers)
+
+    response = client.get("/api/ideas/?fields=title,tags", headers=user_headers)
+
+    assert response.json() == [{"id": 1, "title": "Idea", "tags": [{"id": 1, "name": "a"}]}]
+
+def test_without_fields_the_full_schema_is_returned(client, user_headers, project_id):
+    response = client.get("/api/projects/", headers=user_headers)
+
+    assert {"title", "description", "status", "owner_id"} <= set(response.json()[0])
@@ -0,0 +1,73 @@
+import pytest
+
+def _sync(client, headers, since, **params):
+    response = client.get("/api/sync", params={"since": since, **params}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+def test_sync_returns_only_changes_since_cursor(client, user_headers):
+    project = client.post("/api/projects/", json={"title": "Project", "description": "d"}, headers=user_headers).json()
+    task = client.post("/api/tasks/", json={"title": "Task", "project_id": project["id"]}, headers=user_headers).json()
+    other = client.post("/api/tasks/", json={"title": "Other", "project_id": project["id"]}, headers=user_headers).json()
+
+    full = _sync(client, user_headers, 0)
+    assert [(c["entity"], c["id"], c["action"]) for c in full["changes"]] == [
+        ("project", project["id"], "upsert"), ("task", task["id"], "upsert"), ("task", other["id"], "upsert")
+    ]
+    assert full["changes"][1]["data"]["title"] == "Task"
+
+    client.put(f"/api/tasks/{task['id']}", json={"title": "Renamed"}, headers=user_headers)
+    client.put(f"/api/tasks/{task['id']}", json={"title": "Renamed again"}, headers=user_headers)
+    client.delete(f"/api/tasks/{other['id']}", headers=user_headers)
+
+    delta = _sync(client, user_headers, full["next_since"])
+    # Repeated updates collapse into the record's latest state
+    assert [(c["entity"], c["id"], c["action"]) for c in delta["changes"]] == [
+        ("task", task["id"], "upsert"), ("task", other["id"], "delete")
+    ]
+    assert delta["changes"][0]["data"]["title"] == "Renamed again"
+    assert delta["changes"][1]["data"] is None
+    assert _sync(client, user_headers, delta["next_since"])["changes"] == []
+
+def test_tombstoned_project_syncs_as_delete(client, user_headers):
+    project = client.post("/api/projects/", json={"title": "Project", "description": "d"}, headers=user_headers).json()
+    since = _sync(client, user_headers, 0)["next_since"]
+
+    client.delete(f"/api/projects/{project['id']}", headers=user_headers)
+
+    changes = _sync(client, user_headers, since)["changes"]
+    assert [(c["entity"], c["id"], c["action"]) for c in changes] == [("project", project["id"], "delete")]
+
+def test_sync_pages_and_isolates_users(client, user_headers, register_user):
+    project = client.post("/api/projects/", json={"title": "Project", "description": "d"}, headers=user_headers).json()
+    for i in range(3):
+        client.post("/api/tasks/", json={"title": f"Task {i}", "project_id": project["id"]}, headers=user_headers)
+
+    first = _sync(client, user_headers, 0, limit=2)
+    second = _sync(client, user_headers, first["next_since"], limit=2)
+    assert (len(first["changes"]), first["has_more"]) == (2, True)
+    assert (len(second["changes"]), second["has_more"]) == (2, False)
+
+    assert _sync(client, register_user("stranger"), 0)["changes"] == []
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_deleted_recurring_task_tombstones_its_occurrences(client, user_headers, bulk):
+    project = client.post("/api/projects/", json={"title": "Project", "description": "d"}, headers=user_headers).json()
+    daily = client.post("/api/tasks/", json={
+        "title": "Daily", "project_id": project["id"], "due_date": "2026-01-05T09:00:00", "recurrence_rule": "FREQ=DAILY"
+    }, headers=user_headers).json()
+    stored = [
+        client.put(f"/api/tasks/{daily['id']}/occurrences/2026-01-0{day}T09:00:00", json={"status": "done"}, headers=user_headers).json()
+        for day in (5, 6)
+    ]
+    since = _sync(client, user_headers, 0)["next_since"]
+
+    if bulk:
+        client.request("DELETE", "/api/tasks/bulk", json={"ids": [daily["id"]]}, headers=user_headers)
+    else:
+        client.delete(f"/api/tasks/{daily['id']}", headers=user_headers)
+
+    changes = _sync(client, user_headers, since)["changes"]
+    assert sorted((c["id"], c["action"]) for c in changes) == [
+        (daily["id"], "delete"), (stored[0]["id"], "delete"), (stored[1]["id"], "delete")
+    ]
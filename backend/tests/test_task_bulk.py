@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from models import Task
+
+@pytest.fixture
+def tasks(client, user_headers):
+    project = client.post("/api/projects/", json={"title": "Sprint", "description": "d"}, headers=user_headers).json()
+    return [
+        client.post("/api/tasks/", json={"title": f"Task {i}", "project_id": project["id"], "priority": "low"}, headers=user_headers).json()
+        for i in range(4)
+    ]
+
+def test_bulk_update_by_ids_stamps_completion_once(client, test_db, user_headers, tasks, query_counter):
+    ids = [task["id"] for task in tasks[:3]]
+    client.patch("/api/tasks/bulk", json={"ids": [ids[0]], "changes": {"status": "done"}}, headers=user_headers)
+    with Session(test_db) as db:
+        first_completed_at = db.get(Task, ids[0]).completed_at
+
+    with query_counter() as queries:
+        response = client.patch("/api/tasks/bulk", json={"ids": ids, "changes": {"status": "done"}}, headers=user_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"ids": ids}
+    updates = [statement for statement in queries.statements if statement.upper().startswith("UPDATE TASKS")]
+    assert len(updates) == 1
+    with Session(test_db) as db:
+        completed = {task.id: task.completed_at for task in db.query(Task).filter(Task.id.in_(ids))}
+    assert completed[ids[0]] == first_completed_at
+    assert all(completed.values())
+    assert {task["id"] for task in client.get("/api/tasks/?status=done", headers=user_headers).json()} == set(ids)
+
+def test_bulk_update_by_filter(client, user_headers, tasks):
+    client.patch("/api/tasks/bulk", json={"ids": [tasks[0]["id"]], "changes": {"status": "in_progress"}}, headers=user_headers)
+
+    response = client.patch(
+        "/api/tasks/bulk",
+        json={"filter": {"status": "todo"}, "changes": {"priority": "high"}},
+        headers=user_headers
+    )
+
+    assert response.json() == {"ids": [task["id"] for task in tasks[1:]]}
+    priorities = {task["id"]: task["priority"] for task in client.get("/api/tasks/", headers=user_headers).json()}
+    assert priorities[tasks[0]["id"]] == "low"
+
+def test_bulk_delete_only_touches_own_tasks(client, user_headers, register_user, tasks):
+    other_headers = register_user("otheruser")
+
+    foreign = client.request("DELETE", "/api/tasks/bulk", json={"ids": [tasks[0]["id"]]}, headers=other_headers)
+    own = client.request("DELETE", "/api/tasks/bulk", json={"ids": [tasks[0]["id"], tasks[1]["id"]]}, headers=user_headers)
+
+    assert foreign.json() == {"ids": []}
+    assert own.json() == {"ids": [tasks[0]["id"], tasks[1]["id"]]}
+    assert len(client.get("/api/tasks/", headers=user_headers).json()) == 2
+    # Set-based deletes still leave tombstones for delta sync
+    changes = client.get("/api/sync", headers=user_headers).json()["changes"]
+    assert {change["id"] for change in changes if change["action"] == "delete"} == {tasks[0]["id"], tasks[1]["id"]}
+
+def test_bulk_requests_are_validated(client, user_headers, tasks):
+    both = {"ids": [tasks[0]["id"]], "filter": {"status": "todo"}, "changes": {"priority": "high"}}
+    empty_filter = {"filter": {}, "changes": {"priority": "high"}}
+    no_changes = {"ids": [tasks[0]["id"]], "changes": {}}
+    foreign_project = {"ids": [tasks[0]["id"]], "changes": {"project_id": 9999}}
+
+    for body in (both, empty_filter, no_changes):
+        assert client.patch("/api/tasks/bulk", json=body, headers=user_headers).status_code == 400
+    assert client.patch("/api/tasks/bulk", json=foreign_project, headers=user_headers).status_code == 404
+    assert client.request("DELETE", "/api/tasks/bulk", json={"filter": {}}, headers=user_headers).status_code == 400
@@ -0,0 +1,174 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.task_graph import DependencyCycleError, TaskGraph
+
+STEP = timedelta(days=1)
+NOW = datetime(2026, 1, 1)
+
+def _graph(edges, done=(), due=None):
+    ids = sorted({id for edge in edges for id in edge})
+    due = due or {}
+    return TaskGraph.build([(id, id in done, due.get(id)) for id in ids], edges, STEP)
+
+def _state(graph):
+    return {id: (graph.depth[id], graph.height[id], graph.deadline[id]) for id in graph.order}
+
+def test_cycle_rejected_with_path():
+    # 3 depends on 2, 2 depends on 1
+    graph = _graph([(2, 1), (3, 2)])
+
+    with pytest.raises(DependencyCycleError) as error:
+        graph.add_dependency(1, 3)
+
+    assert error.value.cycle == [3, 2, 1, 3]
+    assert graph.preds[1] == set()
+    with pytest.raises(DependencyCycleError):
+        graph.add_dependency(1, 1)
+
+def test_topological_order_repaired_on_insert():
+    graph = _graph([(2, 1), (4, 3)])
+    graph.add_dependency(1, 4)
+
+    order = graph.topological_order()
+    for task_id, preds in graph.preds.items():
+        assert all(order.index(pred) < order.index(task_id) for pred in preds)
+
+def test_critical_path_float_and_slack():
+    # 1 -> 2 -> 3 and 1 -> 4, with 3 due in two days
+    graph = _graph([(2, 1), (3, 2), (4, 1)], due={3: NOW + 2 * STEP})
+
+    assert graph.critical_path() == [1, 2, 3]
+    schedule = {item["task_id"]: item for item in graph.schedule(NOW)}
+    assert schedule[4]["total_float"] == 1 and not schedule[4]["critical"]
+    assert schedule[3]["slack_hours"] == -24
+    assert schedule[1]["slack_hours"] == -24
+    assert schedule[4]["slack_hours"] is None
+    assert graph.ready() == [1]
+    assert graph.blocked() == [2, 3, 4]
+
+    graph.update_task(1, done=True, due=None)
+
+    assert graph.critical_path() == [2, 3]
+    assert graph.ready() == [2, 4]
+    assert {item["task_id"]: item["slack_hours"] for item in graph.schedule(NOW)}[3] == 0
+
+def test_incremental_changes_match_rebuild():
+    rng = random.Random(7)
+    ids = list(range(1, 61))
+    graph = TaskGraph.build([(id, False, None) for id in ids], [], STEP)
+    for _ in range(300):
+        task_id, depends_on_id = rng.sample(ids, 2)
+        action = rng.random()
+        if action < 0.6:
+            try:
+                graph.add_dependency(task_id, depends_on_id)
+            except DependencyCycleError:
+                pass
+        elif action < 0.8:
+            graph.remove_dependency(task_id, depends_on_id)
+        else:
+            due = NOW + rng.randint(0, 30) * STEP if rng.random() < 0.5 else None
+            graph.update_task(task_id, done=rng.random() < 0.3, due=due)
+
+        edges = [(id, pred) for id, preds in graph.preds.items() for pred in preds]
+        rebuilt = TaskGraph.build([(id, graph.done[id], graph.due[id]) for id in ids], edges, STEP)
+        assert _state(graph) == _state(rebuilt)
+
+def test_thousands_of_tasks():
+    rng = random.Random(1)
+    count = 5000
+    tasks = [(id, False, NOW + rng.randint(1, 365) * STEP) for id in range(count)]
+    edges = [(id, rng.randrange(id)) for id in range(1, count) for _ in range(2)]
+
+    started = time.perf_counter()
+    graph = TaskGraph.build(tasks, edges, STEP)
+    graph.schedule(NOW)
+    graph.critical_path()
+    graph.add_dependency(count - 1, 10)
+    graph.update_task(5, done=False, due=NOW)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1
+
+@pytest.fixture
+def project_tasks(client, user_headers):
+    project = client.post("/api/projects/", json={"title": "Launch", "description": "d"}, headers=user_headers).json()
+    tasks = [
+        client.post("/api/tasks/", json={"title": f"Step {i}", "project_id": project["id"]}, headers=user_headers).json()
+        for i in range(3)
+    ]
+    return project, [task["id"] for task in tasks]
+
+def test_dependency_endpoints_and_schedule(client, user_headers, project_tasks):
+    project, (first, second, third) = project_tasks
+
+    response = client.post(f"/api/tasks/{second}/dependencies", json={"depends_on_id": first}, headers=user_headers)
+    assert response.status_code == 200
+    assert [task["id"] for task in response.json()] == [first]
+    client.post(f"/api/tasks/{third}/dependencies", json={"depends_on_id": second}, headers=user_headers)
+
+    response = client.post(f"/api/tasks/{first}/dependencies", json={"depends_on_id": third}, headers=user_headers)
+    assert response.status_code == 400
+    assert "cycle" in response.json()["detail"]
+
+    ready = client.get(f"/api/projects/{project['id']}/tasks/ready", headers=user_headers).json()
+    blocked = client.get(f"/api/projects/{project['id']}/tasks/blocked", headers=user_headers).json()
+    assert [task["id"] for task in ready] == [first]
+    assert [task["id"] for task in blocked] == [second, third]
+
+    client.put(f"/api/tasks/{first}", json={"status": "done"}, headers=user_headers)
+    schedule = client.get(f"/api/projects/{project['id']}/schedule", headers=user_headers).json()
+    assert schedule["critical_path"] == [second, third]
+    assert {task["task_id"]: task["state"] for task in schedule["tasks"]} == {
+        first: "done", second: "ready", third: "blocked"
+    }
+
+    response = client.delete(f"/api/tasks/{third}/dependencies/{second}", headers=user_headers)
+    assert response.status_code == 200
+    ready = client.get(f"/api/projects/{project['id']}/tasks/ready", headers=user_headers).json()
+    assert [task["id"] for task in ready] == [second, third]
+
+def test_dependencies_stay_within_a_project(client, user_headers, register_user, project_tasks):
+    _, (first, _, _) = project_tasks
+    other = client.post("/api/projects/", json={"title": "Other", "description": "d"}, headers=user_headers).json()
+    task = client.post("/api/tasks/", json={"title": "Elsewhere", "project_id": other["id"]}, headers=user_headers).json()
+
+    response = client.post(f"/api/tasks/{task['id']}/dependencies", json={"depends_on_id": first}, headers=user_headers)
+
+    assert response.status_code == 400
+    assert client.get(f"/api/projects/{other['id']}/schedule", headers=register_user("stranger")).status_code == 404
+
+def test_cached_graph_follows_writes_without_reloading(client, user_headers, project_tasks, monkeypatch):
+    project, (first, second, third) = project_tasks
+    loads = []
+    load = TaskGraph.load
+    monkeypatch.setattr(TaskGraph, "load", lambda db, project_id: loads.append(project_id) or load(db, project_id))
+    other = client.post("/api/projects/", json={"title": "Other", "description": "d"}, headers=user_headers).json()
+
+    def ready():
+        response = client.get(f"/api/projects/{project['id']}/tasks/ready", headers=user_headers)
+        return [task["id"] for task in response.json()]
+
+    assert ready() == [first, second, third]
+    client.post(f"/api/tasks/{second}/dependencies", json={"depends_on_id": first}, headers=user_headers)
+    client.post(f"/api/tasks/{third}/dependencies", json={"depends_on_id": second}, headers=user_headers)
+    # Writes elsewhere don't touch the graph
+    client.post("/api/tasks/", json={"title": "Elsewhere", "project_id": other["id"]}, headers=user_headers)
+    journal = client.post("/api/journals", json={"title": "Diary"}, headers=user_headers).json()
+    client.post(f"/api/journals/{journal['id']}/entries", json={"content": "note"}, headers=user_headers)
+    assert ready() == [first]
+
+    client.put(f"/api/tasks/{first}", json={"status": "done"}, headers=user_headers)
+    assert ready() == [second]
+    fourth = client.post("/api/tasks/", json={"title": "Step 3", "project_id": project["id"]}, headers=user_headers).json()
+    client.put(f"/api/tasks/{third}", json={"project_id": other["id"]}, headers=user_headers)
+    client.delete(f"/api/tasks/{second}", headers=user_headers)
+    assert ready() == [fourth["id"]]
+
+    schedule = client.get(f"/api/projects/{project['id']}/schedule", headers=user_headers).json()
+    assert {task["task_id"]: task["state"] for task in schedule["tasks"]} == {first: "done", fourth["id"]: "ready"}
+    assert loads == [project["id"]]
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from models import Activity, JournalEntry, Log, Project, Task, User
+
+@pytest.fixture
+def items(test_db, user_headers):
+    """Rows of every type, several sharing a timestamp, in expected feed order."""
+    base = datetime(2026, 10, 1, 12, 0, 0)
+    with Session(test_db) as db:
+        user = db.query(User).filter(User.username == "testuser").one()
+        project = Project(title="Project", owner_id=user.id)
+        db.add(project)
+        db.flush()
+        log = Log(title="log", content="x", user_id=user.id, created_at=base + timedelta(hours=1))
+        # Same timestamp: ordered by type (journal, log, activity, task), then id
+        entry = JournalEntry(content="dear diary", user_id=user.id, created_at=base)
+        activity = Activity(type="music", data={}, user_id=user.id, project_id=project.id, timestamp=base)
+        task_a = Task(title="task a", user_id=user.id, project_id=project.id, created_at=base)
+        task_b = Task(title="task b", user_id=user.id, project_id=project.id, created_at=base)
+        task_c = Task(title="task c", user_id=user.id, project_id=project.id, created_at=base - timedelta(days=1))
+        earlier = JournalEntry(content="earlier", user_id=user.id, created_at=base - timedelta(days=2))
+        db.add_all([log, entry, activity, task_a, task_b, task_c, earlier])
+        db.commit()
+        return [
+            ("log", log.id), ("journal_entry", entry.id), ("activity", activity.id),
+            ("task", task_b.id), ("task", task_a.id), ("task", task_c.id), ("journal_entry", earlier.id)
+        ]
+
+def _walk(client, headers, params):
+    seen, cursor = [], None
+    while True:
+        page = client.get("/api/timeline", params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        assert page.status_code == 200
+        seen += [(item["type"], item["id"]) for item in page.json()]
+        cursor = page.headers.get("X-Next-Cursor")
+        if not cursor:
+            return seen
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 100])
+def test_timeline_merges_sources_across_pages(client, user_headers, items, limit):
+    assert _walk(client, user_headers, {"limit": limit}) == items
+
+def test_timeline_filters_by_type_and_range(client, user_headers, items):
+    tasks = _walk(client, user_headers, {"types": "task", "limit": 1})
+    assert tasks == [item for item in items if item[0] == "task"]
+
+    day = _walk(client, user_headers, {"from": "2026-10-01T00:00:00", "to": "2026-10-01T23:59:59"})
+    assert len(day) == 5
+
+def test_timeline_rejects_unknown_types_and_cursors(client, user_headers):
+    assert client.get("/api/timeline?types=task,email", headers=user_headers).status_code == 400
+    assert client.get("/api/timeline?cursor=garbage", headers=user_headers).status_code == 400
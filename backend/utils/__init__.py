@@ -0,0 +1,16 @@
+from .query_counter import QueryCounter, QueryBudgetExceeded
+from .projection import schema_columns, SparseFields, select_fields, sparse_response
+from .pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor, keyset_page
+
+__all__ = [
+    'QueryCounter',
+    'QueryBudgetExceeded',
+    'schema_columns',
+    'SparseFields',
+    'select_fields',
+    'sparse_response',
+    'NEXT_CURSOR_HEADER',
+    'encode_cursor',
+    'decode_cursor',
+    'keyset_page',
+]
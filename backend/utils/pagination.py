@@ -0,0 +1,84 @@
+"""Keyset (cursor) pagination.
+
+OFFSET pagination re-reads every skipped row and shifts when rows are
+inserted ahead of the page. A keyset page instead continues strictly after
+the last row the client saw, ordered newest first by ``(timestamp, id)``,
+so each page is a range scan over a matching index. The position travels
+as an opaque ``cursor`` string::
+
+    rows, next_cursor = keyset_page(query, JournalEntry.created_at, JournalEntry.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, func, or_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(timestamp: datetime, *keys) -> str:
+    """Pack a position (a timestamp, then its tie-breaking keys) into a URL-safe string."""
+    payload = json.dumps([timestamp.isoformat(), *keys], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_types: Sequence[type] = (int,)) -> Tuple:
+    """
+    Unpack a cursor made by ``encode_cursor`` into ``(timestamp, *keys)``,
+    converting the keys with ``key_types``; malformed cursors are a 400.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(key_types) + 1:
+            raise ValueError(cursor)
+        return (datetime.fromisoformat(values[0]), *(cast(value) for cast, value in zip(key_types, values[1:])))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def sort_key(column, dialect_name: str):
+    """
+    Expression to order and compare a timestamp column by.
+
+    SQLite stores timestamps as text, and ``CURRENT_TIMESTAMP`` defaults
+    omit the fractional seconds that bound parameters carry, so equal
+    instants would not compare equal; normalizing both sides keeps the
+    ordering and the keyset filter consistent there.
+    """
+    if dialect_name == "sqlite":
+        return func.strftime("%Y-%m-%d %H:%M:%f", column)
+    return column
+
+
+def keyset_after(timestamp_key, id_column, dialect_name: str, cursor: str):
+    """Filter clause selecting the rows that sort after ``cursor`` (newest first)."""
+    timestamp, last_id = decode_cursor(cursor)
+    boundary = sort_key(timestamp, dialect_name)
+    return or_(timestamp_key < boundary, and_(timestamp_key == boundary, id_column < last_id))
+
+
+def keyset_page(query, timestamp_column, id_column, cursor: Optional[str], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    Return one page of ``query`` newest first, plus the cursor for the next
+    page (None on the last page).
+
+    Rows may be entities or column rows, as long as they expose the
+    timestamp and id columns by name.
+    """
+    dialect_name = query.session.get_bind().dialect.name
+    timestamp_key = sort_key(timestamp_column, dialect_name)
+    if cursor:
+        query = query.filter(keyset_after(timestamp_key, id_column, dialect_name, cursor))
+    # One extra row tells us whether another page exists
+    rows = query.order_by(timestamp_key.desc(), id_column.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, timestamp_column.key), getattr(last, id_column.key))
@@ -0,0 +1,108 @@
+"""Column projections for list endpoints.
+
+Querying whole entities for a listing drags in every eagerly loaded
+relationship (``Activity.user`` and ``Activity.project`` are joined, as is
+``Project.owner``) and hydrates identity-mapped objects the response never
+returns. Selecting only the columns a response schema declares keeps the SQL
+narrow, and pydantic reads the resulting rows through ``from_attributes``::
+
+    query = db.query(*schema_columns(Activity, ActivitySchema))
+
+Listings also accept a ``fields=`` query parameter (sparse fieldsets) that
+narrows both the projection and the serialized payload::
+
+    fields: Optional[List[str]] = Depends(SparseFields(TaskResponse))
+    query = select_fields(db.query(Task).filter(...), Task, TaskResponse, fields)
+    return sparse_response(query.all(), TaskResponse, fields)
+"""
+from typing import Any, List, Optional, Sequence, Type
+
+from fastapi import HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+
+def schema_columns(model, schema: Type[BaseModel], fields: Optional[Sequence[str]] = None) -> List:
+    """
+    Return the mapped columns of ``model`` that ``schema`` serializes, in
+    schema field order, optionally limited to ``fields``.
+
+    Schema fields without a column of the same name (relationships,
+    computed values) are left out, so only schemas made of plain columns
+    should be served from a projection.
+    """
+    mapped = inspect(model).columns.keys()
+    return [
+        getattr(model, name) for name in schema.model_fields
+        if name in mapped and (fields is None or name in fields)
+    ]
+
+
+class SparseFields:
+    """
+    Dependency parsing ``?fields=a,b`` against a response schema.
+
+    Resolves to None when the parameter is absent, otherwise to the requested
+    field names in schema order; ``id`` is always kept so clients can match
+    rows up. Unknown names are rejected with a 400.
+    """
+
+    def __init__(self, schema: Type[BaseModel]):
+        self.schema = schema
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(None, description="Comma-separated response fields to return")
+    ) -> Optional[List[str]]:
+        if not fields:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - set(self.schema.model_fields)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}. "
+                       f"Available: {', '.join(self.schema.model_fields)}"
+            )
+        if "id" in self.schema.model_fields:
+            requested.add("id")
+        return [name for name in self.schema.model_fields if name in requested]
+
+
+def _projectable(model, fields: Sequence[str]) -> bool:
+    mapped = inspect(model).columns.keys()
+    return all(name in mapped for name in fields)
+
+
+def select_fields(query, model, schema: Type[BaseModel], fields: Optional[Sequence[str]]):
+    """
+    Narrow an entity query to the requested columns.
+
+    The query is returned unchanged without ``fields`` or when a requested
+    field is not a column (e.g. ``tags`` on ideas); ``sparse_response`` then
+    trims the serialized objects instead.
+    """
+    if fields is None or not _projectable(model, fields):
+        return query
+    return query.with_entities(*schema_columns(model, schema, fields))
+
+
+def sparse_response(results: List[Any], schema: Type[BaseModel], fields: Optional[Sequence[str]]):
+    """
+    Serialize a listing limited to ``fields``.
+
+    Without ``fields`` the results are returned as-is for the endpoint's
+    response model. Otherwise a JSONResponse is built directly, since the
+    partial rows would not pass validation against the full schema.
+    """
+    if fields is None:
+        return results
+    include = set(fields)
+    content = [
+        row._asdict() if hasattr(row, "_asdict")
+        else schema.model_validate(row).model_dump(include=include)
+        for row in results
+    ]
+    return JSONResponse(jsonable_encoder(content))
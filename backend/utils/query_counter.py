@@ -0,0 +1,66 @@
+"""Count the SQL statements an engine executes inside a block.
+
+Used by the test suite to pin per-endpoint query budgets and to catch N+1
+patterns, where the same statement runs once per row of an earlier result::
+
+    with QueryCounter(engine) as queries:
+        client.get("/api/projects/")
+    queries.assert_max(2)
+    queries.assert_no_repeats()
+"""
+import re
+from collections import Counter
+from typing import Dict, List
+
+from sqlalchemy import event
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: List[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(_WHITESPACE.sub(" ", statement).strip())
+
+    def __enter__(self) -> "QueryCounter":
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, threshold: int = 2) -> Dict[str, int]:
+        """
+        Return statements executed at least ``threshold`` times.
+
+        Parameters are not part of the statement text, so a lazy load issued
+        once per parent row shows up here as a single repeated statement.
+        """
+        return {sql: n for sql, n in Counter(self.statements).items() if n >= threshold}
+
+    def _report(self) -> str:
+        return "\n".join(f"  {i + 1}. {sql}" for i, sql in enumerate(self.statements))
+
+    def assert_max(self, budget: int) -> None:
+        if self.count > budget:
+            raise QueryBudgetExceeded(
+                f"Expected at most {budget} queries, got {self.count}:\n{self._report()}"
+            )
+
+    def assert_no_repeats(self, threshold: int = 2) -> None:
+        repeated = self.repeated(threshold)
+        if repeated:
+            details = "\n".join(f"  {n}x {sql}" for sql, n in repeated.items())
+            raise QueryBudgetExceeded(f"Possible N+1, repeated statements:\n{details}")